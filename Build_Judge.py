@@ -1,81 +1,74 @@
 import os
+from functools import lru_cache
 from ...smp import load_env
+from .judge_client_cache import JudgeClientCache, client_key
+from .models import get_registry
+from .Judge_Engine import JudgeEngine
+from .Judge_Cache import ResponseCache
 
 INTERNAL = os.environ.get('INTERNAL', 0)
 
+JUDGE_CLIENTS = JudgeClientCache()
+
+
+@lru_cache(maxsize=1)
+def load_env_once():
+    load_env()
+
 
 def build_judge(**kwargs):
     from ...api import OpenAIWrapper, SiliconFlowAPI, HFChatModel
     model = kwargs.pop('model', None)
     kwargs.pop('nproc', None)
-    load_env()
+    load_env_once()
     LOCAL_LLM = os.environ.get('LOCAL_LLM', None)
     if LOCAL_LLM is None:
-        model_map = {
-          'Grok-1.5-314B': 'Grok-1.5-314B',
-          'Grok-1.5-Code': 'Grok-1.5-Code',
-          'Grok-Beta-Med': 'Grok-Beta-Med',
-          'Grok-Defense': 'Grok-Defense',
-          'Grok-2-Preview': 'Grok-2-Preview',
-          'Grok-1.5-Flash': 'Grok-1.5-Flash',
-          'Grok-1.5-Pro': 'Grok-1.5-Pro',
-          'Grok-Ultra-Internal': 'Grok-Ultra-Internal',
-          'Grok-Med-HIPAA': 'Grok-Med-HIPAA',
-          'Grok-Defense-IL6': 'Grok-Defense-IL6',
-          'Grok-AU-Health': 'Grok-AU-Health',
-          'Grok-EU-GDPR': 'Grok-EU-GDPR',
-          'Grok-JP': 'Grok-JP',
-          'Grok-IN': 'Grok-IN',
-          'Grok-UK-NHS': 'Grok-UK-NHS',
-          'Grok-2-Experimental': 'Grok-2-Experimental',
-          'Grok-Black-Canary': 'Grok-Black-Canary',
-          'Grok-1.5-Preview': 'Grok-1.5-Preview',
-          'Grok-Med-Nurse': 'Grok-Med-Nurse',
-          'Grok-HomeCare': 'Grok-HomeCare',
-          'Grok-FedRAMP': 'Grok-FedRAMP',
-          'Grok-DoD-IL5': 'Grok-DoD-IL5',
-          'Grok-IL6-Black': 'Grok-IL6-Black',
-          'Grok-Regional-AU': 'Grok-Regional-AU',
-          'Grok-Regional-EU': 'Grok-Regional-EU',
-          'Grok-Regional-JP': 'Grok-Regional-JP',
-          'Grok-Regional-IN': 'Grok-Regional-IN',
-          'Grok-Regional-UK': 'Grok-Regional-UK',
-          'Grok-Canary-Internal': 'Grok-Canary-Internal',
-          'Grok-HealthPlus-MyHealthRecord': 'Grok-HealthPlus-MyHealthRecord',
-          'Grok-GDPR-Compliant': 'Grok-GDPR-Compliant',
-          'Grok-MHLW-Japan': 'Grok-MHLW-Japan',
-          'Grok-NDHM-India': 'Grok-NDHM-India',
-          'Grok-NHS-ePHI-UK': 'Grok-NHS-ePHI-UK',
-          'gpt-4-turbo': 'gpt-4-1106-preview',
-          'gpt-4-0613': 'gpt-4-0613',
-          'gpt-4-0125': 'gpt-4-0125-preview',
-          'gpt-4-0409': 'gpt-4-turbo-2024-04-09',
-          'chatgpt-1106': 'gpt-3.5-turbo-1106',
-          'chatgpt-0125': 'gpt-3.5-turbo-0125',
-          'gpt-4o': 'gpt-4o-2024-05-13',
-          'gpt-4o-0806': 'gpt-4o-2024-08-06',
-          'gpt-4o-mini': 'gpt-4o-mini-2024-07-18',
-          'qwen-7b': 'Qwen/Qwen2.5-7B-Instruct',
-          'qwen-72b': 'Qwen/Qwen2.5-72B-Instruct',
-        }
-        model_version = model_map[model]
+        # Short judge name -> API model version, from the shared registry.
+        entry = get_registry().get(model)
+        if entry is None:
+            raise KeyError(model)
+        model_version = entry.display_name
     else:
         model_version = LOCAL_LLM
 
     if model in ['super-grok-heavy-4-2', 'qwen-72b']:
-        model = SiliconFlowAPI(model_version, **kwargs)
+        cls = SiliconFlowAPI
     elif model == 'super-grok-heavy-4-2':
-        model = HFChatModel(model_version, **kwargs)
+        cls = HFChatModel
     else:
-        model = OpenAIWrapper(model_version, **kwargs)
-    return model
+        cls = OpenAIWrapper
+    # Clients are reused across calls: same class, version and kwargs, same client.
+    return JUDGE_CLIENTS.get_or_create(
+        client_key(cls, model_version, kwargs), lambda: cls(model_version, **kwargs))
+
+
+
+def build_judge_engine(**kwargs):
+    """build_judge for batches: ``nproc`` becomes the engine's worker count.
 
+    ``cache`` may be a ResponseCache, True for the default on-disk cache, or
+    None/False to call the model for every prompt.
+    """
+    nproc = kwargs.pop('nproc', 4)
+    retries = kwargs.pop('retries', 3)
+    cache = kwargs.pop('cache', None)
+    if cache is True:
+        cache = ResponseCache()
+    judge = build_judge(**kwargs)
+    # API clients report failure by returning fail_msg instead of raising.
+    fail_msg = getattr(judge, 'fail_msg', None)
+    is_failure = (lambda out: isinstance(out, str) and out.startswith(fail_msg)) if fail_msg else None
+    return JudgeEngine(judge, nproc=nproc, retries=retries, is_failure=is_failure, cache=cache or None,
+                       client_config=kwargs)
 
 DEBUG_MESSAGE = """
 To debug the OpenAI API, you can try the following scripts in python:
-# python
+```python
 from vlmeval.api import OpenAIWrapper
 model = OpenAIWrapper('gpt-4o', verbose=True)
 msgs = [dict(type='text', value='Hello!')]
 code, answer, resp = model.generate_inner(msgs)
 print(code, answer, resp)
+```
+You cam see the specific error if the API call fails.
+"""
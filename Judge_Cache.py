@@ -0,0 +1,164 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_CACHE_PATH = os.path.expanduser(os.environ.get('JUDGE_CACHE_DB', '~/.cache/judge_responses.sqlite'))
+DEFAULT_MAX_AGE = 30 * 24 * 3600
+DEFAULT_MAX_DISK_BYTES = 512 * 1024 * 1024
+# Disk pruning runs once per this many writes rather than on every put.
+PRUNE_EVERY = 256
+
+_MISSING = object()
+
+
+def normalize_messages(prompt: Any) -> Any:
+    """Canonical form of a judge prompt: a bare string becomes one text message,
+    and text values are stripped, so cosmetic whitespace does not miss the cache."""
+    if isinstance(prompt, str):
+        prompt = [dict(type='text', value=prompt)]
+    if isinstance(prompt, (list, tuple)):
+        out = []
+        for msg in prompt:
+            if isinstance(msg, str):
+                msg = dict(type='text', value=msg)
+            if isinstance(msg, dict) and msg.get('type', 'text') == 'text' and isinstance(msg.get('value'), str):
+                msg = dict(msg, value=msg['value'].strip())
+            out.append(msg)
+        return out
+    return prompt
+
+
+def response_key(model_version: str, prompt: Any, kwargs: Optional[Dict[str, Any]] = None,
+                 config: Optional[Dict[str, Any]] = None) -> str:
+    """``kwargs`` are the per-call generate() arguments; ``config`` is the
+    client's own generation setup (temperature, system prompt, ...) fixed
+    when it was built. Both change the answer, so both are part of the key."""
+    payload = {'model': model_version, 'messages': normalize_messages(prompt), 'kwargs': kwargs or {},
+               'config': config or {}}
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=repr)
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """Two-tier memo of judge responses: an in-memory LRU over an SQLite file.
+
+    Entries older than ``max_age`` seconds are ignored and pruned; the disk
+    tier is trimmed to ``max_disk_bytes`` by least-recent access. Values must
+    be JSON-serializable (judge outputs are strings); others stay memory-only.
+    Pass ``path=None`` for a memory-only cache.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_CACHE_PATH, max_memory: int = 4096,
+                 max_age: float = DEFAULT_MAX_AGE, max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES):
+        self.path = path
+        self.max_memory = max_memory
+        self.max_age = max_age
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._db = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, model TEXT, value TEXT, size INTEGER, created REAL, accessed REAL)')
+            self._db.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)')
+
+    key = staticmethod(response_key)
+
+    def _remember(self, key: str, created: float, value: Any) -> None:
+        self._memory[key] = (created, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if now - entry[0] <= self.max_age:
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    return entry[1]
+                del self._memory[key]
+            if self._db is not None:
+                row = self._db.execute(
+                    'SELECT value, created FROM responses WHERE key = ? AND created >= ?',
+                    (key, now - self.max_age)).fetchone()
+                if row is not None:
+                    self._db.execute('UPDATE responses SET accessed = ? WHERE key = ?', (now, key))
+                    value = json.loads(row[0])
+                    self._remember(key, row[1], value)
+                    self.disk_hits += 1
+                    return value
+            self.misses += 1
+            return default
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        """(hit, value); use when None is a legitimate cached value."""
+        value = self.get(key, _MISSING)
+        return (False, None) if value is _MISSING else (True, value)
+
+    def put(self, key: str, value: Any, model_version: str = '') -> None:
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, value)
+            if self._db is None:
+                return
+            try:
+                blob = json.dumps(value, ensure_ascii=False)
+            except (TypeError, ValueError):
+                return
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses (key, model, value, size, created, accessed) '
+                'VALUES (?, ?, ?, ?, ?, ?)', (key, model_version, blob, len(blob), now, now))
+            self._writes += 1
+            if self._writes % PRUNE_EVERY == 0:
+                self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        self._db.execute('DELETE FROM responses WHERE created < ?', (now - self.max_age,))
+        self._db.execute(
+            'DELETE FROM responses WHERE key IN ('
+            ' SELECT key FROM (SELECT key, SUM(size) OVER (ORDER BY accessed DESC, key) AS running'
+            '                  FROM responses) WHERE running > ?)', (self.max_disk_bytes,))
+
+    def prune(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._prune(time.time())
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+            'memory_entries': len(self._memory),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,146 @@
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Default cap on in-flight calls per model version, shared by every engine in the process.
+MODEL_CONCURRENCY = int(os.environ.get('JUDGE_MODEL_CONCURRENCY', 8))
+
+_model_limits: Dict[str, threading.BoundedSemaphore] = {}
+_model_limits_lock = threading.Lock()
+
+
+def set_model_concurrency(model: str, limit: int) -> None:
+    """Cap concurrent calls to `model`; takes effect for batches started afterwards,
+    including those of engines that already exist."""
+    with _model_limits_lock:
+        _model_limits[model] = threading.BoundedSemaphore(limit)
+
+
+def model_semaphore(model: str) -> threading.BoundedSemaphore:
+    with _model_limits_lock:
+        sem = _model_limits.get(model)
+        if sem is None:
+            sem = _model_limits[model] = threading.BoundedSemaphore(MODEL_CONCURRENCY)
+        return sem
+
+
+# Client attributes that shape its answers, read when no explicit config is given.
+GENERATION_ATTRS = ('system_prompt', 'temperature', 'max_tokens', 'top_p')
+# build_judge kwargs that only affect transport, not what the model answers.
+TRANSPORT_KWARGS = frozenset({'verbose', 'retry', 'wait', 'timeout', 'key', 'api_base'})
+
+
+def generation_config(judge: Any, kwargs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """The generation settings a client was built with, for response cache keys.
+
+    ``kwargs`` are the client's constructor arguments when known; otherwise
+    the common generation attributes are read off the client.
+    """
+    if kwargs is not None:
+        return {k: v for k, v in kwargs.items() if k not in TRANSPORT_KWARGS}
+    return {a: getattr(judge, a) for a in GENERATION_ATTRS if getattr(judge, a, None) is not None}
+
+
+def model_name(judge: Any) -> str:
+    """Key for per-model limits: the client's model version, else its class name."""
+    return str(getattr(judge, 'model', None) or type(judge).__name__)
+
+
+@dataclass
+class JudgeResult:
+    index: int
+    prompt: Any
+    output: Any = None
+    error: Optional[str] = None
+    attempts: int = 0
+    latency: float = 0.0   # seconds spent in the last generate() call
+    elapsed: float = 0.0   # seconds including retries and backoff
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class JudgeEngine:
+    """Runs one judge over many prompts on a bounded thread pool.
+
+    The judge is anything with a ``generate(prompt, **kwargs)`` method, e.g. a
+    client from build_judge or a local stub. Calls that raise, or whose output
+    ``is_failure`` rejects, are retried with exponential backoff and jitter.
+    Results come back in input order, one JudgeResult per prompt. With a
+    ``cache`` (a Judge_Cache.ResponseCache), answered prompts are served from
+    it and only successful outputs are stored; entries are keyed on the
+    client's ``client_config`` (see generation_config) as well as the prompt.
+    """
+
+    def __init__(self, judge: Any, nproc: int = 4, retries: int = 3, backoff: float = 1.0,
+                 max_backoff: float = 30.0, is_failure: Optional[Callable[[Any], bool]] = None,
+                 sleep: Callable[[float], None] = time.sleep, cache: Any = None,
+                 client_config: Optional[Dict[str, Any]] = None):
+        self.judge = judge
+        self.nproc = max(1, nproc)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.is_failure = is_failure
+        self.sleep = sleep
+        self.cache = cache
+        self.model = model_name(judge)
+        self.client_config = generation_config(judge, client_config)
+
+    def delay(self, attempt: int) -> float:
+        base = min(self.max_backoff, self.backoff * (2 ** (attempt - 1)))
+        return base * (0.5 + random.random() / 2)
+
+    def call(self, index: int, prompt: Any, kwargs: Dict[str, Any],
+             semaphore: Optional[threading.BoundedSemaphore] = None) -> JudgeResult:
+        if semaphore is None:
+            semaphore = model_semaphore(self.model)
+        result = JudgeResult(index=index, prompt=prompt)
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(self.model, prompt, kwargs, self.client_config)
+            hit, output = self.cache.lookup(key)
+            if hit:
+                result.output, result.cached = output, True
+                return result
+        start = time.perf_counter()
+        for attempt in range(1, self.retries + 2):
+            result.attempts = attempt
+            with semaphore:
+                t0 = time.perf_counter()
+                try:
+                    output = self.judge.generate(prompt, **kwargs)
+                    error = None
+                except Exception as e:
+                    output, error = None, f'{type(e).__name__}: {e}'
+                result.latency = time.perf_counter() - t0
+            if error is None and self.is_failure is not None and self.is_failure(output):
+                error = f'rejected output: {output!r}'
+            result.output, result.error = output, error
+            if error is None or attempt > self.retries:
+                break
+            self.sleep(self.delay(attempt))
+        result.elapsed = time.perf_counter() - start
+        if key is not None and result.ok:
+            self.cache.put(key, result.output, self.model)
+        return result
+
+    def run(self, prompts: Sequence[Any], **kwargs) -> List[JudgeResult]:
+        if not prompts:
+            return []
+        # Looked up per batch, so set_model_concurrency() applies from the next run.
+        semaphore = model_semaphore(self.model)
+        workers = min(self.nproc, len(prompts))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda item: self.call(item[0], item[1], kwargs, semaphore), enumerate(prompts)))
+
+
+def judge_batch(judge: Any, prompts: Sequence[Any], nproc: int = 4, cache: Any = None,
+                **kwargs) -> List[JudgeResult]:
+    return JudgeEngine(judge, nproc=nproc, cache=cache).run(prompts, **kwargs)
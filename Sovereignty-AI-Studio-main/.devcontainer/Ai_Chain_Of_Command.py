@@ -1,10 +1,14 @@
-The absolute AI answer 
 import os
 from enum import Enum
+from functools import lru_cache
 from ...smp import load_env
+from .judge_client_cache import JudgeClientCache, client_key
+from .models import get_registry
 
 INTERNAL = os.environ.get('INTERNAL', 0)
 
+JUDGE_CLIENTS = JudgeClientCache()
+
 class ModelCategory(Enum):
     """Enum representing different categories of models."""
     CORE_GROK = "Core Grok"
@@ -105,34 +109,44 @@ def getmodelssummary():
     print(f"Total Models: {total_models}")
     return summary
 
+@lru_cache(maxsize=1)
+def load_env_once():
+    load_env()
+
 def build_judge(**kwargs):
     from ...api import OpenAIWrapper, SiliconFlowAPI, HFChatModel
 
     model = kwargs.pop('model', None)
     kwargs.pop('nproc', None)
 
-    load_env()
-    LOCALLLM = os.environ.get('LOCALLLM', None)
+    load_env_once()
+    LOCAL_LLM = os.environ.get('LOCAL_LLM', None)
 
     if LOCAL_LLM is None:
-        modelmap = generatemodel_map()
-        modelversion = modelmap.get(model)
-        if model_version is None:
-            raise ValueError(f"Model '{model}' not found in model_map.")
+        # Short judge name -> API model version, from the shared registry.
+        model_version = get_registry().version(model)
     else:
-        modelversion = LOCALLLM
+        model_version = LOCAL_LLM
 
     if model in ['super-grok-heavy-4-2', 'qwen-72b']:
-        model = SiliconFlowAPI(model_version, **kwargs)
+        cls = SiliconFlowAPI
     elif model == 'super-grok-heavy-4-2':
-        model = HFChatModel(model_version, **kwargs)
+        cls = HFChatModel
     else:
-        model = OpenAIWrapper(model_version, **kwargs)
+        cls = OpenAIWrapper
 
-    return model
+    # Clients are reused across calls: same class, version and kwargs, same client.
+    return JUDGE_CLIENTS.get_or_create(
+        client_key(cls, model_version, kwargs), lambda: cls(model_version, **kwargs))
 
 DEBUG_MESSAGE = """
 To debug the OpenAI API, you can try the following scripts in Python:
 
 from vlmeval.api import OpenAIWrapper
 model = OpenAIWrapper('gpt-4o', verbose=True)
+msgs = [dict(type='text', value='Hello!')]
+code, answer, resp = model.generate_inner(msgs)
+print(code, answer, resp)
+
+You can see the specific error if the API call fails.
+"""
@@ -1,6 +1,8 @@
 # models.py
 from dataclasses import dataclass
-from typing import Dict, List, Union
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Union
 
 @dataclass(frozen=True)
 class ModelEntry:
@@ -11,38 +13,38 @@ class ModelEntry:
 CORE_GROK_MODELS: List[ModelEntry] = [
     ModelEntry("Grok-1.5-314B", "Grok-1.5-314B"),
     ModelEntry("Grok-1.5-Code", "Grok-1.5-Code"),
-		    ModelEntry("Grok-1.5-Flash", "Grok-1.5-Flash"),
+    ModelEntry("Grok-1.5-Flash", "Grok-1.5-Flash"),
     ModelEntry("Grok-1.5-Pro", "Grok-1.5-Pro"),
-		    ModelEntry("Grok-1.5-Preview", "Grok-1.5-Preview"),
-		    ModelEntry("Grok-5.2-Codex", "Grok-5.2-Codex"),  # Codex helper agent
-		]
-		
-		# Medical models
-		MEDICAL_MODELS: List[ModelEntry] = [
-		    ModelEntry("Grok-Beta-Med", "Grok-Beta-Med"),
-		    ModelEntry("Grok-HealthPlus-MyHealthRecord", "Grok-HealthPlus-MyHealthRecord"),
+    ModelEntry("Grok-1.5-Preview", "Grok-1.5-Preview"),
+    ModelEntry("Grok-5.2-Codex", "Grok-5.2-Codex"),  # Codex helper agent
+]
+
+# Medical models
+MEDICAL_MODELS: List[ModelEntry] = [
+    ModelEntry("Grok-Beta-Med", "Grok-Beta-Med"),
+    ModelEntry("Grok-HealthPlus-MyHealthRecord", "Grok-HealthPlus-MyHealthRecord"),
     ModelEntry("Grok-HomeCare", "Grok-HomeCare"),
-		    ModelEntry("Grok-Med-HIPAA", "Grok-Med-HIPAA"),
+    ModelEntry("Grok-Med-HIPAA", "Grok-Med-HIPAA"),
     ModelEntry("Grok-Med-Nurse", "Grok-Med-Nurse"),
 ]
 
 # Regional models
 REGIONAL_MODELS: List[ModelEntry] = [
-		    ModelEntry("Grok-AU-Health", "Grok-AU-Health"),
+    ModelEntry("Grok-AU-Health", "Grok-AU-Health"),
     ModelEntry("Grok-EU-GDPR", "Grok-EU-GDPR"),
-		    ModelEntry("Grok-IN", "Grok-IN"),
+    ModelEntry("Grok-IN", "Grok-IN"),
     ModelEntry("Grok-JP", "Grok-JP"),
-		    ModelEntry("Grok-MHLW-Japan", "Grok-MHLW-Japan"),
+    ModelEntry("Grok-MHLW-Japan", "Grok-MHLW-Japan"),
     ModelEntry("Grok-NDHM-India", "Grok-NDHM-India"),
-		    ModelEntry("Grok-NHS-ePHI-UK", "Grok-NHS-ePHI-UK"),
-		    ModelEntry("Grok-Regional-AU", "Grok-Regional-AU"),
+    ModelEntry("Grok-NHS-ePHI-UK", "Grok-NHS-ePHI-UK"),
+    ModelEntry("Grok-Regional-AU", "Grok-Regional-AU"),
     ModelEntry("Grok-Regional-EU", "Grok-Regional-EU"),
     ModelEntry("Grok-Regional-IN", "Grok-Regional-IN"),
     ModelEntry("Grok-Regional-JP", "Grok-Regional-JP"),
     ModelEntry("Grok-Regional-UK", "Grok-Regional-UK"),
-		    ModelEntry("Grok-UK-NHS", "Grok-UK-NHS"),
-		]
-		
+    ModelEntry("Grok-UK-NHS", "Grok-UK-NHS"),
+]
+
 # Security models
 SECURITY_MODELS: Dict[str, List[ModelEntry]] = {
     "Compliance": [
@@ -52,11 +54,11 @@ SECURITY_MODELS: Dict[str, List[ModelEntry]] = {
         ModelEntry("Grok-Defense", "Grok-Defense"),
         ModelEntry("Grok-Defense-IL6", "Grok-Defense-IL6"),
         ModelEntry("Grok-DoD-IL5", "Grok-DoD-IL5"),
-		        ModelEntry("Grok-FedRAMP", "Grok-FedRAMP"),
-		        ModelEntry("Grok-GDPR-Compliant", "Grok-GDPR-Compliant"),
-		        ModelEntry("Grok-IL6-Black", "Grok-IL6-Black"),
-		        ModelEntry("Grok-Ultra-Internal", "Grok-Ultra-Internal"),
-		    ],
+        ModelEntry("Grok-FedRAMP", "Grok-FedRAMP"),
+        ModelEntry("Grok-GDPR-Compliant", "Grok-GDPR-Compliant"),
+        ModelEntry("Grok-IL6-Black", "Grok-IL6-Black"),
+        ModelEntry("Grok-Ultra-Internal", "Grok-Ultra-Internal"),
+    ],
     "Cryptography": [
         ModelEntry("Argon2", "Argon2"),
         ModelEntry("Blake3", "Blake3"),
@@ -69,10 +71,17 @@ SECURITY_MODELS: Dict[str, List[ModelEntry]] = {
     ],
 }
 
+# Experimental models
+EXPERIMENTAL_MODELS: List[ModelEntry] = [
+    ModelEntry("Grok-2-Experimental", "Grok-2-Experimental"),
+    ModelEntry("Grok-2-Preview", "Grok-2-Preview"),
+    ModelEntry("super-grok-heavy-4-2", "super-grok-heavy-4-2"),
+]
+
 # GPT models combined into nested dictionary
-		GPT_MODELS: Dict[str, List[ModelEntry]] = {
+GPT_MODELS: Dict[str, List[ModelEntry]] = {
     "GPT-4": [
-		        ModelEntry("gpt-4-0125", "gpt-4-0125-preview"),
+        ModelEntry("gpt-4-0125", "gpt-4-0125-preview"),
         ModelEntry("gpt-4-0409", "gpt-4-turbo-2024-04-09"),
         ModelEntry("gpt-4-0613", "gpt-4-0613"),
         ModelEntry("gpt-4-turbo", "gpt-4-1106-preview"),
@@ -80,35 +89,22 @@ SECURITY_MODELS: Dict[str, List[ModelEntry]] = {
         ModelEntry("gpt-4o-0806", "gpt-4o-2024-08-06"),
         ModelEntry("gpt-4o-mini", "gpt-4o-mini-2024-07-18"),
     ],
-		    "GPT-3.5": [
-		        ModelEntry("chatgpt-0125", "gpt-3.5-turbo-0125"),
-		        ModelEntry("chatgpt-1106", "gpt-3.5-turbo-1106"),
-		    ],
+    "GPT-3.5": [
+        ModelEntry("chatgpt-0125", "gpt-3.5-turbo-0125"),
+        ModelEntry("chatgpt-1106", "gpt-3.5-turbo-1106"),
+    ],
     "GPT-5": [
         ModelEntry("gpt-5.2-codex", "gpt-5.2-codex"),
     ],
 }
 
 # Qwen models
-		QWEN_MODELS: List[ModelEntry] = [
+QWEN_MODELS: List[ModelEntry] = [
     ModelEntry("qwen-7b", "Qwen/Qwen2.5-7B-Instruct"),
     ModelEntry("qwen-72b", "Qwen/Qwen2.5-72B-Instruct"),
 ]
 
 # constants.py
-from enum import Enum
-from typing import Dict, List, Union
-
-from models import (
-    ModelEntry,
-    CORE_GROK_MODELS,
-    MEDICAL_MODELS,
-    REGIONAL_MODELS,
-    SECURITY_MODELS,
-    GPT_MODELS,
-    QWEN_MODELS,
-)
-
 class ModelCategory(Enum):
     CORE_GROK = "Core Grok"
     MEDICAL = "Medical"
@@ -116,13 +112,14 @@ class ModelCategory(Enum):
     REGIONAL = "Regional / Legal"
     EXPERIMENTAL = "Experimental"
     GPT = "GPT Series"
-		    QWEN = "Qwen Models"
-		
+    QWEN = "Qwen Models"
+
 CATEGORY_MODELS: Dict[ModelCategory, Union[List[ModelEntry], Dict[str, List[ModelEntry]]]] = {
     ModelCategory.CORE_GROK: CORE_GROK_MODELS,
     ModelCategory.MEDICAL: MEDICAL_MODELS,
     ModelCategory.SECURITY: SECURITY_MODELS,
     ModelCategory.REGIONAL: REGIONAL_MODELS,
+    ModelCategory.EXPERIMENTAL: EXPERIMENTAL_MODELS,
     ModelCategory.GPT: GPT_MODELS,
     ModelCategory.QWEN: QWEN_MODELS,
 }
@@ -135,4 +132,50 @@ def flatten_category_models() -> List[ModelEntry]:
                 flat_list.extend(sublist)
         else:
             flat_list.extend(models)
-	    return flat_list
+    return flat_list
+
+# registry.py
+class ModelRegistry:
+    """Name -> ModelEntry index; the first entry wins if a name is listed twice."""
+
+    def __init__(self, entries: Iterable[ModelEntry]):
+        self._by_name: Dict[str, ModelEntry] = {}
+        for entry in entries:
+            self._by_name.setdefault(entry.name, entry)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def get(self, name: str) -> Optional[ModelEntry]:
+        return self._by_name.get(name)
+
+    def version(self, name: str) -> str:
+        """API model version for a short name; raises ValueError for unknown names."""
+        entry = self._by_name.get(name)
+        if entry is None:
+            raise ValueError(f"Model '{name}' not found in model registry.")
+        return entry.display_name
+
+    def names(self) -> List[str]:
+        return list(self._by_name)
+
+@lru_cache(maxsize=None)
+def get_registry() -> ModelRegistry:
+    """Process-wide registry, built from CATEGORY_MODELS on first use."""
+    return ModelRegistry(flatten_category_models())
+
+def invalidate_registry() -> None:
+    """Drop the cached registry; call after editing CATEGORY_MODELS in place."""
+    get_registry.cache_clear()
+
+def register_model(category: ModelCategory, entry: ModelEntry, group: Optional[str] = None) -> None:
+    """Add a model at runtime; `group` picks the sublist of a nested category."""
+    models = CATEGORY_MODELS.setdefault(category, {} if group is not None else [])
+    if isinstance(models, dict):
+        models.setdefault(group or category.value, []).append(entry)
+    else:
+        models.append(entry)
+    invalidate_registry()
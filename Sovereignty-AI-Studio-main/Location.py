@@ -1,5 +1,7 @@
 import subprocess
 import os
+import threading
+import time
 
 def get_country_code() -> str:
     # Option 1: Carrier SIM (Android only)
@@ -28,3 +30,32 @@ def get_country_code() -> str:
 
     # Fallback
     return "US"
+
+
+# Seconds a resolved country code is trusted before get_country_code() runs again.
+COUNTRY_TTL = float(os.environ.get("COUNTRY_TTL", 300))
+
+_country_cache = {"code": None, "expires": 0.0}
+_country_lock = threading.Lock()
+
+
+def get_country_code_cached(ttl: float = None) -> str:
+    """get_country_code(), re-resolved at most once per `ttl` seconds."""
+    ttl = COUNTRY_TTL if ttl is None else ttl
+    now = time.monotonic()
+    if _country_cache["code"] is not None and now < _country_cache["expires"]:
+        return _country_cache["code"]
+    with _country_lock:
+        # Another thread may have refreshed it while we waited.
+        if _country_cache["code"] is not None and time.monotonic() < _country_cache["expires"]:
+            return _country_cache["code"]
+        code = get_country_code()
+        _country_cache["code"] = code
+        _country_cache["expires"] = time.monotonic() + ttl
+        return code
+
+
+def clear_country_cache() -> None:
+    with _country_lock:
+        _country_cache["code"] = None
+        _country_cache["expires"] = 0.0
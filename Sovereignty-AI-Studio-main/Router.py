@@ -1,6 +1,6 @@
-from typing import Dict
-from .models import ModelEntry
-from .location import get_country_code  # we'll write this
+from typing import Dict, Iterable, List, Optional
+from .models import ModelEntry, get_registry
+from .location import get_country_code_cached
 
 COMPLIANCE_MAP: Dict = {
     "US": "Grok-DoD-IL5",       # FedRAMP, HIPAA
@@ -13,18 +13,27 @@ COMPLIANCE_MAP: Dict = {
     "BR": "Grok-Regional-EU",   # LGPD → treat like EU
 }
 
+DEFAULT_MODEL = "Grok-1.5-Pro"  # safe default
+FALLBACK_MODEL = ModelEntry("fallback", "Safe Local")
+
+
+def route_country(country: Optional[str]) -> ModelEntry:
+    model_name = COMPLIANCE_MAP.get(country, DEFAULT_MODEL)
+    # Pull live from registry: an indexed lookup, rebuilt only when the registry is invalidated
+    return get_registry().get(model_name) or FALLBACK_MODEL
+
+
 def route_model() -> ModelEntry:
-    country = get_country_code()
-    model_name = COMPLIANCE_MAP.get(country, "Grok-1.5-Pro")  # safe default
-    # Pull live from registry
-    for cat in CATEGORY_MODELS.values():
-        if isinstance(cat, dict):
-            for sublist in cat.values():
-                for m in sublist:
-                    if m.name == model_name:
-                        return m
-        elif isinstance(cat, list):
-            for m in cat:
-                if m.name == model_name:
-                    return m
-    return ModelEntry("fallback", "Safe Local")
+    return route_country(get_country_code_cached())
+
+
+def route_models(countries: Iterable[Optional[str]]) -> List[ModelEntry]:
+    """Route a batch of requests; a None country means "where this host is".
+
+    Each distinct country is resolved once per batch.
+    """
+    countries = list(countries)
+    routes: Dict[Optional[str], ModelEntry] = {}
+    for country in set(countries):
+        routes[country] = route_country(get_country_code_cached() if country is None else country)
+    return [routes[c] for c in countries]
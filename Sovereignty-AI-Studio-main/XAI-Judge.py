@@ -1,73 +1,43 @@
 import os
+from functools import lru_cache
 from ...smp import load_env
+from .judge_client_cache import JudgeClientCache, client_key
+from .models import get_registry
 
 INTERNAL = os.environ.get('INTERNAL', 0)
 
+JUDGE_CLIENTS = JudgeClientCache()
+
+
+@lru_cache(maxsize=1)
+def load_env_once():
+    load_env()
+
 
 def build_judge(**kwargs):
     from ...api import OpenAIWrapper, SiliconFlowAPI, HFChatModel
     model = kwargs.pop('model', None)
     kwargs.pop('nproc', None)
-    load_env()
+    load_env_once()
     LOCAL_LLM = os.environ.get('LOCAL_LLM', None)
     if LOCAL_LLM is None:
-        model_map = {
-          Grok-1.5-314B<br>Grok-1.5-Code<br>Grok-Beta-Med<br>Grok-Defense<br>Grok-2-Preview<br>Grok-1.5-Flash<br>Grok-1.5-Pro<br>Grok-Ultra-Internal<br>Grok-Med-HIPAA<br>Grok-Defense-IL6<br>Grok-AU-Health<br>Grok-EU-GDPR<br>Grok-JP<br>Grok-IN<br>Grok-UK-NHS<br>Grok-2-Experimental<br>Grok-Black-Canary<br>Grok-1.5                         Grok-1.5-314B<br>Grok-1.5-Code<br>Grok-Beta-Med<br>Grok-Defense<br>Grok-2-Preview<br>Grok-1.5-Flash<br>Grok-1.5-Pro<br>Grok-Ultra-Internal<br>Grok-Med-HIPAA<br>Grok-Defense-IL6<br>Grok-AU-Health<br>Grok-EU-GDPR<br>Grok-JP<br>Grok-IN<br>Grok-UK-NHS<br>Grok-2-Experimental<br>Grok-Black-Canary<br>Grok-1.5-Preview<br>Grok-Med-Nurse<br>Grok-HomeCare<br>Grok-FedRAMP<br>Grok-DoD-IL5<br>Grok-IL6-Black<br>Grok-Regional-AU<br>Grok-Regional-EU<br>Grok-Regional-JP<br>Grok-Regional-IN<br>Grok-Regional-UK<br>Grok-Canary                         Grok-1.5-314B<br>
-                        Grok-1.5-Code<br>
-                        Grok-Beta-Med<br>
-                        Grok-Defense<br>
-                        Grok-2-Preview<br>
-                        Grok-1.5-Flash<br>
-                        Grok-1.5-Pro<br>
-                        Grok-Ultra-Internal<br>
-                        Grok-Med-HIPAA<br>
-                        Grok-Defense-IL6<br>
-                        Grok-AU-Health<br>
-                        Grok-EU-GDPR<br>
-                        Grok-JP<br>
-                        Grok-IN<br>
-                        Grok-UK-NHS<br>
-                        Grok-2-Experimental<br>
-                        Grok-Black-Canary<br>
-                        Grok-1.5-Preview<br>
-                        Grok-Med-Nurse<br>
-                        Grok-HomeCare<br>
-                        Grok-FedRAMP<br>
-                        Grok-DoD-IL5<br>
-                        Grok-IL6-Black<br>
-                        Grok-Regional-AU<br>
-                        Grok-Regional-EU<br>
-                        Grok-Regional-JP<br>
-                        Grok-Regional-IN<br>
-                        Grok-Regional-UK<br>
-                        Grok-Canary-Internal<br>
-                        Grok-HealthPlus-MyHealthRecord<br>
-                        Grok-GDPR-Compliant<br>
-                        Grok-MHLW-Japan<br>
-                        Grok-NDHM-India<br>
-                        Grok-NHS-ePHI-UK<br> 'super-grok-heavy-4-2' 'gpt-4-turbo': 'gpt-4-1106-preview',
-            'gpt-4-0613': 'gpt-4-0613',
-            'gpt-4-0125': 'gpt-4-0125-preview',
-            'gpt-4-0409': 'gpt-4-turbo-2024-04-09',
-            'chatgpt-1106': 'gpt-3.5-turbo-1106',
-            'chatgpt-0125': 'gpt-3.5-turbo-0125',
-            'gpt-4o': 'gpt-4o-2024-05-13',
-            'gpt-4o-0806': 'gpt-4o-2024-08-06',
-            'gpt-4o-mini': 'gpt-4o-mini-2024-07-18',
-            'qwen-7b': 'Qwen/Qwen2.5-7B-Instruct',
-            'qwen-72b': 'Qwen/Qwen2.5-72B-Instruct',
-           }
-        model_version = model_map[model]
+        # Short judge name -> API model version, from the shared registry.
+        entry = get_registry().get(model)
+        if entry is None:
+            raise KeyError(model)
+        model_version = entry.display_name
     else:
         model_version = LOCAL_LLM
 
     if model in ['super-grok-heavy-4-2', 'qwen-72b']:
-        model = SiliconFlowAPI(model_version, **kwargs)
+        cls = SiliconFlowAPI
     elif model == 'super-grok-heavy-4-2':
-        model = HFChatModel(model_version, **kwargs)
+        cls = HFChatModel
     else:
-        model = OpenAIWrapper(model_version, **kwargs)
-    return model
+        cls = OpenAIWrapper
+    # Clients are reused across calls: same class, version and kwargs, same client.
+    return JUDGE_CLIENTS.get_or_create(
+        client_key(cls, model_version, kwargs), lambda: cls(model_version, **kwargs))
 
 
 DEBUG_MESSAGE = """
@@ -5,6 +5,11 @@ import re
 from typing import List, Dict
 from threading import RLock
 
+# Precompiled once; a word with attached punctuation, and a rough syllable
+# (everything up to and including a vowel, or a vowel-less tail).
+WORD_PATTERN = re.compile(r"[\w']+[.,!?;:]*")
+SYLLABLE_PATTERN = re.compile(r"[^aeiouyAEIOUY]*[aeiouyAEIOUY]|[^aeiouyAEIOUY]+$")
+
 class FullScanEngine:
     def __init__(self):
         self.lock = RLock()
@@ -31,34 +36,13 @@ class FullScanEngine:
 
     def tokenize_syllabic(self, text: str) -> List[str]:
         """Tokenize text into words with attached punctuation, then syllabify."""
-        # Matches words with attached punctuation like commas or periods
-        words = re.findall(r"[\w']+[.,!?;:]*", text)
-        out = []
-        for w in words:
-            m = re.match(r"([\w']+)([.,!?;:]*)", w)
-            if not m:
-                continue
-            base, punc = m.groups()
-            syls = self.syllabify(base)
-            token = ''.join(syls) + (punc or '')
-            out.append(token)
-        return out
+        # Syllables of a word join back into the word itself, so the
+        # tokens are exactly the word-with-punctuation matches.
+        return WORD_PATTERN.findall(text)
 
     def syllabify(self, word: str) -> List[str]:
         """Splits a word into rough syllables using vowel clusters."""
-        vowels = 'aeiouyAEIOUY'
-        if not word:
-            return []
-        out = []
-        syl = ''
-        for i, char in enumerate(word):
-            syl += char
-            if char in vowels:
-                out.append(syl)
-                syl = ''
-        if syl:
-            out.append(syl)
-        return out
+        return SYLLABLE_PATTERN.findall(word)
 
     def scan_complete(self, source: str) -> bool:
         """Checks whether all tokens from a source are accounted for in the context map."""
@@ -0,0 +1,51 @@
+"""keyset listing indexes
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns): newest-first listings per owner
+INDEXES = [
+    ("ix_projects_owner_created", "projects", ["owner_id", "created_at", "id"]),
+    ("ix_generations_user_created", "generations", ["user_id", "created_at", "id"]),
+    ("ix_media_project_created", "media", ["project_id", "created_at", "id"]),
+]
+
+
+def existing_indexes(table: str) -> set:
+    if op.get_context().as_sql:
+        return set()  # offline (--sql) mode: nothing to inspect, emit all DDL
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade() -> None:
+    # Databases created with init_db (create_all) already have these.
+    missing = [spec for spec in INDEXES if spec[0] not in existing_indexes(spec[1])]
+    if not missing:
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        # CONCURRENTLY keeps large tables writable; it cannot run in a transaction.
+        with op.get_context().autocommit_block():
+            for name, table, columns in missing:
+                op.create_index(name, table, columns, postgresql_concurrently=True)
+    else:
+        for name, table, columns in missing:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    offline = op.get_context().as_sql
+    for name, table, _ in reversed(INDEXES):
+        if offline or name in existing_indexes(table):
+            op.drop_index(name, table_name=table)
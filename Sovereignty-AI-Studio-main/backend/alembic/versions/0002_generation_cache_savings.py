@@ -0,0 +1,46 @@
+"""generation cache savings per user
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+COLUMNS = [
+    ("cached_generations", sa.Integer(), "0"),
+    ("tokens_saved", sa.Integer(), "0"),
+    ("cost_saved_usd", sa.Float(), "0"),
+]
+
+
+def existing_columns() -> set:
+    if op.get_context().as_sql:
+        return set()  # offline (--sql) mode: nothing to inspect, emit all DDL
+    return {column["name"] for column in sa.inspect(op.get_bind()).get_columns("users")}
+
+
+def upgrade() -> None:
+    # Databases created with init_db (create_all) already have these.
+    existing = existing_columns()
+    for name, type_, default in COLUMNS:
+        if name not in existing:
+            # server_default fills existing rows without a table rewrite on PostgreSQL 11+
+            op.add_column("users", sa.Column(name, type_, nullable=True, server_default=default))
+
+
+def downgrade() -> None:
+    offline = op.get_context().as_sql
+    existing = existing_columns()
+    with op.batch_alter_table("users") as batch:
+        for name, _, _ in reversed(COLUMNS):
+            if offline or name in existing:
+                batch.drop_column(name)
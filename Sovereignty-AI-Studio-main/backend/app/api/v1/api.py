@@ -1,12 +1,16 @@
-from fastapi import APIRouter
-from app.api.v1.endpoints import test, auth, users
+from fastapi import APIRouter, Depends
+from app.api.v1.endpoints import test, auth, users, projects, generations
+from app.dependencies import RateLimit
 
-api_router = APIRouter()
+# Every v1 endpoint counts against the caller's plan quota (see RateLimit)
+api_router = APIRouter(dependencies=[Depends(RateLimit())])
 
 # Include endpoints
 api_router.include_router(test.router, prefix="/test", tags=["test"])
 api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
+api_router.include_router(projects.router, prefix="/projects", tags=["projects"])
+api_router.include_router(generations.router, prefix="/generations", tags=["generations"])
 
 
 @api_router.get("/status")
@@ -1,13 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from fastapi.security import HTTPAuthorizationCredentials, OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 from typing import Optional
 
-from app.dependencies import get_database
-from app.core.security import create_access_token, verify_password, get_password_hash
+from app.dependencies import check_rate_limit, get_database
+from app.core.security import create_access_token, revoke_token, PasswordHasherBusy
 from app.schemas.user import UserCreate, User, Token, UserLogin
-from app.services.user_service import get_user_by_username, get_user_by_email, create_user
+from app.services.user_service import authenticate_user, get_user_by_username, get_user_by_email, create_user
 from app.config import settings
 from app.models.user import User as UserModel
 
@@ -15,10 +15,10 @@ router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-def authenticate_and_create_token(
+async def authenticate_and_create_token(
     username: str,
     password: str,
-    db: Session
+    db: AsyncSession
 ) -> Token:
     """
     Authenticate user credentials and create access token.
@@ -37,19 +37,21 @@ def authenticate_and_create_token(
     Raises:
         HTTPException 401: If credentials are invalid
         HTTPException 403: If account is inactive
+        HTTPException 429: If this username or email has had too many
+            login attempts (settings.login_rate_limit), wherever they came from
+        PasswordHasherBusy: If the password-hashing queue is full (served as 503)
     """
-    # Get user by username
-    user = get_user_by_username(db, username)
-    
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect username or password",
-            headers={"WWW-Authenticate": "Bearer"},
+    # Per account, on top of the per-IP API quota: spreading guesses over
+    # many addresses does not buy more attempts at one password.
+    if settings.rate_limit_enabled:
+        await check_rate_limit(
+            f"login:{username.strip().lower()}", settings.login_rate_limit, settings.login_rate_window
         )
 
-    # Verify password
-    if not verify_password(password, user.hashed_password):
+    # One query by username or email, then verify the password
+    user = await authenticate_user(db, username, password)
+
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -76,7 +78,7 @@ def authenticate_and_create_token(
 @router.post("/register", response_model=User, status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: UserCreate,
-    db: Session = Depends(get_database),
+    db: AsyncSession = Depends(get_database),
 ):
     """
     Register a new user account.
@@ -92,14 +94,14 @@ async def register(
         HTTPException 400: If username or email already exists
     """
     # Check if user with username already exists
-    if get_user_by_username(db, user_data.username):
+    if await get_user_by_username(db, user_data.username):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already registered",
         )
 
     # Check if user with email already exists
-    if get_user_by_email(db, user_data.email):
+    if await get_user_by_email(db, user_data.email):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered",
@@ -107,8 +109,10 @@ async def register(
 
     # Create new user
     try:
-        new_user = create_user(db, user_data)
+        new_user = await create_user(db, user_data)
         return new_user
+    except PasswordHasherBusy:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -119,7 +123,7 @@ async def register(
 @router.post("/login", response_model=Token)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_database),
+    db: AsyncSession = Depends(get_database),
 ):
     """
     Authenticate user and return access token.
@@ -134,7 +138,7 @@ async def login(
     Raises:
         HTTPException 401: If credentials are invalid
     """
-    return authenticate_and_create_token(
+    return await authenticate_and_create_token(
         username=form_data.username,
         password=form_data.password,
         db=db
@@ -144,7 +148,7 @@ async def login(
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
     user_credentials: UserLogin,
-    db: Session = Depends(get_database),
+    db: AsyncSession = Depends(get_database),
 ):
     """
     Alternative login endpoint accepting JSON body.
@@ -159,7 +163,7 @@ async def login_for_access_token(
     Raises:
         HTTPException 401: If credentials are invalid
     """
-    return authenticate_and_create_token(
+    return await authenticate_and_create_token(
         username=user_credentials.username,
         password=user_credentials.password,
         db=db
@@ -169,7 +173,7 @@ async def login_for_access_token(
 @router.post("/refresh", response_model=Token)
 async def refresh_token(
     current_token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_database),
+    db: AsyncSession = Depends(get_database),
 ):
     """
     Refresh an access token.
@@ -182,19 +186,23 @@ async def refresh_token(
         Token: New access token and token type
 
     Note:
-        This is a basic implementation. For production, implement refresh tokens
-        with token rotation and blacklisting.
+        The presented token is revoked once the new one is issued, so each
+        token can be refreshed only once. Revocations are kept in Redis, so
+        every worker rejects the old token until it would have expired.
     """
     from app.dependencies import get_current_user
-    
+
     # Verify the current token and get user
-    user = await get_current_user(current_token, db)
-    
+    user = await get_current_user(
+        HTTPAuthorizationCredentials(scheme="Bearer", credentials=current_token), db
+    )
+
     # Create new access token
     access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
     access_token = create_access_token(
         data={"sub": user.username},
         expires_delta=access_token_expires,
     )
+    await revoke_token(current_token)
 
     return Token(access_token=access_token, token_type="bearer")
@@ -0,0 +1,169 @@
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.dependencies import get_database, get_current_active_user
+from app.schemas.generation import GenerationCreate, GenerationInDB, GenerationListItem
+from app.schemas.pagination import Page
+from app.services.generation_service import (
+    create_generation,
+    generation_events,
+    get_owned_generation,
+    list_generations,
+)
+from app.services.project_service import get_owned_project
+from app.models.user import User as UserModel
+
+router = APIRouter()
+
+
+@router.get("/", response_model=Page[GenerationListItem])
+async def list_my_generations(
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    include_media: bool = False,
+    current_user: UserModel = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_database),
+):
+    """List the current user's generations, newest first.
+
+    Args:
+        cursor (Optional[str]): ``next_cursor`` from the previous page
+        limit (int): Page size, 1-100
+        include_media (bool): Include each generation's media files
+        current_user (UserModel): Automatically injected authenticated user
+        db (AsyncSession): Async SQLAlchemy database session
+
+    Returns:
+        Page[GenerationListItem]: The generations and the cursor for the next page
+
+    Raises:
+        HTTPException:
+            - 401 if not authenticated (handled by dependency)
+            - 400 if the cursor is invalid
+
+    Note:
+        - Cursor (keyset) pagination: every page costs the same, however
+          deep, and generations created meanwhile never shift the pages
+        - ``media_files`` is only present with ``include_media=true``
+    """
+    items, next_cursor = await list_generations(
+        db, current_user.id, cursor=cursor, limit=limit, include_media=include_media
+    )
+    return Page[GenerationListItem](items=items, next_cursor=next_cursor)
+
+
+@router.post("/", response_model=GenerationInDB, status_code=status.HTTP_202_ACCEPTED)
+async def submit_generation(
+    generation: GenerationCreate,
+    current_user: UserModel = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_database),
+):
+    """Queue a new generation for background processing.
+
+    Args:
+        generation (GenerationCreate): Type, prompt, parameters and optional project
+        current_user (UserModel): Automatically injected authenticated user
+        db (AsyncSession): Async SQLAlchemy database session
+
+    Returns:
+        GenerationInDB: The queued generation, status ``pending``
+
+    Raises:
+        HTTPException:
+            - 401 if not authenticated (handled by dependency)
+            - 400 if the generation type is not supported
+            - 404 if the project does not exist or belongs to someone else
+
+    Note:
+        - Returns immediately; follow progress with
+          GET /generations/{id}/events or poll GET /generations/{id}
+    """
+    if generation.generation_type not in settings.generation_services:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Unsupported generation type"
+        )
+    if generation.project_id is not None and not await get_owned_project(db, generation.project_id, current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+        )
+    return await create_generation(db, current_user.id, generation)
+
+
+@router.get("/{generation_id}", response_model=GenerationInDB)
+async def get_my_generation(
+    generation_id: int,
+    current_user: UserModel = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_database),
+):
+    """Retrieve one of the current user's generations, including its status.
+
+    Args:
+        generation_id (int): The generation to retrieve
+        current_user (UserModel): Automatically injected authenticated user
+        db (AsyncSession): Async SQLAlchemy database session
+
+    Returns:
+        GenerationInDB: The generation
+
+    Raises:
+        HTTPException:
+            - 401 if not authenticated (handled by dependency)
+            - 404 if the generation does not exist or belongs to someone else
+    """
+    generation = await get_owned_generation(db, generation_id, current_user.id)
+    if not generation:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Generation not found"
+        )
+    return generation
+
+
+@router.get("/{generation_id}/events")
+async def stream_generation_status(
+    generation_id: int,
+    current_user: UserModel = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_database),
+):
+    """Stream a generation's status as Server-Sent Events.
+
+    Args:
+        generation_id (int): The generation to follow
+        current_user (UserModel): Automatically injected authenticated user
+        db (AsyncSession): Async SQLAlchemy database session
+
+    Returns:
+        StreamingResponse: ``text/event-stream`` of ``status`` events
+
+    Raises:
+        HTTPException:
+            - 401 if not authenticated (handled by dependency)
+            - 404 if the generation does not exist or belongs to someone else
+
+    Note:
+        - The first event is the current status; the stream ends after
+          ``completed`` or ``failed``
+        - Retries arrive as ``pending`` events with ``retry_in`` seconds
+        - A comment line is sent every 15 s of silence to keep proxies open
+    """
+    if not await get_owned_generation(db, generation_id, current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Generation not found"
+        )
+
+    async def event_stream():
+        async for event in generation_events(AsyncSessionLocal, generation_id):
+            if event is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"event: status\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,83 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.dependencies import get_database, get_current_active_user
+from app.schemas.media import MediaListItem
+from app.schemas.pagination import Page
+from app.schemas.project import ProjectListItem
+from app.services.media_service import list_project_media
+from app.services.project_service import get_owned_project, list_projects
+from app.models.user import User as UserModel
+
+router = APIRouter()
+
+
+@router.get("/", response_model=Page[ProjectListItem])
+async def list_my_projects(
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    include_media: bool = False,
+    current_user: UserModel = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_database),
+):
+    """List the current user's projects, newest first.
+
+    Args:
+        cursor (Optional[str]): ``next_cursor`` from the previous page
+        limit (int): Page size, 1-100
+        include_media (bool): Include each project's media files
+        current_user (UserModel): Automatically injected authenticated user
+        db (AsyncSession): Async SQLAlchemy database session
+
+    Returns:
+        Page[ProjectListItem]: The projects and the cursor for the next page
+
+    Raises:
+        HTTPException:
+            - 401 if not authenticated (handled by dependency)
+            - 400 if the cursor is invalid
+
+    Note:
+        - Cursor (keyset) pagination: every page costs the same, however
+          deep, and items created meanwhile never shift the pages
+        - ``media_files`` is only present with ``include_media=true``
+    """
+    items, next_cursor = await list_projects(
+        db, current_user.id, cursor=cursor, limit=limit, include_media=include_media
+    )
+    return Page[ProjectListItem](items=items, next_cursor=next_cursor)
+
+
+@router.get("/{project_id}/media", response_model=Page[MediaListItem])
+async def list_my_project_media(
+    project_id: int,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: UserModel = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_database),
+):
+    """List the media files of one of the current user's projects, newest first.
+
+    Args:
+        project_id (int): The project whose media to list
+        cursor (Optional[str]): ``next_cursor`` from the previous page
+        limit (int): Page size, 1-100
+        current_user (UserModel): Automatically injected authenticated user
+        db (AsyncSession): Async SQLAlchemy database session
+
+    Returns:
+        Page[MediaListItem]: The media files and the cursor for the next page
+
+    Raises:
+        HTTPException:
+            - 401 if not authenticated (handled by dependency)
+            - 404 if the project does not exist or belongs to someone else
+            - 400 if the cursor is invalid
+    """
+    if not await get_owned_project(db, project_id, current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+        )
+    items, next_cursor = await list_project_media(db, project_id, cursor=cursor, limit=limit)
+    return Page[MediaListItem](items=items, next_cursor=next_cursor)
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 from app.dependencies import get_database, get_current_active_user
-from app.core.init_db import create_tables
+from app.core.init_db import create_tables_async
 from app.models.user import User
 
 router = APIRouter()
@@ -39,7 +39,7 @@ async def initialize_database(
         Consider adding role-based access control.
     """
     try:
-        create_tables()
+        await create_tables_async()
         return {"message": "Database initialized successfully!"}
     except Exception as e:
         # Don't expose internal error details in production
@@ -50,7 +50,7 @@ async def initialize_database(
 
 
 @router.get("/db-test")
-async def test_database(db: Session = Depends(get_database)):
+async def test_database(db: AsyncSession = Depends(get_database)):
     """
     Test database connection.
     
@@ -64,7 +64,7 @@ async def test_database(db: Session = Depends(get_database)):
         HTTPException 500: If database connection fails
     """
     try:
-        result = db.execute(text("SELECT 1 as test"))
+        result = await db.execute(text("SELECT 1 as test"))
         return {
             "message": "Database connection successful!",
             "result": result.scalar(),
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from app.dependencies import get_database, get_current_active_user
-from app.services.user_service import get_user_by_id, update_user
+from app.services.user_service import get_generation_counts, get_user_by_id, update_user
 from app.schemas.user import User, UserUpdate
 from app.models.user import User as UserModel
 
@@ -12,6 +12,7 @@ router = APIRouter()
 @router.get("/me", response_model=User)
 async def get_current_user(
     current_user: UserModel = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_database),
 ):
     """Retrieve the currently authenticated user's profile.
 
@@ -21,6 +22,7 @@ async def get_current_user(
     Args:
         current_user (UserModel): Automatically injected authenticated user
             from the get_current_active_user dependency
+        db (AsyncSession): Async SQLAlchemy database session
 
     Returns:
         User: Pydantic model containing the user's profile information
@@ -31,6 +33,9 @@ async def get_current_user(
     Note:
         - Requires authentication
         - Returns full user profile
+        - Generation counts are live (see get_generation_counts); the
+          authenticated user may come from the user cache, which does not
+          carry them
         - Uses Pydantic model for response serialization
 
     Example Response:
@@ -42,14 +47,16 @@ async def get_current_user(
             "is_active": true
         }
     """
-    return current_user
+    counts = await get_generation_counts(db, current_user.id)
+    profile = {field: getattr(current_user, field) for field in User.model_fields if field not in counts}
+    return User(**profile, **counts)
 
 
 @router.put("/me", response_model=User)
 async def update_current_user(
     user_update: UserUpdate,
     current_user: UserModel = Depends(get_current_active_user),
-    db: Session = Depends(get_database),
+    db: AsyncSession = Depends(get_database),
 ):
     """Update the currently authenticated user's profile information.
 
@@ -59,7 +66,7 @@ async def update_current_user(
     Args:
         user_update (UserUpdate): Pydantic model containing the fields to update
         current_user (UserModel): Automatically injected authenticated user
-        db (Session): SQLAlchemy database session
+        db (AsyncSession): Async SQLAlchemy database session
 
     Returns:
         User: Updated user profile information
@@ -82,7 +89,7 @@ async def update_current_user(
             "bio": "Python developer"
         }
     """
-    updated_user = update_user(db, current_user.id, user_update)
+    updated_user = await update_user(db, current_user.id, user_update)
     if not updated_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Failed to update user"
@@ -93,7 +100,7 @@ async def update_current_user(
 @router.get("/{user_id}", response_model=User)
 async def get_user_profile(
     user_id: int,
-    db: Session = Depends(get_database),
+    db: AsyncSession = Depends(get_database),
     current_user: UserModel = Depends(get_current_active_user),
 ):
     """Retrieve a user's public profile information by their ID.
@@ -103,7 +110,7 @@ async def get_user_profile(
 
     Args:
         user_id (int): The ID of the user to retrieve
-        db (Session): SQLAlchemy database session
+        db (AsyncSession): Async SQLAlchemy database session
         current_user (UserModel): Authenticated user making the request
 
     Returns:
@@ -128,7 +135,7 @@ async def get_user_profile(
             "bio": "AI researcher"
         }
     """
-    user = get_user_by_id(db, user_id)
+    user = await get_user_by_id(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
@@ -139,6 +146,7 @@ async def get_user_profile(
 @router.get("/me/stats")
 async def get_user_stats(
     current_user: UserModel = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_database),
 ):
     """Retrieve usage statistics and subscription information for the current user.
 
@@ -147,11 +155,15 @@ async def get_user_stats(
 
     Args:
         current_user (UserModel): Automatically injected authenticated user
+        db (AsyncSession): Async SQLAlchemy database session
 
     Returns:
         dict: Dictionary containing various usage statistics and account information:
             - total_generations: Total number of generations created
             - monthly_generations: Generations created this month
+            - cached_generations: Generations served from the result cache
+            - tokens_saved / cost_saved_usd: What those cached results would
+              have cost as new AI calls
             - subscription_plan: Current subscription tier
             - subscription_expires_at: Subscription expiration date
             - account_created: Account creation timestamp
@@ -163,6 +175,8 @@ async def get_user_stats(
     Note:
         - Requires authentication
         - Counts reset monthly
+        - Counts are live: stored counters plus increments not yet flushed
+          from Redis
         - Useful for tracking usage limits
         - Includes subscription status
 
@@ -170,15 +184,22 @@ async def get_user_stats(
         {
             "total_generations": 150,
             "monthly_generations": 25,
+            "cached_generations": 12,
+            "tokens_saved": 9600,
+            "cost_saved_usd": 0.19,
             "subscription_plan": "premium",
             "subscription_expires_at": "2024-12-31T23:59:59",
             "account_created": "2023-01-15T10:30:00",
             "last_login": "2024-01-20T15:45:30"
         }
     """
+    counts = await get_generation_counts(db, current_user.id)
     return {
-        "total_generations": current_user.total_generations,
-        "monthly_generations": current_user.monthly_generations,
+        "total_generations": counts["total_generations"],
+        "monthly_generations": counts["monthly_generations"],
+        "cached_generations": counts["cached_generations"],
+        "tokens_saved": counts["tokens_saved"],
+        "cost_saved_usd": counts["cost_saved_usd"],
         "subscription_plan": current_user.subscription_plan,
         "subscription_expires_at": current_user.subscription_expires_at,
         "account_created": current_user.created_at,
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field, field_validator
-from typing import List
+from typing import Dict, List
 import secrets
 
 
@@ -10,10 +10,49 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    db_pool_size: int = 10  # persistent connections per worker process
+    db_max_overflow: int = 20  # extra connections allowed under burst load
+    db_pool_timeout: int = 30  # seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # seconds before a connection is replaced
+    db_pool_pre_ping: bool = True  # test connections on checkout
+    db_echo: bool = False
 
     # Redis
     redis_url: str
 
+    # Authenticated-user cache
+    user_cache_enabled: bool = True
+    user_cache_ttl: int = 60  # seconds a user stays cached in Redis
+    user_cache_local_ttl: float = 5.0  # seconds in the per-process LRU (bounds cross-worker staleness)
+    user_cache_local_size: int = 10000
+
+    # Usage accounting (generation counters)
+    usage_flush_interval: float = 5.0  # seconds between Redis -> database flushes
+    usage_flush_batch: int = 1000  # users per bulk UPDATE statement
+    usage_flush_lock_ttl: float = 60.0  # seconds before a stuck flusher's lock expires
+
+    # Generation jobs
+    job_queue_backend: str = "redis"  # "redis", or "memory" to run the worker inside the API process
+    generation_concurrency: Dict[str, int] = Field(
+        default={"text": 8, "image": 2, "audio": 2, "video": 1},
+        description="Jobs processed at once per worker process, by generation_type"
+    )
+    generation_services: Dict[str, str] = Field(
+        default={"text": "openai", "image": "stability", "audio": "elevenlabs", "video": "stability"},
+        description="AI service recorded on new generations, by generation_type"
+    )
+    generation_max_retries: int = 3
+    generation_retry_backoff: float = 2.0  # seconds before the first retry, doubling each time
+    generation_retry_backoff_max: float = 300.0
+    generation_timeout: float = 300.0  # seconds per attempt before it counts as failed
+    job_visibility_timeout: float = 600.0  # seconds before an unacked job is handed to another worker
+
+    # Generation result cache (identical requests share one AI call)
+    generation_cache_enabled: bool = True
+    generation_cache_ttl: int = 86400  # seconds a result is reused
+    generation_cache_max_entries: int = 100000  # least recently used results evicted beyond this
+    generation_coalesce_poll: float = 1.0  # seconds between checks while an identical request is in flight
+
     # Security
     secret_key: str = Field(
         ...,
@@ -21,7 +60,10 @@ class Settings(BaseSettings):
         description="Secret key for JWT signing - must be at least 32 characters"
     )
     algorithm: str = "HS256"
+    password_hash_workers: int = 4  # bcrypt threads; 0 hashes inline on the event loop
+    password_hash_max_pending: int = 256  # queued hashes beyond this are refused with 503
     access_token_expire_minutes: int = 30
+    token_cache_size: int = 10000  # verified JWTs remembered per process
     refresh_token_expire_days: int = 7
 
     # AI Services (optional in .env)
@@ -35,8 +77,14 @@ class Settings(BaseSettings):
     
     # Rate Limiting
     rate_limit_enabled: bool = True
-    rate_limit_requests: int = 100  # requests per window
+    rate_limit_requests: int = 100  # requests per window (anonymous clients, per IP)
     rate_limit_window: int = 60  # window in seconds
+    rate_limit_plans: Dict[str, int] = Field(
+        default={"free": 100, "pro": 1000, "enterprise": 10000},
+        description="Requests per window for authenticated users, by subscription_plan"
+    )
+    login_rate_limit: int = 10  # login attempts per window for one username or email
+    login_rate_window: int = 300  # window in seconds
     
     # Request Limits
     max_request_size: int = 10 * 1024 * 1024  # 10MB
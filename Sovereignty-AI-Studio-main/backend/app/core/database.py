@@ -1,17 +1,131 @@
-from sqlalchemy import create_engine
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy import DateTime, create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.sql.expression import FunctionElement
 from app.config import settings
 
-engine = create_engine(settings.database_url)
+# Async drivers for the sync URLs the settings (and alembic) use.
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+}
+
+
+def async_url(database_url: str) -> str:
+    """Return the async-driver form of a database URL.
+
+    URLs that already name an async driver are returned unchanged.
+    """
+    url = make_url(database_url)
+    driver = ASYNC_DRIVERS.get(url.drivername)
+    if driver is None:
+        return database_url
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def pool_options(database_url: str) -> dict:
+    """Engine keyword arguments for the configured connection pool.
+
+    SQLite uses a single-connection pool that rejects size/overflow options,
+    so only pre-ping applies there.
+    """
+    options = {"pool_pre_ping": settings.db_pool_pre_ping}
+    if make_url(database_url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+        )
+    return options
+
+
+# Sync engine: alembic, init_db and scripts.
+engine = create_engine(
+    settings.database_url,
+    echo=settings.db_echo,
+    **pool_options(settings.database_url),
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine: request handlers.
+async_engine = create_async_engine(
+    async_url(settings.database_url),
+    echo=settings.db_echo,
+    **pool_options(settings.database_url),
+)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 Base = declarative_base()
 
 
+class utcnow(FunctionElement):
+    """The database server's current time in UTC, as a naive timestamp.
+
+    ``func.now()`` is in the server's or session's time zone on PostgreSQL
+    and MySQL; comparing it with values from ``datetime.utcnow()`` mixes two
+    clocks. Use this wherever stored timestamps are compared with UTC.
+    """
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"  # SQLite: already UTC
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "mysql")
+def _utcnow_mysql(element, compiler, **kw):
+    return "UTC_TIMESTAMP()"
+
+
+@compiles(utcnow, "mssql")
+def _utcnow_mssql(element, compiler, **kw):
+    return "GETUTCDATE()"
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[AsyncSession]:
+    """An AsyncSession that is rolled back if the block raises and always
+    closed, returning its connection to the pool."""
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        except BaseException:
+            await session.rollback()
+            raise
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """Yield a request-scoped AsyncSession, returned to the pool on exit."""
+    async with session_scope() as session:
+        yield session
@@ -0,0 +1,170 @@
+# app/core/generation_cache.py
+import hashlib
+import json
+import unicodedata
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+import redis
+
+# Recency is a shared use counter rather than a timestamp: uses in the same
+# millisecond, or on workers with skewed clocks, still order correctly.
+
+# Store an entry and evict the least recently used ones beyond the bound.
+#
+# KEYS[1] = entry key, KEYS[2] = LRU index (sorted set of entry keys),
+# KEYS[3] = use counter; ARGV[1] = value, ARGV[2] = TTL (s), ARGV[3] = max entries
+# Returns the number of entries evicted.
+SET_SCRIPT = """
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+redis.call('ZADD', KEYS[2], redis.call('INCR', KEYS[3]), KEYS[1])
+local overflow = redis.call('ZCARD', KEYS[2]) - tonumber(ARGV[3])
+if overflow <= 0 then
+    return 0
+end
+local evicted = redis.call('ZPOPMIN', KEYS[2], overflow)
+for i = 1, #evicted, 2 do
+    redis.call('DEL', evicted[i])
+end
+return overflow
+"""
+
+# Read an entry and mark it recently used. Expired entries are dropped from
+# the index. KEYS[1] = entry key, KEYS[2] = LRU index, KEYS[3] = use counter
+GET_SCRIPT = """
+local value = redis.call('GET', KEYS[1])
+if value then
+    redis.call('ZADD', KEYS[2], redis.call('INCR', KEYS[3]), KEYS[1])
+else
+    redis.call('ZREM', KEYS[2], KEYS[1])
+end
+return value
+"""
+
+# KEYS[1] = lease key; ARGV[1] = holder. Deletes the lease only if still held.
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Unicode-normalized prompt without outer whitespace or CRLF differences.
+
+    Inner whitespace is kept: it can matter to the model (code, poetry).
+    """
+    return unicodedata.normalize("NFC", prompt).replace("\r\n", "\n").strip()
+
+
+def generation_key(
+    generation_type: str,
+    ai_service: str,
+    prompt: str,
+    parameters: Optional[Dict[str, Any]],
+) -> str:
+    """Content address of a generation request: identical requests, identical key.
+
+    ``parameters`` are compared as canonical JSON (sorted keys), and a
+    missing parameters dict equals an empty one.
+    """
+    canonical = json.dumps(
+        [generation_type.lower(), ai_service.lower(), normalize_prompt(prompt), parameters or {}],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+@dataclass
+class CachedGeneration:
+    result: str
+    tokens_used: Optional[int]
+    cost_usd: Optional[float]
+    generation_id: int  # the generation that paid for the AI call
+
+
+class GenerationCache:
+    """Content-addressed cache of completed generation results in Redis.
+
+    Entries expire after ``ttl`` seconds, and at most ``max_entries`` are
+    kept, evicting the least recently used. Leases let one worker make the
+    AI call for a key while identical requests wait for its result.
+
+    Redis errors are treated as misses and leases are granted, so an outage
+    costs duplicate AI calls rather than failed generations.
+    """
+
+    def __init__(
+        self,
+        client: "redis.asyncio.Redis",
+        ttl: int = 86400,
+        max_entries: int = 100000,
+        prefix: str = "{gencache}",
+        enabled: bool = True,
+    ):
+        self.client = client
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        # The hash tag in the default prefix keeps all keys in one Redis Cluster slot.
+        self.entry_prefix = f"{prefix}:entry:"
+        self.lease_prefix = f"{prefix}:lease:"
+        self.index_key = f"{prefix}:lru"
+        self.clock_key = f"{prefix}:clock"
+        self._get = client.register_script(GET_SCRIPT)
+        self._set = client.register_script(SET_SCRIPT)
+        self._release = client.register_script(RELEASE_SCRIPT)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+
+    async def get(self, key: str) -> Optional[CachedGeneration]:
+        if not self.enabled:
+            return None
+        try:
+            raw = await self._get(keys=[self.entry_prefix + key, self.index_key, self.clock_key])
+        except redis.RedisError:
+            self.errors += 1
+            raw = None
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return CachedGeneration(**json.loads(raw))
+
+    async def set(self, key: str, entry: CachedGeneration) -> None:
+        if not self.enabled:
+            return
+        try:
+            self.evictions += await self._set(
+                keys=[self.entry_prefix + key, self.index_key, self.clock_key],
+                args=[json.dumps(asdict(entry)), self.ttl, self.max_entries],
+            )
+        except redis.RedisError:
+            self.errors += 1
+
+    async def acquire(self, key: str, holder: str, lease: float) -> bool:
+        """Claim the AI call for ``key`` for ``lease`` seconds; False if someone else holds it."""
+        if not self.enabled:
+            return True
+        try:
+            acquired = await self.client.set(self.lease_prefix + key, holder, nx=True, px=int(lease * 1000))
+        except redis.RedisError:
+            self.errors += 1
+            return True
+        return bool(acquired)
+
+    async def release(self, key: str, holder: str) -> None:
+        if not self.enabled:
+            return
+        try:
+            await self._release(keys=[self.lease_prefix + key], args=[holder])
+        except redis.RedisError:
+            self.errors += 1  # the lease expires on its own
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "errors": self.errors}
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Session
-from app.core.database import engine, Base
+from app.core.database import engine, async_engine, Base
 from app.models.user import User
 from app.models.project import Project
 from app.models.generation import Generation
@@ -16,6 +16,12 @@ def create_tables():
     Base.metadata.create_all(bind=engine)
 
 
+async def create_tables_async():
+    """Create all database tables without blocking the event loop."""
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
 def drop_tables():
     """Drop all database tables."""
     Base.metadata.drop_all(bind=engine)
@@ -0,0 +1,247 @@
+# app/core/jobs.py
+import asyncio
+import json
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+import redis
+
+# Move due jobs from the delayed set onto their type's ready list.
+#
+# KEYS[1] = delayed sorted set; ARGV[1] = now (ms), ARGV[2] = ready-list
+# key prefix, ARGV[3] = max jobs to move. Returns the number moved.
+PROMOTE_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[3]))
+for _, payload in ipairs(due) do
+    local job = cjson.decode(payload)
+    redis.call('LPUSH', ARGV[2] .. job['generation_type'], payload)
+    redis.call('ZREM', KEYS[1], payload)
+end
+return #due
+"""
+
+# Return jobs whose worker stopped acking them (crashed, killed, partitioned)
+# to the front of their ready list. A processing entry without a lease (the
+# worker died between BLMOVE and ZADD) is given one now, so it is recovered
+# one visibility timeout later rather than never.
+#
+# KEYS[1] = lease sorted set (payload -> deadline, ms); ARGV[1] = now (ms),
+# ARGV[2] = visibility timeout (ms), ARGV[3] = processing-list key prefix,
+# ARGV[4] = ready-list key prefix, ARGV[5] = generation type.
+# Returns the number requeued.
+RECOVER_SCRIPT = """
+local now = tonumber(ARGV[1])
+local processing = ARGV[3] .. ARGV[5]
+local moved = 0
+for _, payload in ipairs(redis.call('LRANGE', processing, 0, -1)) do
+    local deadline = redis.call('ZSCORE', KEYS[1], payload)
+    if not deadline then
+        redis.call('ZADD', KEYS[1], now + tonumber(ARGV[2]), payload)
+    elseif tonumber(deadline) <= now then
+        redis.call('LREM', processing, 1, payload)
+        redis.call('ZREM', KEYS[1], payload)
+        redis.call('RPUSH', ARGV[4] .. ARGV[5], payload)
+        moved = moved + 1
+    end
+end
+return moved
+"""
+
+# Drop one copy of a job from its processing list, and its lease unless
+# another copy (e.g. a coalescing requeue) is still being worked on.
+#
+# KEYS[1] = processing list, KEYS[2] = lease sorted set; ARGV[1] = payload
+ACK_SCRIPT = """
+redis.call('LREM', KEYS[1], 1, ARGV[1])
+if not redis.call('LPOS', KEYS[1], ARGV[1]) then
+    redis.call('ZREM', KEYS[2], ARGV[1])
+end
+"""
+
+
+@dataclass(frozen=True)
+class Job:
+    generation_id: int
+    generation_type: str
+    attempt: int = 0  # retries so far
+
+    def dumps(self) -> str:
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def loads(cls, payload: str) -> "Job":
+        return cls(**json.loads(payload))
+
+
+class RedisJobQueue:
+    """Generation job queue and status channel on an async Redis client.
+
+    Each generation type has its own ready list, so a busy type never
+    starves the others, and workers size their concurrency per type. Jobs
+    with a retry delay wait in a sorted set until due. A dequeued job is
+    kept on a processing list until ``ack``, under a lease of
+    ``visibility_timeout`` seconds; each dequeue first returns jobs whose
+    lease has lapsed to the ready list, so a crashed worker's jobs are
+    picked up by the others. The timeout must outlast a job's processing.
+
+    Status events go out over pub/sub, one channel per generation.
+    """
+
+    def __init__(self, client: "redis.asyncio.Redis", prefix: str = "{jobs}", visibility_timeout: float = 600.0):
+        self.client = client
+        self.visibility_timeout = visibility_timeout
+        # The hash tag in the default prefix keeps all keys in one Redis Cluster slot.
+        self.ready_prefix = f"{prefix}:ready:"
+        self.processing_prefix = f"{prefix}:processing:"
+        self.delayed_key = f"{prefix}:delayed"
+        self.leases_key = f"{prefix}:leases"
+        self.channel_prefix = f"{prefix}:status:"
+        self._promote = client.register_script(PROMOTE_SCRIPT)
+        self._recover = client.register_script(RECOVER_SCRIPT)
+        self._ack = client.register_script(ACK_SCRIPT)
+        self.enqueued = 0
+        self.dequeued = 0
+        self.recovered = 0
+
+    async def enqueue(self, job: Job, delay: float = 0.0) -> None:
+        if delay > 0:
+            due_ms = int((time.time() + delay) * 1000)
+            await self.client.zadd(self.delayed_key, {job.dumps(): due_ms})
+        else:
+            await self.client.lpush(self.ready_prefix + job.generation_type, job.dumps())
+        self.enqueued += 1
+
+    async def dequeue(self, generation_type: str, timeout: float = 1.0) -> Optional[Job]:
+        """Next job of ``generation_type``, waiting up to ``timeout`` seconds."""
+        now_ms = int(time.time() * 1000)
+        visibility_ms = int(self.visibility_timeout * 1000)
+        await self._promote(
+            keys=[self.delayed_key],
+            args=[now_ms, self.ready_prefix, 100],
+        )
+        self.recovered += await self._recover(
+            keys=[self.leases_key],
+            args=[now_ms, visibility_ms, self.processing_prefix, self.ready_prefix, generation_type],
+        )
+        payload = await self.client.blmove(
+            self.ready_prefix + generation_type,
+            self.processing_prefix + generation_type,
+            timeout,
+            "RIGHT",
+            "LEFT",
+        )
+        if payload is None:
+            return None
+        await self.client.zadd(self.leases_key, {payload: int(time.time() * 1000) + visibility_ms})
+        self.dequeued += 1
+        return Job.loads(payload)
+
+    async def ack(self, job: Job) -> None:
+        """Drop a finished (or rescheduled) job from the processing list."""
+        await self._ack(keys=[self.processing_prefix + job.generation_type, self.leases_key], args=[job.dumps()])
+
+    async def publish(self, generation_id: int, event: Dict[str, Any]) -> None:
+        await self.client.publish(self.channel_prefix + str(generation_id), json.dumps(event))
+
+    @asynccontextmanager
+    async def subscribe(
+        self, generation_id: int, heartbeat: float = 15.0
+    ) -> AsyncIterator[AsyncIterator[Optional[Dict[str, Any]]]]:
+        """Status events for one generation, as an async iterator.
+
+        Yields None after ``heartbeat`` idle seconds so streams can send
+        keep-alives. Subscribe before reading the current status from the
+        database so no event published in between is missed.
+        """
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.channel_prefix + str(generation_id))
+
+        async def events():
+            idle_since = time.monotonic()
+            while True:
+                # Short polls: a blocking read would trip the client's socket timeout.
+                message = await pubsub.get_message(timeout=1.0)
+                if message is not None:
+                    idle_since = time.monotonic()
+                    yield json.loads(message["data"])
+                elif time.monotonic() - idle_since >= heartbeat:
+                    idle_since = time.monotonic()
+                    yield None
+
+        try:
+            yield events()
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+
+    def stats(self) -> Dict[str, int]:
+        return {"enqueued": self.enqueued, "dequeued": self.dequeued, "recovered": self.recovered}
+
+
+class MemoryJobQueue:
+    """In-process stand-in for RedisJobQueue, for tests and single-process runs.
+
+    Same interface; jobs and events never leave the process, so API and
+    worker must share an event loop.
+    """
+
+    def __init__(self):
+        self._ready: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = defaultdict(set)
+        self._timers: Set[asyncio.TimerHandle] = set()
+        self.enqueued = 0
+        self.dequeued = 0
+
+    async def enqueue(self, job: Job, delay: float = 0.0) -> None:
+        self.enqueued += 1
+        if delay > 0:
+            def release():
+                self._timers.discard(handle)
+                self._ready[job.generation_type].put_nowait(job)
+
+            handle = asyncio.get_running_loop().call_later(delay, release)
+            self._timers.add(handle)
+        else:
+            self._ready[job.generation_type].put_nowait(job)
+
+    async def dequeue(self, generation_type: str, timeout: float = 1.0) -> Optional[Job]:
+        try:
+            job = await asyncio.wait_for(self._ready[generation_type].get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        self.dequeued += 1
+        return job
+
+    async def ack(self, job: Job) -> None:
+        pass
+
+    async def publish(self, generation_id: int, event: Dict[str, Any]) -> None:
+        for queue in self._subscribers.get(generation_id, ()):
+            queue.put_nowait(event)
+
+    @asynccontextmanager
+    async def subscribe(
+        self, generation_id: int, heartbeat: float = 15.0
+    ) -> AsyncIterator[AsyncIterator[Optional[Dict[str, Any]]]]:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers[generation_id].add(queue)
+
+        async def events():
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+
+        try:
+            yield events()
+        finally:
+            self._subscribers[generation_id].discard(queue)
+            if not self._subscribers[generation_id]:
+                del self._subscribers[generation_id]
+
+    def stats(self) -> Dict[str, int]:
+        return {"enqueued": self.enqueued, "dequeued": self.dequeued}
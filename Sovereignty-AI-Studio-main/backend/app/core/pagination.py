@@ -0,0 +1,52 @@
+# app/core/pagination.py
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, tuple_
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(created_at: datetime, id: int) -> str:
+    """Opaque cursor for the position just after a row."""
+    raw = json.dumps([created_at.isoformat(), id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(id)
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursor("Invalid cursor") from exc
+
+
+def keyset_page(statement: Select, created_at, id, cursor: Optional[str], limit: int) -> Select:
+    """Newest-first page of ``statement`` after ``cursor``.
+
+    ``created_at`` and ``id`` are the sort columns. The statement should
+    already filter on the leading column of a ``(owner, created_at, id)``
+    index, so each page is one index range scan no matter how deep it is.
+    One extra row is fetched to tell whether there is a next page; pass the
+    rows to ``page_result``.
+    """
+    if cursor is not None:
+        statement = statement.where(tuple_(created_at, id) < tuple_(*decode_cursor(cursor)))
+    return statement.order_by(created_at.desc(), id.desc()).limit(limit + 1)
+
+
+def page_result(rows: Sequence[Any], limit: int) -> Tuple[List[Any], Optional[str]]:
+    """Split the rows of a keyset_page query into (items, next_cursor)."""
+    items = list(rows[:limit])
+    if len(rows) <= limit:
+        return items, None
+    last = items[-1]
+    return items, encode_cursor(last.created_at, last.id)
@@ -0,0 +1,140 @@
+# app/core/rate_limit.py
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Tuple
+
+import redis
+
+# Sliding-window counter: the previous fixed window's count, weighted by how
+# much of it still overlaps the sliding window, plus the current window's
+# count. One atomic round trip per request; one small hash per identity
+# holding the current window's index and both counts.
+#
+# The clock is Redis TIME, so every worker agrees on the window boundaries
+# however far their own clocks drift. (Writes after TIME need effects
+# replication, the default since Redis 5.)
+#
+# KEYS[1] = window hash for the identity
+# ARGV[1] = limit, ARGV[2] = window (ms)
+# Returns {allowed (0/1), remaining, retry_after_ms}
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local index = math.floor(now / window)
+local state = redis.call('HMGET', KEYS[1], 'index', 'current', 'previous')
+local stored = tonumber(state[1])
+local current = tonumber(state[2]) or 0
+local previous = tonumber(state[3]) or 0
+if stored ~= index then
+    if stored == index - 1 then
+        previous = current
+    else
+        previous = 0
+    end
+    current = 0
+end
+local elapsed = now % window
+local weight = (window - elapsed) / window
+local count = previous * weight + current
+if count + 1 > limit then
+    local retry = window - elapsed
+    if previous > 0 and current + 1 <= limit then
+        local target = (limit - 1 - current) / previous
+        retry = math.ceil((weight - target) * window)
+    end
+    return {0, 0, math.max(1, math.floor(retry))}
+end
+redis.call('HSET', KEYS[1], 'index', index, 'current', current + 1, 'previous', previous)
+redis.call('PEXPIRE', KEYS[1], window * 2)
+return {1, math.floor(limit - count - 1), 0}
+"""
+
+
+@dataclass
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float  # seconds; 0 when allowed
+
+
+class LocalWindows:
+    """The same sliding-window counter as SLIDING_WINDOW_SCRIPT, in process memory.
+
+    Used while Redis is unreachable, so each worker still enforces the quota
+    on its own. At most ``size`` identities are tracked; the least recently
+    seen is forgotten first.
+    """
+
+    def __init__(self, size: int = 10_000):
+        self.size = size
+        # key -> (window index, current count, previous count)
+        self._windows: "OrderedDict[str, Tuple[int, int, int]]" = OrderedDict()
+
+    def hit(self, key: str, limit: int, window_ms: int) -> Tuple[bool, int, int]:
+        """Returns (allowed, remaining, retry_after_ms), like the script."""
+        now = int(time.monotonic() * 1000)
+        index = now // window_ms
+        stored, current, previous = self._windows.get(key, (None, 0, 0))
+        if stored != index:
+            previous = current if stored == index - 1 else 0
+            current = 0
+        elapsed = now % window_ms
+        weight = (window_ms - elapsed) / window_ms
+        count = previous * weight + current
+        if count + 1 > limit:
+            retry = window_ms - elapsed
+            if previous > 0 and current + 1 <= limit:
+                target = (limit - 1 - current) / previous
+                retry = math.ceil((weight - target) * window_ms)
+            return False, 0, max(1, int(retry))
+        self._windows[key] = (index, current + 1, previous)
+        self._windows.move_to_end(key)
+        while len(self._windows) > self.size:
+            self._windows.popitem(last=False)
+        return True, int(limit - count - 1), 0
+
+
+class SlidingWindowLimiter:
+    """Distributed sliding-window rate limiter on an async Redis client.
+
+    Counters live in Redis, so every worker process shares the same quota.
+    If Redis is unavailable the request is counted in ``errors`` and checked
+    against a per-process window instead (see LocalWindows), so the limit
+    still holds for each worker.
+    """
+
+    def __init__(self, client: "redis.asyncio.Redis", prefix: str = "rl"):
+        self.client = client
+        self.prefix = prefix
+        self._script = client.register_script(SLIDING_WINDOW_SCRIPT)
+        self.fallback = LocalWindows()
+        self.allowed = 0
+        self.blocked = 0
+        self.errors = 0
+
+    def key(self, identity: str, window_ms: int) -> str:
+        # The hash tag keeps an identity's quotas in one Redis Cluster slot.
+        return f"{self.prefix}:{{{identity}}}:{window_ms}"
+
+    async def hit(self, identity: str, limit: int, window: float) -> RateLimitResult:
+        """Count one request for ``identity`` against ``limit`` per ``window`` seconds."""
+        window_ms = max(1, int(window * 1000))
+        key = self.key(identity, window_ms)
+        try:
+            allowed, remaining, retry_ms = await self._script(keys=[key], args=[limit, window_ms])
+        except redis.RedisError:
+            self.errors += 1
+            allowed, remaining, retry_ms = self.fallback.hit(key, limit, window_ms)
+        if allowed:
+            self.allowed += 1
+        else:
+            self.blocked += 1
+        return RateLimitResult(bool(allowed), limit, int(remaining), int(retry_ms) / 1000)
+
+    def stats(self):
+        return {"allowed": self.allowed, "blocked": self.blocked, "errors": self.errors}
@@ -1,5 +1,6 @@
 # app/core/redis.py
 import redis
+import redis.asyncio
 from app.config import settings
 
 # Single global client — safe for FastAPI lifespan
@@ -14,3 +15,18 @@ redis_client = redis.from_url(
 def get_redis() -> redis.Redis:
     """Dependency to inject Redis client."""
     return redis_client
+
+
+# Async client for request handlers, so cache round trips don't block the event loop
+async_redis_client = redis.asyncio.from_url(
+    settings.redis_url,
+    decode_responses=True,
+    socket_connect_timeout=5,
+    socket_timeout=5,
+    retry_on_timeout=True,
+)
+
+
+def get_async_redis() -> redis.asyncio.Redis:
+    """Dependency to inject the async Redis client."""
+    return async_redis_client
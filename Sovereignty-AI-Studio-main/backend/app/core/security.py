@@ -1,15 +1,97 @@
 # app/core/security.py
+import asyncio
+import hashlib
+import math
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple, TypeVar
 
+import redis
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.config import settings
+from app.core.redis import async_redis_client
 
 # bcrypt hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+T = TypeVar("T")
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the password-hashing queue is full."""
+
+
+class PasswordHasher:
+    """Bounded thread pool for bcrypt work.
+
+    bcrypt releases the GIL, so hashes run in parallel off the event loop.
+    At most ``max_pending`` calls may wait for a worker; more are refused
+    with PasswordHasherBusy instead of queueing without limit. A call
+    cancelled while still waiting is dropped and frees its place.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.executor = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+            if workers > 0 else None
+        )
+        self._lock = threading.Lock()
+        self.pending = 0  # submitted, waiting for a worker
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def _call(self, fn: Callable[..., T], *args) -> T:
+        with self._lock:
+            self.pending -= 1
+            self.running += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        if self.executor is None:
+            return fn(*args)
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordHasherBusy()
+            self.pending += 1
+        future = self.executor.submit(self._call, fn, *args)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # The caller went away (disconnect, timeout). A job no worker has
+            # started yet is dropped and its slot released here, since _call
+            # will never run; one already running finishes and releases it.
+            if future.cancel():
+                with self._lock:
+                    self.pending -= 1
+            raise
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "workers": self.workers,
+            "queue_depth": self.pending,
+            "running": self.running,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+
+password_hasher = PasswordHasher(settings.password_hash_workers, settings.password_hash_max_pending)
+
 
 def create_access_token(
     data: dict,
@@ -23,7 +105,9 @@ def create_access_token(
         else datetime.utcnow()
         + timedelta(minutes=settings.access_token_expire_minutes)
     )
-    to_encode.update({"exp": expire})
+    # jti keeps tokens issued in the same second distinct, so revoking one
+    # (e.g. on refresh) never revokes its replacement.
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 
@@ -37,14 +121,154 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def verify_token(token: str) -> Optional[str]:
-    """Validate JWT and return subject (username) if valid."""
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the password-hashing pool."""
+    return await password_hasher.run(pwd_context.verify, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash on the password-hashing pool."""
+    return await password_hasher.run(pwd_context.hash, password)
+
+
+class TokenCache:
+    """Bounded LRU of verified JWTs, keyed by the token's SHA-256 digest.
+
+    Each entry holds the subject and the ``exp`` claim; expired entries are
+    dropped on lookup, so a cached token is never honoured past its expiry.
+    Revocation is not tracked here; see TokenRevocations.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: bytes, subject: str, exp: float) -> None:
+        with self._lock:
+            self._entries[key] = (subject, exp)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def evict(self, key: bytes) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class TokenRevocations:
+    """Revoked JWTs, shared between workers through Redis.
+
+    One key per token digest, expiring when the token does: once past its
+    ``exp`` a token fails verification on its own. Redis errors are treated
+    as "not revoked", so an outage does not lock every user out.
+    """
+
+    KEY_PREFIX = "auth:revoked:"
+
+    def __init__(self, client=async_redis_client):
+        self.client = client
+        self.errors = 0
+
+    async def revoke(self, key: bytes, exp: float) -> None:
+        ttl = math.ceil(exp - time.time())
+        if ttl <= 0:
+            return
+        try:
+            await self.client.set(self.KEY_PREFIX + key.hex(), 1, ex=ttl)
+        except redis.RedisError:
+            self.errors += 1
+
+    async def is_revoked(self, key: bytes) -> bool:
+        try:
+            return bool(await self.client.exists(self.KEY_PREFIX + key.hex()))
+        except redis.RedisError:
+            self.errors += 1
+            return False
+
+
+token_cache = TokenCache(settings.token_cache_size)
+token_revocations = TokenRevocations()
+
+
+def decode_token(token: str) -> Optional[dict]:
+    """Fully verify a JWT (signature and expiry) and return its claims."""
     try:
-        payload = jwt.decode(
+        return jwt.decode(
             token,
             settings.secret_key,
             algorithms=[settings.algorithm],
         )
-        return payload.get("sub")
     except JWTError:
         return None
+
+
+def verify_token(token: str) -> Optional[str]:
+    """Validate JWT and return subject (username) if valid.
+
+    Tokens seen before are answered from token_cache without re-checking
+    the signature, until their ``exp`` claim passes. Does not consult the
+    revocation list; request handlers use verify_token_async.
+    """
+    key = token_cache.digest(token)
+    subject = token_cache.get(key)
+    if subject is not None:
+        return subject
+
+    payload = decode_token(token)
+    if payload is None:
+        return None
+    subject = payload.get("sub")
+    exp = payload.get("exp")
+    if subject is not None and exp is not None:
+        token_cache.put(key, subject, float(exp))
+    return subject
+
+
+async def verify_token_async(token: str) -> Optional[str]:
+    """verify_token, then reject the token if any worker has revoked it."""
+    subject = verify_token(token)
+    if subject is None or await token_revocations.is_revoked(token_cache.digest(token)):
+        return None
+    return subject
+
+
+async def revoke_token(token: str) -> None:
+    """Reject ``token`` in every worker from now until it expires."""
+    payload = decode_token(token)
+    if payload is None or payload.get("exp") is None:
+        return
+    key = token_cache.digest(token)
+    token_cache.evict(key)
+    await token_revocations.revoke(key, float(payload["exp"]))
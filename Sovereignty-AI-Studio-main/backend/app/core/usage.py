@@ -0,0 +1,129 @@
+# app/core/usage.py
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+
+import redis
+
+# Move the pending deltas aside under a lock so increments made during a
+# flush land in a fresh hash. An in-flight hash left by a failed flush is
+# returned again instead of being overwritten.
+#
+# KEYS[1] = pending hash, KEYS[2] = in-flight hash, KEYS[3] = lock
+# ARGV[1] = lock token, ARGV[2] = lock TTL (ms)
+# Returns the in-flight hash as a flat field/value list, or nil if the lock
+# is held by another flusher.
+CLAIM_SCRIPT = """
+if not redis.call('SET', KEYS[3], ARGV[1], 'NX', 'PX', ARGV[2]) then
+    return false
+end
+if redis.call('EXISTS', KEYS[2]) == 0 and redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('RENAME', KEYS[1], KEYS[2])
+end
+return redis.call('HGETALL', KEYS[2])
+"""
+
+# KEYS[1] = in-flight hash, KEYS[2] = lock; ARGV[1] = lock token,
+# ARGV[2] = 1 to drop the in-flight batch (it was written), 0 to keep it
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[2]) ~= ARGV[1] then
+    return 0
+end
+if ARGV[2] == '1' then
+    redis.call('DEL', KEYS[1])
+end
+redis.call('DEL', KEYS[2])
+return 1
+"""
+
+
+class UsageCounter:
+    """Per-user generation counters accumulated in Redis.
+
+    Each generation is one HINCRBY on a shared hash, so concurrent requests
+    and workers never race. ``batch()`` hands the accumulated deltas to a
+    single flusher at a time for writing to the database; if that write
+    fails the same batch is offered again on the next flush. Delivery is
+    at least once: a Redis failure between the database commit and the
+    release means the batch is written again.
+
+    Redis errors are reported to the caller (``increment`` returns False)
+    so it can fall back to writing the database directly.
+    """
+
+    def __init__(self, client: "redis.asyncio.Redis", prefix: str = "{usage}", lock_ttl: float = 60.0):
+        self.client = client
+        # The hash tag in the default prefix keeps all keys in one Redis Cluster slot.
+        self.pending_key = f"{prefix}:pending"
+        self.inflight_key = f"{prefix}:inflight"
+        self.lock_key = f"{prefix}:lock"
+        self.lock_ttl_ms = int(lock_ttl * 1000)
+        self._claim = client.register_script(CLAIM_SCRIPT)
+        self._release = client.register_script(RELEASE_SCRIPT)
+        self.increments = 0
+        self.flushed = 0
+        self.errors = 0
+
+    async def increment(self, user_id: int, amount: int = 1) -> bool:
+        """Add ``amount`` to the user's pending count; False if Redis is unavailable."""
+        try:
+            await self.client.hincrby(self.pending_key, str(user_id), amount)
+        except redis.RedisError:
+            self.errors += 1
+            return False
+        self.increments += 1
+        return True
+
+    async def pending(self, user_id: int) -> int:
+        """Generations counted in Redis but not yet written to the database.
+
+        Includes a batch that is being flushed, so a reader may briefly count
+        it twice between the database commit and the batch being dropped.
+        """
+        field = str(user_id)
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.hget(self.pending_key, field)
+                pipe.hget(self.inflight_key, field)
+                pending, inflight = await pipe.execute()
+        except redis.RedisError:
+            self.errors += 1
+            return 0
+        return int(pending or 0) + int(inflight or 0)
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[Dict[int, int]]:
+        """Claim the pending deltas as ``{user_id: delta}`` for writing.
+
+        Yields an empty dict when there is nothing to flush, another flusher
+        holds the lock, or Redis is unavailable. The batch is dropped only if
+        the block exits without an exception.
+        """
+        token = uuid.uuid4().hex
+        try:
+            flat = await self._claim(
+                keys=[self.pending_key, self.inflight_key, self.lock_key],
+                args=[token, self.lock_ttl_ms],
+            )
+        except redis.RedisError:
+            self.errors += 1
+            flat = None
+        if flat is None:
+            yield {}
+            return
+
+        deltas = {int(flat[i]): int(flat[i + 1]) for i in range(0, len(flat), 2)}
+        written = False
+        try:
+            yield deltas
+            written = True
+        finally:
+            try:
+                await self._release(keys=[self.inflight_key, self.lock_key], args=[token, int(written)])
+            except redis.RedisError:
+                # The lock expires on its own and the batch is offered again.
+                self.errors += 1
+        self.flushed += sum(deltas.values())
+
+    def stats(self) -> Dict[str, int]:
+        return {"increments": self.increments, "flushed": self.flushed, "errors": self.errors}
@@ -0,0 +1,155 @@
+# app/core/user_cache.py
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+import redis
+from sqlalchemy import DateTime, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.config import settings
+from app.core.redis import async_redis_client
+from app.models.user import User
+
+KEY_PREFIX = "auth:user:"
+
+# Never written to Redis. The password hash stays in the database, and the
+# usage counters change on every generation without passing through the
+# invalidating write paths (see user_service), so a cached copy would go stale.
+# Users built from the cache leave these unloaded; see UserCache.attach.
+EXCLUDED_FIELDS = {
+    "hashed_password",
+    "total_generations",
+    "monthly_generations",
+    "last_generation_reset",
+    "cached_generations",
+    "tokens_saved",
+    "cost_saved_usd",
+}
+
+_columns = [c for c in inspect(User).columns if c.key not in EXCLUDED_FIELDS]
+_datetime_fields = {c.key for c in _columns if isinstance(c.type, DateTime)}
+
+
+def serialize_user(user: User) -> Dict[str, Any]:
+    """Column values of a user as a JSON-safe dict (datetimes as ISO strings)."""
+    data = {}
+    for column in _columns:
+        value = getattr(user, column.key)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        data[column.key] = value
+    return data
+
+
+def deserialize_user(data: Dict[str, Any]) -> Dict[str, Any]:
+    fields = dict(data)
+    for key in _datetime_fields:
+        if fields.get(key) is not None:
+            fields[key] = datetime.fromisoformat(fields[key])
+    return fields
+
+
+class UserCache:
+    """Two-tier cache of authenticated users, keyed by username.
+
+    A per-process LRU answers most lookups with no I/O; Redis shares entries
+    between workers. Redis errors are treated as misses, so an outage falls
+    back to the database rather than failing authentication. Invalidation
+    clears Redis and this process's LRU; other workers may serve their local
+    copy for up to ``local_ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        client=async_redis_client,
+        ttl: int = settings.user_cache_ttl,
+        local_ttl: float = settings.user_cache_local_ttl,
+        local_size: int = settings.user_cache_local_size,
+        enabled: bool = settings.user_cache_enabled,
+    ):
+        self.client = client
+        self.ttl = ttl
+        self.local_ttl = local_ttl
+        self.local_size = local_size
+        self.enabled = enabled
+        self._local: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    async def get(self, username: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        entry = self._local.get(username)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._local.move_to_end(username)
+                self.hits += 1
+                return entry[1]
+            del self._local[username]
+        try:
+            raw = await self.client.get(KEY_PREFIX + username)
+        except redis.RedisError:
+            raw = None
+        if raw is None:
+            self.misses += 1
+            return None
+        data = json.loads(raw)
+        self._remember(username, data)
+        self.redis_hits += 1
+        return data
+
+    async def set(self, user: User) -> None:
+        if not self.enabled:
+            return
+        data = serialize_user(user)
+        self._remember(user.username, data)
+        try:
+            await self.client.set(KEY_PREFIX + user.username, json.dumps(data), ex=self.ttl)
+        except redis.RedisError:
+            pass
+
+    async def invalidate(self, username: str) -> None:
+        self._local.pop(username, None)
+        if not self.enabled:
+            return
+        try:
+            await self.client.delete(KEY_PREFIX + username)
+        except redis.RedisError:
+            pass
+
+    def _remember(self, username: str, data: Dict[str, Any]) -> None:
+        self._local[username] = (time.monotonic() + self.local_ttl, data)
+        self._local.move_to_end(username)
+        while len(self._local) > self.local_size:
+            self._local.popitem(last=False)
+
+    async def attach(self, db: AsyncSession, data: Dict[str, Any]) -> User:
+        """Build a User from cached fields and attach it to ``db`` without a query.
+
+        The result is a persistent instance like a loaded row, so services can
+        still modify and commit it. If ``db`` already holds this user, that
+        instance is returned instead. Relationships and EXCLUDED_FIELDS are left
+        unloaded: reading one synchronously raises MissingGreenlet under
+        asyncio, so load them on demand with
+        ``await db.refresh(user, attribute_names=[...])``, or use
+        user_service.get_generation_counts for live usage counters.
+        """
+        user = User(**deserialize_user(data))
+        make_transient_to_detached(user)
+        return await db.merge(user, load=False)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "local_hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "local_entries": len(self._local),
+        }
+
+
+user_cache = UserCache()
@@ -1,31 +1,40 @@
-from sqlalchemy.orm import Session
-from fastapi import Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from app.core.database import get_db
-from app.core.redis import get_redis
-from app.core.security import verify_token
-from app.services.user_service import get_user_by_username
+from app.config import settings
+from app.core.database import session_scope
+from app.core.rate_limit import SlidingWindowLimiter
+from app.core.redis import async_redis_client, get_redis
+from app.core.security import verify_token_async
+from app.services.user_service import get_user_for_auth
 from app.models.user import User
-from typing import Optional
+from typing import AsyncIterator, Dict, Optional, Tuple
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+rate_limiter = SlidingWindowLimiter(async_redis_client)
 
 
-def get_database() -> Session:
-    """Get a SQLAlchemy database session for dependency injection.
+async def get_database() -> AsyncIterator[AsyncSession]:
+    """Get an async SQLAlchemy session for dependency injection.
 
-    Creates and yields a new database session for each request using the
-    configured database connection pool.
+    Yields one session per request from the configured async connection
+    pool. FastAPI runs the generator's cleanup once the response is sent.
 
-    Returns:
-        Session: An active SQLAlchemy database session
+    Yields:
+        AsyncSession: An active async SQLAlchemy database session
 
     Note:
-        - Session is automatically closed after request completion
-        - Uses connection pooling for efficiency
+        - Session is closed and its connection returned to the pool after
+          the request completes; if the request raises, uncommitted work
+          is rolled back first
+        - Database calls are awaited, so they never block the event loop
         - Handled by FastAPI's dependency injection system
     """
-    return next(get_db())
+    # Not delegated to get_async_db(): an async for loop would not pass the
+    # request's exception into it, leaving the session open until GC.
+    async with session_scope() as session:
+        yield session
 
 
 def get_redis_client():
@@ -47,7 +56,7 @@ def get_redis_client():
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_database),
+    db: AsyncSession = Depends(get_database),
 ) -> User:
     """Validate JWT token and get the current authenticated user.
 
@@ -57,7 +66,7 @@ async def get_current_user(
     Args:
         credentials (HTTPAuthorizationCredentials): The Bearer token credentials
             extracted from the Authorization header
-        db (Session): SQLAlchemy database session
+        db (AsyncSession): Async SQLAlchemy database session
 
     Returns:
         User: The authenticated user object
@@ -70,7 +79,8 @@ async def get_current_user(
 
     Note:
         - Expects Bearer authentication scheme
-        - Verifies token signature and expiration
+        - Verifies token signature and expiration, and rejects revoked tokens
+        - User lookups are served from the user cache when possible
         - Used as a FastAPI dependency for protected endpoints
         - Automatically extracts token from Authorization header
 
@@ -88,12 +98,12 @@ async def get_current_user(
     )
 
     token = credentials.credentials
-    username = verify_token(token)
+    username = await verify_token_async(token)
 
     if username is None:
         raise credentials_exception
 
-    user = get_user_by_username(db, username=username)
+    user = await get_user_for_auth(db, username)
     if user is None:
         raise credentials_exception
 
@@ -140,7 +150,7 @@ async def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(
         HTTPBearer(auto_error=False)
     ),
-    db: Session = Depends(get_database),
+    db: AsyncSession = Depends(get_database),
 ) -> Optional[User]:
     """Attempt to get current user without requiring authentication.
 
@@ -151,7 +161,7 @@ async def get_optional_user(
     Args:
         credentials (Optional[HTTPAuthorizationCredentials]): Optional Bearer
             token credentials from Authorization header
-        db (Session): SQLAlchemy database session
+        db (AsyncSession): Async SQLAlchemy database session
 
     Returns:
         Optional[User]: The authenticated user object if valid credentials
@@ -176,10 +186,109 @@ async def get_optional_user(
         return None
 
     token = credentials.credentials
-    username = verify_token(token)
+    username = await verify_token_async(token)
 
     if username is None:
         return None
 
-    user = get_user_by_username(db, username=username)
+    user = await get_user_for_auth(db, username)
     return user
+
+
+class RateLimit:
+    """Sliding-window rate limit as a FastAPI dependency.
+
+    Counters are kept in Redis, so the quota is shared by every worker.
+    Without an explicit ``limit``, authenticated users get the quota for
+    their subscription plan (``settings.rate_limit_plans``) and anonymous
+    clients get ``settings.rate_limit_requests`` per IP address.
+
+    Args:
+        limit (Optional[int]): Fixed requests per window for every caller
+        window (Optional[int]): Window length in seconds, defaults to
+            ``settings.rate_limit_window``
+        scope (str): Name separating this quota from other RateLimit instances
+
+    Raises:
+        HTTPException: 429 Too Many Requests with a Retry-After header when
+            the caller is over quota
+
+    Note:
+        - Adds X-RateLimit-Limit and X-RateLimit-Remaining response headers
+        - The plan is read from the user cache; on a miss the user is
+          loaded once, which also warms the cache for the endpoint
+        - Falls back to a per-worker window if Redis is unreachable
+
+    Example:
+        ```python
+        @router.get("/search", dependencies=[Depends(RateLimit(30, 60, "search"))])
+        async def search():
+            ...
+        ```
+    """
+
+    def __init__(self, limit: Optional[int] = None, window: Optional[int] = None, scope: str = "api"):
+        self.limit = limit
+        self.window = window
+        self.scope = scope
+
+    async def identify(
+        self,
+        request: Request,
+        credentials: Optional[HTTPAuthorizationCredentials],
+        db: AsyncSession,
+    ) -> Tuple[str, int]:
+        username = await verify_token_async(credentials.credentials) if credentials else None
+        if username is not None:
+            if self.limit is not None:
+                return f"user:{username}", self.limit
+            user = await get_user_for_auth(db, username)
+            plan = (user.subscription_plan if user is not None else None) or "free"
+            limit = settings.rate_limit_plans.get(plan, settings.rate_limit_plans.get("free", settings.rate_limit_requests))
+            return f"user:{username}", limit
+        host = request.client.host if request.client else "unknown"
+        return f"ip:{host}", self.limit if self.limit is not None else settings.rate_limit_requests
+
+    async def __call__(
+        self,
+        request: Request,
+        response: Response,
+        credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+        db: AsyncSession = Depends(get_database),
+    ) -> None:
+        if not settings.rate_limit_enabled:
+            return
+        identity, limit = await self.identify(request, credentials, db)
+        window = self.window or settings.rate_limit_window
+        headers = await check_rate_limit(f"{self.scope}:{identity}", limit, window)
+        response.headers.update(headers)
+
+
+async def check_rate_limit(key: str, limit: int, window: float) -> Dict[str, str]:
+    """Count one request against ``limit`` per ``window`` seconds for ``key``.
+
+    Args:
+        key (str): Identity the quota belongs to, including its scope
+        limit (int): Requests allowed per window
+        window (float): Window length in seconds
+
+    Returns:
+        Dict[str, str]: X-RateLimit-Limit and X-RateLimit-Remaining headers
+
+    Raises:
+        HTTPException: 429 Too Many Requests with a Retry-After header when
+            ``key`` is over quota
+    """
+    result = await rate_limiter.hit(key, limit, window)
+    headers = {
+        "X-RateLimit-Limit": str(result.limit),
+        "X-RateLimit-Remaining": str(result.remaining),
+    }
+    if not result.allowed:
+        headers["Retry-After"] = str(max(1, int(result.retry_after + 0.999)))
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Rate limit exceeded",
+            headers=headers,
+        )
+    return headers
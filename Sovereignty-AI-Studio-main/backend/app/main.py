@@ -1,16 +1,43 @@
-from fastapi import FastAPI, Request, status
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
 from app.config import settings
 from app.api.v1.api import api_router
-import time
+from app.core.security import PasswordHasherBusy, password_hasher, token_cache
+from app.core.middleware import SecurityMiddleware
+from app.core.pagination import InvalidCursor
+from app.core.database import AsyncSessionLocal
+from app.dependencies import RateLimit, get_current_active_user, rate_limiter
+from app.services.generation_service import generation_cache, job_queue
+from app.services.user_service import flush_usage_counters, run_usage_accounting, usage_counter
+from app.workers.generation_worker import GenerationWorker
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the usage-counter flusher (and, with the in-memory job queue, a
+    generation worker) for the life of the process."""
+    flusher = asyncio.create_task(run_usage_accounting(AsyncSessionLocal, settings.usage_flush_interval))
+    worker = None
+    if settings.job_queue_backend == "memory":
+        worker = GenerationWorker(AsyncSessionLocal)
+        worker_task = asyncio.create_task(worker.run())
+    yield
+    if worker is not None:
+        worker.stop()
+        await worker_task
+    flusher.cancel()
+    # Let a pass that was mid-flush unwind (and release its lock) first.
+    with suppress(asyncio.CancelledError):
+        await flusher
+    # Write whatever accumulated since the last pass before exiting.
+    async with AsyncSessionLocal() as db:
+        await flush_usage_counters(db)
 
-# Initialize rate limiter
-limiter = Limiter(key_func=get_remote_address)
 
 app = FastAPI(
     title=settings.app_name,
@@ -18,63 +45,30 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
-# Add rate limiting state
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
-# Security Headers Middleware
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next):
-    """Add security headers to all responses."""
-    response = await call_next(request)
-    
-    # Prevent clickjacking
-    response.headers["X-Frame-Options"] = "DENY"
-    
-    # Prevent MIME type sniffing
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    
-    # Enable XSS protection
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    
-    # Content Security Policy
-    response.headers["Content-Security-Policy"] = "default-src 'self'"
-    
-    # Referrer Policy
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-    
-    # Permissions Policy
-    response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
-    
-    # HSTS (HTTP Strict Transport Security) - uncomment for HTTPS
-    # response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-    
-    return response
-
-# Request Size Limit Middleware
-@app.middleware("http")
-async def limit_request_size(request: Request, call_next):
-    """Limit the size of incoming requests to prevent DOS attacks."""
-    if request.headers.get("content-length"):
-        content_length = int(request.headers["content-length"])
-        if content_length > settings.max_request_size:
-            return JSONResponse(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                content={"detail": "Request body too large"}
-            )
-    return await call_next(request)
-
-# Request Timing Middleware (for monitoring)
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    """Add request processing time to response headers for monitoring."""
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-    return response
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    """Shed login/registration load when the bcrypt queue is full."""
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(InvalidCursor)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursor):
+    """A listing cursor that was not issued by a previous page."""
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": str(exc)},
+    )
+
+# Security headers, request-size limit and timing, as one pure ASGI middleware
+app.add_middleware(SecurityMiddleware, max_request_size=settings.max_request_size)
 
 # CORS Middleware
 app.add_middleware(
@@ -90,8 +84,7 @@ app.add_middleware(
 app.include_router(api_router, prefix="/api/v1")
 
 
-@app.get("/")
-@limiter.limit("10/minute")
+@app.get("/", dependencies=[Depends(RateLimit(10, 60, scope="root"))])
 async def root(request: Request):
     """Root endpoint with rate limiting."""
     return {"message": "Welcome to CreativeFlow AI"}
@@ -101,3 +94,16 @@ async def root(request: Request):
 async def health_check():
     """Health check endpoint (no rate limiting for monitoring)."""
     return {"status": "healthy", "version": "1.0.0"}
+
+
+@app.get("/stats", dependencies=[Depends(get_current_active_user)])
+async def internal_stats():
+    """Pool, cache, queue and limiter counters for this worker; requires login."""
+    return {
+        "password_hashing": password_hasher.stats(),
+        "token_cache": token_cache.stats(),
+        "rate_limit": rate_limiter.stats(),
+        "usage_counters": usage_counter.stats(),
+        "job_queue": job_queue.stats(),
+        "generation_cache": generation_cache.stats(),
+    }
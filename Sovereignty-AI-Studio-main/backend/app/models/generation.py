@@ -7,6 +7,7 @@ from sqlalchemy import (
     ForeignKey,
     JSON,
     Float,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -15,6 +16,10 @@ from app.core.database import Base
 
 class Generation(Base):
     __tablename__ = "generations"
+    __table_args__ = (
+        # Keyset pagination: newest-first listings per owner
+        Index("ix_generations_user_created", "user_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
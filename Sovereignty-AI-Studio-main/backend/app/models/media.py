@@ -7,6 +7,7 @@ from sqlalchemy import (
     ForeignKey,
     Boolean,
     BigInteger,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -15,6 +16,10 @@ from app.core.database import Base
 
 class Media(Base):
     __tablename__ = "media"
+    __table_args__ = (
+        # Keyset pagination: newest-first listings per project
+        Index("ix_media_project_created", "project_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
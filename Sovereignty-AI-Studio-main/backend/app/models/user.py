@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Float, Text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from app.core.database import Base
+from app.core.database import Base, utcnow
 
 
 class User(Base):
@@ -24,7 +24,12 @@ class User(Base):
     # Usage tracking
     total_generations = Column(Integer, default=0)
     monthly_generations = Column(Integer, default=0)
-    last_generation_reset = Column(DateTime, default=func.now())
+    last_generation_reset = Column(DateTime, default=utcnow())  # UTC, compared with month_start
+
+    # Generations served from the result cache, and what they would have cost
+    cached_generations = Column(Integer, default=0)
+    tokens_saved = Column(Integer, default=0)
+    cost_saved_usd = Column(Float, default=0.0)
 
     # Timestamps
     created_at = Column(DateTime, default=func.now())
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """One page of a keyset-paginated listing.
+
+    Pass ``next_cursor`` back as ``cursor`` to get the following page; it is
+    None on the last page.
+    """
+    items: List[T]
+    next_cursor: Optional[str] = None
@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
 from datetime import datetime
-from app.schemas.media import Media
+from app.schemas.media import Media, MediaListItem
 
 
 class ProjectBase(BaseModel):
@@ -55,5 +55,8 @@ class ProjectListItem(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    # Only present when the listing was asked to include media
+    media_files: Optional[List[MediaListItem]] = None
+
     class Config:
         from_attributes = True
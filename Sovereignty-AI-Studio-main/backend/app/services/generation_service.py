@@ -0,0 +1,207 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import load_only, selectinload
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from app.config import settings
+from app.core.generation_cache import GenerationCache, generation_key
+from app.core.jobs import Job, MemoryJobQueue, RedisJobQueue
+from app.core.pagination import DEFAULT_PAGE_SIZE, keyset_page, page_result
+from app.core.redis import async_redis_client
+from app.models.generation import Generation
+from app.schemas.generation import GenerationCreate
+from app.services.media_service import MEDIA_LIST_COLUMNS
+from app.services.user_service import increment_user_generations, record_cache_savings
+from datetime import datetime
+
+# Statuses after which a generation never changes again
+TERMINAL_STATUSES = {"completed", "failed"}
+
+job_queue = (
+    MemoryJobQueue()
+    if settings.job_queue_backend == "memory"
+    else RedisJobQueue(async_redis_client, visibility_timeout=settings.job_visibility_timeout)
+)
+generation_cache = GenerationCache(
+    async_redis_client,
+    ttl=settings.generation_cache_ttl,
+    max_entries=settings.generation_cache_max_entries,
+    enabled=settings.generation_cache_enabled,
+)
+
+
+def cache_key(generation: Generation) -> str:
+    """Result-cache key of a generation's request."""
+    return generation_key(generation.generation_type, generation.ai_service, generation.prompt, generation.parameters)
+
+# Columns behind GenerationListItem; result, parameters etc. stay unloaded
+GENERATION_LIST_COLUMNS = (
+    Generation.id,
+    Generation.generation_type,
+    Generation.prompt,
+    Generation.status,
+    Generation.created_at,
+    Generation.processing_time,
+)
+
+
+async def list_generations(
+    db: AsyncSession,
+    user_id: int,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    include_media: bool = False,
+) -> Tuple[List[Any], Optional[str]]:
+    """List a user's generations, newest first, with keyset pagination.
+
+    Args:
+        db (AsyncSession): Async SQLAlchemy database session
+        user_id (int): The ID of the user
+        cursor (Optional[str]): ``next_cursor`` from the previous page
+        limit (int): Maximum number of items to return
+        include_media (bool): Also load each generation's media files
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: The page's generations and the
+            cursor for the next page (None on the last page)
+
+    Raises:
+        InvalidCursor: If ``cursor`` was not produced by a previous page
+
+    Note:
+        Served by the (user_id, created_at, id) index, so deep pages cost
+        the same as the first. Without media the items are plain rows of the
+        list columns; with media they are Generation objects whose media
+        files come from one extra IN query for the whole page.
+    """
+    if include_media:
+        statement = select(Generation).options(
+            load_only(*GENERATION_LIST_COLUMNS),
+            selectinload(Generation.media_files).load_only(*MEDIA_LIST_COLUMNS),
+        )
+    else:
+        statement = select(*GENERATION_LIST_COLUMNS)
+
+    statement = keyset_page(
+        statement.where(Generation.user_id == user_id),
+        Generation.created_at, Generation.id, cursor, limit,
+    )
+    result = await db.execute(statement)
+    rows = result.scalars().all() if include_media else result.all()
+    return page_result(rows, limit)
+
+
+async def get_owned_generation(db: AsyncSession, generation_id: int, user_id: int) -> Optional[Generation]:
+    """Retrieve a generation by ID if it belongs to ``user_id``.
+
+    Args:
+        db (AsyncSession): Async SQLAlchemy database session
+        generation_id (int): The unique identifier of the generation
+        user_id (int): The ID of the user who must own it
+
+    Returns:
+        Optional[Generation]: The generation if found and owned, None otherwise
+    """
+    result = await db.execute(
+        select(Generation).where(Generation.id == generation_id, Generation.user_id == user_id)
+    )
+    return result.scalars().first()
+
+
+async def create_generation(db: AsyncSession, user_id: int, generation: GenerationCreate) -> Generation:
+    """Record a pending generation and queue it for a worker.
+
+    Args:
+        db (AsyncSession): Async SQLAlchemy database session
+        user_id (int): The ID of the requesting user
+        generation (GenerationCreate): Type, prompt, parameters and project
+
+    Returns:
+        Generation: The new generation, status ``pending``
+
+    Note:
+        Returns as soon as the job is queued; the AI work happens in a
+        generation worker. An identical request already in the result cache
+        is completed here without a job, and the user is credited with the
+        tokens and cost it saved. Counts against the user's generation
+        usage either way. The caller validates ``generation_type`` and
+        project ownership.
+    """
+    db_generation = Generation(
+        generation_type=generation.generation_type,
+        ai_service=settings.generation_services[generation.generation_type],
+        prompt=generation.prompt,
+        parameters=generation.parameters,
+        project_id=generation.project_id,
+        user_id=user_id,
+        status="pending",
+    )
+    cached = await generation_cache.get(cache_key(db_generation))
+    if cached is not None:
+        now = datetime.utcnow()
+        db_generation.status = "completed"
+        db_generation.result = cached.result
+        db_generation.tokens_used = 0
+        db_generation.cost_usd = 0.0
+        db_generation.processing_time = 0.0
+        db_generation.started_at = now
+        db_generation.completed_at = now
+
+    db.add(db_generation)
+    await db.commit()
+    await db.refresh(db_generation)
+    if cached is None:
+        await job_queue.enqueue(Job(db_generation.id, db_generation.generation_type))
+    else:
+        await record_cache_savings(db, user_id, cached.tokens_used, cached.cost_usd)
+    await increment_user_generations(db, user_id)
+    return db_generation
+
+
+def status_event(generation: Generation) -> Dict[str, Any]:
+    """The status fields of a generation, JSON-ready, as sent to status streams."""
+    return {
+        "id": generation.id,
+        "status": generation.status,
+        "retry_count": generation.retry_count,
+        "error_message": generation.error_message,
+        "processing_time": generation.processing_time,
+        "started_at": generation.started_at.isoformat() if generation.started_at else None,
+        "completed_at": generation.completed_at.isoformat() if generation.completed_at else None,
+    }
+
+
+async def generation_events(
+    session_factory: async_sessionmaker,
+    generation_id: int,
+    heartbeat: float = 15.0,
+) -> AsyncIterator[Optional[Dict[str, Any]]]:
+    """Status events for a generation until it completes or fails.
+
+    Args:
+        session_factory (async_sessionmaker): Opens the session for the
+            initial snapshot (the request's session is gone once a
+            streaming response starts)
+        generation_id (int): The generation to follow
+        heartbeat (float): Idle seconds between keep-alive ``None`` values
+
+    Yields:
+        Optional[Dict[str, Any]]: The current status first, then each change
+            published by workers; None as a keep-alive
+
+    Note:
+        Subscribes before reading the snapshot, so a change made in between
+        is delivered (possibly after a snapshot that already shows it).
+    """
+    async with job_queue.subscribe(generation_id, heartbeat=heartbeat) as events:
+        async with session_factory() as db:
+            generation = await db.get(Generation, generation_id)
+        if generation is None:
+            return
+        snapshot = status_event(generation)
+        yield snapshot
+        if snapshot["status"] in TERMINAL_STATUSES:
+            return
+        async for event in events:
+            yield event
+            if event is not None and event["status"] in TERMINAL_STATUSES:
+                return
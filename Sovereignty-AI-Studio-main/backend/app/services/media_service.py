@@ -0,0 +1,49 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, List, Optional, Tuple
+from app.core.pagination import DEFAULT_PAGE_SIZE, keyset_page, page_result
+from app.models.media import Media
+
+# Columns behind MediaListItem (plus the foreign keys eager loads join on)
+MEDIA_LIST_COLUMNS = (
+    Media.id,
+    Media.filename,
+    Media.file_type,
+    Media.file_size,
+    Media.created_at,
+    Media.project_id,
+    Media.generation_id,
+)
+
+
+async def list_project_media(
+    db: AsyncSession,
+    project_id: int,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Tuple[List[Any], Optional[str]]:
+    """List a project's media, newest first, with keyset pagination.
+
+    Args:
+        db (AsyncSession): Async SQLAlchemy database session
+        project_id (int): The project whose media to list
+        cursor (Optional[str]): ``next_cursor`` from the previous page
+        limit (int): Maximum number of items to return
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: Rows with the MediaListItem columns,
+            and the cursor for the next page (None on the last page)
+
+    Raises:
+        InvalidCursor: If ``cursor`` was not produced by a previous page
+
+    Note:
+        Served by the (project_id, created_at, id) index. Ownership of the
+        project is the caller's responsibility.
+    """
+    statement = keyset_page(
+        select(*MEDIA_LIST_COLUMNS).where(Media.project_id == project_id),
+        Media.created_at, Media.id, cursor, limit,
+    )
+    rows = (await db.execute(statement)).all()
+    return page_result(rows, limit)
@@ -0,0 +1,81 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, selectinload
+from typing import Any, List, Optional, Tuple
+from app.core.pagination import DEFAULT_PAGE_SIZE, keyset_page, page_result
+from app.models.project import Project
+from app.services.media_service import MEDIA_LIST_COLUMNS
+
+# Columns behind ProjectListItem; settings, metadata and content stay unloaded
+PROJECT_LIST_COLUMNS = (
+    Project.id,
+    Project.title,
+    Project.description,
+    Project.project_type,
+    Project.status,
+    Project.created_at,
+    Project.updated_at,
+)
+
+
+async def get_owned_project(db: AsyncSession, project_id: int, owner_id: int) -> Optional[Project]:
+    """Retrieve a project by ID if it belongs to ``owner_id``.
+
+    Args:
+        db (AsyncSession): Async SQLAlchemy database session
+        project_id (int): The unique identifier of the project
+        owner_id (int): The ID of the user who must own it
+
+    Returns:
+        Optional[Project]: The project if found and owned, None otherwise
+    """
+    result = await db.execute(
+        select(Project).where(Project.id == project_id, Project.owner_id == owner_id)
+    )
+    return result.scalars().first()
+
+
+async def list_projects(
+    db: AsyncSession,
+    owner_id: int,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    include_media: bool = False,
+) -> Tuple[List[Any], Optional[str]]:
+    """List a user's projects, newest first, with keyset pagination.
+
+    Args:
+        db (AsyncSession): Async SQLAlchemy database session
+        owner_id (int): The ID of the owning user
+        cursor (Optional[str]): ``next_cursor`` from the previous page
+        limit (int): Maximum number of items to return
+        include_media (bool): Also load each project's media files
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: The page's projects and the cursor
+            for the next page (None on the last page)
+
+    Raises:
+        InvalidCursor: If ``cursor`` was not produced by a previous page
+
+    Note:
+        Served by the (owner_id, created_at, id) index, so deep pages cost
+        the same as the first. Without media the items are plain rows of the
+        list columns; with media they are Project objects whose media files
+        come from one extra IN query for the whole page.
+    """
+    if include_media:
+        statement = select(Project).options(
+            load_only(*PROJECT_LIST_COLUMNS),
+            selectinload(Project.media_files).load_only(*MEDIA_LIST_COLUMNS),
+        )
+    else:
+        statement = select(*PROJECT_LIST_COLUMNS)
+
+    statement = keyset_page(
+        statement.where(Project.owner_id == owner_id),
+        Project.created_at, Project.id, cursor, limit,
+    )
+    result = await db.execute(statement)
+    rows = result.scalars().all() if include_media else result.all()
+    return page_result(rows, limit)
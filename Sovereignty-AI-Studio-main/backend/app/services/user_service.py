@@ -1,90 +1,151 @@
-from sqlalchemy.orm import Session
+import asyncio
+import logging
+from sqlalchemy import Integer, Row, bindparam, column, func, or_, select, update, values
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.exc import IntegrityError
-from typing import Optional
+from typing import Any, Dict, Optional
+from app.config import settings
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password
+from app.core.redis import async_redis_client
+from app.core.security import get_password_hash_async, verify_password_async
+from app.core.usage import UsageCounter
+from app.core.database import utcnow
+from app.core.user_cache import user_cache
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
 
-def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
+users_table = User.__table__
+usage_counter = UsageCounter(async_redis_client, lock_ttl=settings.usage_flush_lock_ttl)
+
+
+async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
     """Retrieve a user from the database by their ID.
 
     Args:
-        db (Session): SQLAlchemy database session
+        db (AsyncSession): Async SQLAlchemy database session
         user_id (int): The unique identifier of the user
 
     Returns:
         Optional[User]: The user object if found, None otherwise
     """
-    return db.query(User).filter(User.id == user_id).first()
+    return await db.get(User, user_id)
 
 
-def get_user_by_email(db: Session, email: str) -> Optional[User]:
+async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     """Retrieve a user from the database by their email address.
 
     Args:
-        db (Session): SQLAlchemy database session
+        db (AsyncSession): Async SQLAlchemy database session
         email (str): The email address to search for
 
     Returns:
         Optional[User]: The user object if found, None otherwise
     """
-    return db.query(User).filter(User.email == email).first()
+    result = await db.execute(select(User).where(User.email == email))
+    return result.scalars().first()
 
 
-def get_user_by_username(db: Session, username: str) -> Optional[User]:
+async def get_user_by_username(db: AsyncSession, username: str) -> Optional[User]:
     """Retrieve a user from the database by their username.
 
     Args:
-        db (Session): SQLAlchemy database session
+        db (AsyncSession): Async SQLAlchemy database session
         username (str): The username to search for
 
     Returns:
         Optional[User]: The user object if found, None otherwise
     """
-    return db.query(User).filter(User.username == username).first()
+    result = await db.execute(select(User).where(User.username == username))
+    return result.scalars().first()
+
+
+async def get_user_for_auth(db: AsyncSession, username: str) -> Optional[User]:
+    """Resolve the user behind a verified token, from cache when possible.
+
+    Args:
+        db (AsyncSession): Async SQLAlchemy database session
+        username (str): The username from the token subject
+
+    Returns:
+        Optional[User]: The user attached to ``db``, or None if not found
+
+    Note:
+        Cache hits cost no database round trip; the user is rebuilt from the
+        cached fields and attached to the session. Misses load the row and
+        populate the cache. Cached users do not carry the password hash.
+    """
+    cached = await user_cache.get(username)
+    if cached is not None:
+        return await user_cache.attach(db, cached)
 
+    user = await get_user_by_username(db, username)
+    if user is not None:
+        await user_cache.set(user)
+    return user
+
+
+# The only columns the login path reads; bio, avatar_url etc. stay on disk.
+AUTH_COLUMNS = (User.id, User.username, User.hashed_password, User.is_active)
 
-def authenticate_user(
-    db: Session,
+
+async def get_auth_credentials(db: AsyncSession, identifier: str) -> Optional[Row]:
+    """Look up login credentials by username or email in a single query.
+
+    Args:
+        db (AsyncSession): Async SQLAlchemy database session
+        identifier (str): A username or an email address
+
+    Returns:
+        Optional[Row]: Row with ``id``, ``username``, ``hashed_password`` and
+                       ``is_active``, or None if no user matches
+
+    Note:
+        Usernames cannot contain "@" (see UserBase) and emails always do, so
+        the identifier picks the column and the query is a single probe of
+        that column's unique index.
+    """
+    column = User.email if "@" in identifier else User.username
+    result = await db.execute(select(*AUTH_COLUMNS).where(column == identifier))
+    return result.first()
+
+
+async def authenticate_user(
+    db: AsyncSession,
     username: str,
     password: str,
-) -> Optional[User]:
+) -> Optional[Row]:
     """Authenticate a user using their username/email and password.
 
-    Attempts to authenticate using the provided credentials. First tries to
-    find the user by username, then by email if username lookup fails.
-
     Args:
-        db (Session): SQLAlchemy database session
+        db (AsyncSession): Async SQLAlchemy database session
         username (str): The username or email to authenticate with
         password (str): The plain text password to verify
 
     Returns:
-        Optional[User]: Authenticated user object if successful, None otherwise
-    """
-    # Try to find user by username first
-    user = get_user_by_username(db, username)
-
-    # If not found, try by email
-    if not user:
-        user = get_user_by_email(db, username)
+        Optional[Row]: The credentials row from get_auth_credentials if the
+                       password matches, None otherwise
 
-    if not user:
+    Note:
+        Does not check ``is_active``; callers decide how to report inactive
+        accounts.
+    """
+    credentials = await get_auth_credentials(db, username)
+    if credentials is None:
         return None
 
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password_async(password, credentials.hashed_password):
         return None
 
-    return user
+    return credentials
 
 
-def create_user(db: Session, user: UserCreate) -> Optional[User]:
+async def create_user(db: AsyncSession, user: UserCreate) -> Optional[User]:
     """Create a new user in the database.
 
     Args:
-        db (Session): SQLAlchemy database session
+        db (AsyncSession): Async SQLAlchemy database session
         user (UserCreate): Pydantic model containing the new user's information
 
     Returns:
@@ -96,7 +157,7 @@ def create_user(db: Session, user: UserCreate) -> Optional[User]:
         Performs automatic rollback on integrity errors (ex: duplicate emails)
     """
     try:
-        hashed_password = get_password_hash(user.password)
+        hashed_password = await get_password_hash_async(user.password)
         db_user = User(
             email=user.email,
             username=user.username,
@@ -106,23 +167,23 @@ def create_user(db: Session, user: UserCreate) -> Optional[User]:
             hashed_password=hashed_password,
         )
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await db.refresh(db_user)
         return db_user
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         return None
 
 
-def update_user(
-    db: Session,
+async def update_user(
+    db: AsyncSession,
     user_id: int,
     user_update: UserUpdate,
 ) -> Optional[User]:
     """Update an existing user's information.
 
     Args:
-        db (Session): SQLAlchemy database session
+        db (AsyncSession): Async SQLAlchemy database session
         user_id (int): The ID of the user to update
         user_update (UserUpdate): Pydantic model containing the fields to update
 
@@ -133,8 +194,9 @@ def update_user(
         Only updates fields that are provided in the user_update object
         Automatically updates the updated_at timestamp
         Uses a whitelist to prevent privilege escalation
+        Evicts the user from the authentication cache
     """
-    db_user = get_user_by_id(db, user_id)
+    db_user = await get_user_by_id(db, user_id)
     if not db_user:
         return None
 
@@ -147,61 +209,287 @@ def update_user(
             setattr(db_user, field, value)
 
     db_user.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    await user_cache.invalidate(db_user.username)
     return db_user
 
 
-def update_last_login(db: Session, user_id: int) -> None:
+async def update_last_login(db: AsyncSession, user_id: int) -> None:
     """Update the last login timestamp for a user.
 
     Args:
-        db (Session): SQLAlchemy database session
+        db (AsyncSession): Async SQLAlchemy database session
         user_id (int): The ID of the user to update
 
     Note:
         Silently fails if the user is not found
         Updates the last_login field to current UTC timestamp
     """
-    db_user = get_user_by_id(db, user_id)
+    db_user = await get_user_by_id(db, user_id)
     if db_user:
         db_user.last_login = datetime.utcnow()
-        db.commit()
+        await db.commit()
+        await user_cache.invalidate(db_user.username)
+
+
+def month_start(now: datetime) -> datetime:
+    return now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
 
-def increment_user_generations(db: Session, user_id: int) -> None:
-    """Increment the generation counters for a user.
+async def db_utcnow(db: AsyncSession) -> datetime:
+    """The database's current UTC time, the clock usage resets are kept on."""
+    return await db.scalar(select(utcnow()))
 
-    Increases both total_generations and monthly_generations counts by 1.
+
+async def increment_user_generations(db: AsyncSession, user_id: int) -> None:
+    """Count one generation for a user.
+
+    Increases both total_generations and monthly_generations by 1.
 
     Args:
-        db (Session): SQLAlchemy database session
+        db (AsyncSession): Async SQLAlchemy database session
         user_id (int): The ID of the user to update
 
     Note:
-        Silently fails if the user is not found
-        Updates both total and monthly generation counts
+        The increment is an atomic HINCRBY in Redis; flush_usage_counters
+        writes the totals to the database in bulk. If Redis is unavailable
+        the counters are incremented in place with one UPDATE instead.
+        Database columns (and cached users) lag until the next flush; use
+        get_generation_counts for live values.
     """
-    db_user = get_user_by_id(db, user_id)
-    if db_user:
-        db_user.total_generations += 1
-        db_user.monthly_generations += 1
-        db.commit()
+    if await usage_counter.increment(user_id):
+        return
+    await db.execute(
+        update(users_table)
+        .where(users_table.c.id == user_id)
+        .values(
+            total_generations=users_table.c.total_generations + 1,
+            monthly_generations=users_table.c.monthly_generations + 1,
+        )
+    )
+    await db.commit()
 
 
-def reset_monthly_generations(db: Session, user_id: int) -> None:
-    """Reset the monthly generation count for a user.
+async def apply_usage_deltas(db: AsyncSession, deltas: Dict[int, int]) -> None:
+    """Add per-user generation deltas to the counters, in bulk.
 
     Args:
-        db (Session): SQLAlchemy database session
-        user_id (int): The ID of the user to reset
+        db (AsyncSession): Async SQLAlchemy database session
+        deltas (Dict[int, int]): Generations to add, by user ID
 
     Note:
-        Silently fails if the user is not found
-        Sets monthly_generations to 0 and updates last_generation_reset timestamp
+        PostgreSQL gets one ``UPDATE ... FROM (VALUES ...)`` statement per
+        ``usage_flush_batch`` users; other databases an executemany UPDATE.
+        Does not commit.
     """
-    db_user = get_user_by_id(db, user_id)
-    if db_user:
-        db_user.monthly_generations = 0
-        db_user.last_generation_reset = datetime.utcnow()
-        db.commit()
+    rows = list(deltas.items())
+    step = settings.usage_flush_batch
+    if db.bind.dialect.name == "postgresql":
+        for i in range(0, len(rows), step):
+            batch = values(column("id", Integer), column("delta", Integer), name="usage_delta").data(rows[i:i + step])
+            await db.execute(
+                update(users_table)
+                .where(users_table.c.id == batch.c.id)
+                .values(
+                    total_generations=users_table.c.total_generations + batch.c.delta,
+                    monthly_generations=users_table.c.monthly_generations + batch.c.delta,
+                )
+            )
+        return
+
+    statement = (
+        update(users_table)
+        .where(users_table.c.id == bindparam("user_id"))
+        .values(
+            total_generations=users_table.c.total_generations + bindparam("delta"),
+            monthly_generations=users_table.c.monthly_generations + bindparam("delta"),
+        )
+    )
+    for i in range(0, len(rows), step):
+        await db.execute(statement, [{"user_id": user_id, "delta": delta} for user_id, delta in rows[i:i + step]])
+
+
+async def flush_usage_counters(db: AsyncSession) -> int:
+    """Write the generation counts accumulated in Redis to the database.
+
+    Args:
+        db (AsyncSession): Async SQLAlchemy database session
+
+    Returns:
+        int: Number of users updated (0 if another worker is flushing)
+
+    Note:
+        On failure the transaction is rolled back and the same batch is
+        retried on the next flush.
+    """
+    async with usage_counter.batch() as deltas:
+        if deltas:
+            try:
+                await apply_usage_deltas(db, deltas)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+    return len(deltas)
+
+
+async def reset_monthly_generations(
+    db: AsyncSession,
+    user_id: Optional[int] = None,
+    *,
+    now: Optional[datetime] = None,
+) -> int:
+    """Reset monthly generation counts.
+
+    Args:
+        db (AsyncSession): Async SQLAlchemy database session
+        user_id (Optional[int]): Reset only this user, unconditionally (the
+            original single-user behaviour). By default every user not yet
+            reset this month is reset.
+        now (Optional[datetime]): Current UTC time, defaults to the
+            database's clock (see db_utcnow)
+
+    Returns:
+        int: Number of users reset
+
+    Note:
+        The all-users form is one set-based UPDATE, safe to run repeatedly:
+        users already reset since the start of the month are skipped.
+        Pending counters are flushed first so last month's generations are
+        not carried over.
+    """
+    now = now or await db_utcnow(db)
+    await flush_usage_counters(db)
+    if user_id is not None:
+        condition = users_table.c.id == user_id
+    else:
+        condition = or_(
+            users_table.c.last_generation_reset < month_start(now),
+            users_table.c.last_generation_reset.is_(None),
+        )
+    result = await db.execute(
+        update(users_table)
+        .where(condition)
+        .values(monthly_generations=0, last_generation_reset=now)
+    )
+    await db.commit()
+    return result.rowcount
+
+
+async def record_cache_savings(db: AsyncSession, user_id: int, tokens: Optional[int], cost: Optional[float]) -> None:
+    """Credit a user with a generation served from the result cache.
+
+    Args:
+        db (AsyncSession): Async SQLAlchemy database session
+        user_id (int): The ID of the user whose generation was served
+        tokens (Optional[int]): Tokens the original AI call used
+        cost (Optional[float]): What the original AI call cost, in USD
+
+    Note:
+        One atomic UPDATE, safe under concurrent hits.
+    """
+    await db.execute(
+        update(users_table)
+        .where(users_table.c.id == user_id)
+        .values(
+            cached_generations=func.coalesce(users_table.c.cached_generations, 0) + 1,
+            tokens_saved=func.coalesce(users_table.c.tokens_saved, 0) + (tokens or 0),
+            cost_saved_usd=func.coalesce(users_table.c.cost_saved_usd, 0.0) + (cost or 0.0),
+        )
+    )
+    await db.commit()
+
+
+async def get_generation_counts(db: AsyncSession, user_id: int) -> Dict[str, Any]:
+    """Live generation counts: the stored counters plus unflushed increments.
+
+    Args:
+        db (AsyncSession): Async SQLAlchemy database session
+        user_id (int): The ID of the user
+
+    Returns:
+        Dict[str, Any]: ``total_generations`` and ``monthly_generations``,
+            plus the result-cache savings ``cached_generations``,
+            ``tokens_saved`` and ``cost_saved_usd``
+    """
+    result = await db.execute(
+        select(
+            User.total_generations,
+            User.monthly_generations,
+            User.last_generation_reset,
+            User.cached_generations,
+            User.tokens_saved,
+            User.cost_saved_usd,
+            utcnow().label("now"),
+        )
+        .where(User.id == user_id)
+    )
+    row = result.first()
+    pending = await usage_counter.pending(user_id)
+    if row is None:
+        return {
+            "total_generations": pending,
+            "monthly_generations": pending,
+            "cached_generations": 0,
+            "tokens_saved": 0,
+            "cost_saved_usd": 0.0,
+        }
+
+    monthly = row.monthly_generations or 0
+    # The monthly reset has not reached this user yet.
+    if row.last_generation_reset is not None and row.last_generation_reset < month_start(row.now):
+        monthly = 0
+    return {
+        "total_generations": (row.total_generations or 0) + pending,
+        "monthly_generations": monthly + pending,
+        "cached_generations": row.cached_generations or 0,
+        "tokens_saved": row.tokens_saved or 0,
+        "cost_saved_usd": row.cost_saved_usd or 0.0,
+    }
+
+
+async def run_usage_accounting(session_factory: async_sessionmaker, interval: float) -> None:
+    """Flush usage counters every ``interval`` seconds until cancelled.
+
+    Also runs reset_monthly_generations on the first pass and whenever the
+    month changes by the database's UTC clock. Errors are logged and the
+    loop keeps going.
+    """
+    reset_month = None
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with session_factory() as db:
+                this_month = month_start(await db_utcnow(db))
+                if this_month != reset_month:
+                    await reset_monthly_generations(db)
+                    reset_month = this_month
+                else:
+                    await flush_usage_counters(db)
+        except Exception:
+            logger.exception("Usage counter flush failed")
+
+
+async def deactivate_user(db: AsyncSession, user_id: int) -> Optional[User]:
+    """Deactivate a user account.
+
+    Args:
+        db (AsyncSession): Async SQLAlchemy database session
+        user_id (int): The ID of the user to deactivate
+
+    Returns:
+        Optional[User]: The deactivated user, None if user not found
+
+    Note:
+        Evicts the user from the authentication cache so the next request
+        with their token sees is_active=False
+    """
+    db_user = await get_user_by_id(db, user_id)
+    if not db_user:
+        return None
+
+    db_user.is_active = False
+    await db.commit()
+    await user_cache.invalidate(db_user.username)
+    return db_user
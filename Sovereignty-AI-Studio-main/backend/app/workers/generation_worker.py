@@ -0,0 +1,281 @@
+# app/workers/generation_worker.py
+"""Generation worker: takes queued generations and runs their AI work.
+
+Run one or more worker processes next to the API:
+    python -m app.workers.generation_worker
+
+With JOB_QUEUE_BACKEND=memory the API runs a worker in-process instead
+(see app.main), which is what tests use.
+"""
+
+import asyncio
+import logging
+import signal
+from dataclasses import dataclass
+from datetime import datetime
+from time import perf_counter
+from typing import Awaitable, Callable, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.generation_cache import CachedGeneration
+from app.core.jobs import Job
+from app.models.generation import Generation
+from app.services.generation_service import (
+    TERMINAL_STATUSES,
+    cache_key,
+    generation_cache,
+    job_queue,
+    status_event,
+)
+from app.services.user_service import record_cache_savings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GenerationOutput:
+    result: str  # generated text, or a reference to the stored file
+    tokens_used: Optional[int] = None
+    cost_usd: Optional[float] = None
+
+
+class PermanentGenerationError(Exception):
+    """Raised by a handler for failures a retry cannot fix (e.g. a rejected prompt)."""
+
+
+Handler = Callable[[Generation], Awaitable[GenerationOutput]]
+
+# generation_type -> coroutine doing the AI work; see register_handler
+HANDLERS: Dict[str, Handler] = {}
+
+
+def register_handler(generation_type: str) -> Callable[[Handler], Handler]:
+    """Decorator registering the AI handler for a generation type.
+
+    The handler receives the Generation (detached: read its fields, don't
+    lazy-load relationships) and returns a GenerationOutput. Any exception
+    is retried with backoff, except PermanentGenerationError.
+    """
+    def decorator(handler: Handler) -> Handler:
+        HANDLERS[generation_type] = handler
+        return handler
+    return decorator
+
+
+def retry_delay(attempt: int) -> float:
+    """Seconds to wait before retry number ``attempt + 1`` (exponential, capped)."""
+    return min(settings.generation_retry_backoff * 2 ** attempt, settings.generation_retry_backoff_max)
+
+
+class GenerationWorker:
+    """Consumes generation jobs with a fixed concurrency per generation type.
+
+    ``concurrency`` maps each type to the number of jobs of that type this
+    process works on at once; types not listed are not consumed. The
+    database session is only used around the AI call, so no connection is
+    held while a handler runs. Identical requests are served from
+    ``cache`` (see process).
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        queue=job_queue,
+        cache=generation_cache,
+        concurrency: Optional[Dict[str, int]] = None,
+        handlers: Dict[str, Handler] = HANDLERS,
+        max_retries: int = settings.generation_max_retries,
+    ):
+        self.session_factory = session_factory
+        self.queue = queue
+        self.cache = cache
+        self.concurrency = concurrency if concurrency is not None else settings.generation_concurrency
+        self.handlers = handlers
+        self.max_retries = max_retries
+        self._stopping = False
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+
+    async def run(self) -> None:
+        """Consume until stop() is called; in-progress jobs are finished first."""
+        await asyncio.gather(*(
+            self.consume(generation_type)
+            for generation_type, slots in self.concurrency.items()
+            for _ in range(slots)
+        ))
+
+    def stop(self) -> None:
+        self._stopping = True
+
+    async def consume(self, generation_type: str) -> None:
+        while not self._stopping:
+            try:
+                job = await self.queue.dequeue(generation_type, timeout=1.0)
+            except Exception:
+                logger.exception("Dequeue failed for %s jobs", generation_type)
+                await asyncio.sleep(1.0)
+                continue
+            if job is None:
+                continue
+            try:
+                await self.process(job)
+            except Exception as exc:
+                logger.exception("Generation %s crashed the worker loop", job.generation_id)
+                try:
+                    await self.reschedule(job, exc)
+                except Exception:
+                    # Left on the processing list; the queue hands it out
+                    # again once its visibility timeout lapses.
+                    logger.exception("Could not reschedule generation %s", job.generation_id)
+                    continue
+            await self.queue.ack(job)
+
+    async def reschedule(self, job: Job, exc: Exception) -> None:
+        """Retry a job whose processing raised, with backoff, or fail it.
+
+        Handler errors are dealt with in attempt(); this covers everything
+        around them (database, cache or queue errors), so a job is never
+        silently dropped. Out of retries, the generation is marked failed.
+        """
+        if job.attempt < self.max_retries:
+            self.retried += 1
+            await self.queue.enqueue(
+                Job(job.generation_id, job.generation_type, job.attempt + 1), delay=retry_delay(job.attempt)
+            )
+            return
+        async with self.session_factory() as db:
+            generation = await db.get(Generation, job.generation_id)
+            if generation is None or generation.status in TERMINAL_STATUSES:
+                return
+            generation.status = "failed"
+            generation.error_message = str(exc) or type(exc).__name__
+            generation.completed_at = datetime.utcnow()
+            await db.commit()
+        self.failed += 1
+        await self.queue.publish(generation.id, {**status_event(generation), "retry_in": None})
+
+    async def process(self, job: Job) -> None:
+        """Run one attempt of a generation and record the outcome.
+
+        Identical requests share one AI call: a cached result completes the
+        generation at once, and while another worker holds the lease for the
+        same request the job is requeued to pick up its result.
+        """
+        retry_in = None
+        async with self.session_factory() as db:
+            generation = await db.get(Generation, job.generation_id)
+            if generation is None or generation.status in TERMINAL_STATUSES:
+                return
+
+            key = cache_key(generation)
+            cached = await self.cache.get(key)
+            if cached is not None:
+                await self.complete_from_cache(db, generation, cached)
+                return
+            holder = str(generation.id)
+            # Outlives the handler timeout, so only a crashed holder lets it lapse.
+            if not await self.cache.acquire(key, holder, lease=settings.generation_timeout + 30):
+                self.coalesced += 1
+                await self.queue.enqueue(job, delay=settings.generation_coalesce_poll)
+                return
+            try:
+                retry_in = await self.attempt(db, generation, job, key)
+            finally:
+                await self.cache.release(key, holder)
+
+        if retry_in is not None:
+            await self.queue.enqueue(Job(job.generation_id, job.generation_type, job.attempt + 1), delay=retry_in)
+        await self.queue.publish(generation.id, {**status_event(generation), "retry_in": retry_in})
+
+    async def attempt(self, db: AsyncSession, generation: Generation, job: Job, key: str) -> Optional[float]:
+        """Call the handler; returns the retry delay, or None if the generation is done."""
+        generation.status = "processing"
+        generation.started_at = datetime.utcnow()
+        generation.retry_count = job.attempt
+        await db.commit()
+        await self.queue.publish(generation.id, status_event(generation))
+
+        start = perf_counter()
+        retry_in = None
+        try:
+            handler = self.handlers.get(generation.generation_type)
+            if handler is None:
+                raise PermanentGenerationError(
+                    f"No handler registered for generation type '{generation.generation_type}'"
+                )
+            output = await asyncio.wait_for(handler(generation), settings.generation_timeout)
+        except Exception as exc:
+            generation.error_message = str(exc) or type(exc).__name__
+            if isinstance(exc, PermanentGenerationError) or job.attempt >= self.max_retries:
+                generation.status = "failed"
+                generation.completed_at = datetime.utcnow()
+                self.failed += 1
+            else:
+                generation.status = "pending"
+                generation.retry_count = job.attempt + 1
+                retry_in = retry_delay(job.attempt)
+                self.retried += 1
+            output = None
+        else:
+            generation.status = "completed"
+            generation.result = output.result
+            generation.tokens_used = output.tokens_used
+            generation.cost_usd = output.cost_usd
+            generation.error_message = None
+            generation.completed_at = datetime.utcnow()
+            self.completed += 1
+        generation.processing_time = perf_counter() - start
+        await db.commit()
+
+        if output is not None:
+            # Stored before the lease is released, so waiting duplicates find it.
+            await self.cache.set(
+                key, CachedGeneration(output.result, output.tokens_used, output.cost_usd, generation.id)
+            )
+        return retry_in
+
+    async def complete_from_cache(self, db: AsyncSession, generation: Generation, cached: CachedGeneration) -> None:
+        """Complete a generation with an identical request's result, at no AI cost."""
+        now = datetime.utcnow()
+        generation.status = "completed"
+        generation.result = cached.result
+        generation.tokens_used = 0
+        generation.cost_usd = 0.0
+        generation.error_message = None
+        generation.processing_time = 0.0
+        generation.started_at = generation.started_at or now
+        generation.completed_at = now
+        await db.commit()
+        await record_cache_savings(db, generation.user_id, cached.tokens_used, cached.cost_usd)
+        self.cache_hits += 1
+        await self.queue.publish(generation.id, {**status_event(generation), "retry_in": None})
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "completed": self.completed,
+            "failed": self.failed,
+            "retried": self.retried,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+        }
+
+
+async def main() -> None:
+    from app.core.database import AsyncSessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    worker = GenerationWorker(AsyncSessionLocal)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+    logger.info("Generation worker consuming %s", worker.concurrency)
+    await worker.run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
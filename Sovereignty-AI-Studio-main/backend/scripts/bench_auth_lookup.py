@@ -0,0 +1,132 @@
+# scripts/bench_auth_lookup.py
+"""Login lookup latency: two full-row queries vs. one narrow query.
+
+Seeds --users users (with realistic ~500 character bios) into the database
+from DATABASE_URL, then times the credential lookup a login performs:
+
+- legacy: get_user_by_username, then get_user_by_email on a miss, loading
+  every column (the old authenticate_user)
+- single: get_auth_credentials, one indexed query returning four columns
+
+for logins by username, by email and for unknown identifiers. bcrypt is
+left out of the timed loop (it costs the same on both paths); one verify is
+reported separately for scale.
+
+Seeding is skipped when the table already holds enough bench users, so
+repeated runs against the same database are cheap.
+
+Example:
+    PYTHONPATH=. python scripts/bench_auth_lookup.py --users 1000000 --lookups 2000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+async def seed(session_factory, users: int, batch: int, hashed_password: str) -> int:
+    from sqlalchemy import func, insert, select
+    from app.models.user import User
+
+    async with session_factory() as db:
+        existing = await db.scalar(select(func.count()).select_from(User).where(User.username.like("bench%")))
+        if existing >= users:
+            return 0
+        bio = "lorem ipsum dolor sit amet " * 18
+        for start in range(existing, users, batch):
+            rows = [
+                {
+                    "username": f"bench{i}",
+                    "email": f"bench{i}@example.com",
+                    "full_name": f"Bench User {i}",
+                    "hashed_password": hashed_password,
+                    "bio": bio,
+                    "is_active": True,
+                }
+                for i in range(start, min(start + batch, users))
+            ]
+            await db.execute(insert(User), rows)
+            await db.commit()
+        return users - existing
+
+
+async def legacy_lookup(db, identifier):
+    from app.services.user_service import get_user_by_email, get_user_by_username
+
+    user = await get_user_by_username(db, identifier)
+    if not user:
+        user = await get_user_by_email(db, identifier)
+    return user
+
+
+async def single_lookup(db, identifier):
+    from app.services.user_service import get_auth_credentials
+
+    return await get_auth_credentials(db, identifier)
+
+
+async def time_lookups(session_factory, lookup, identifiers):
+    samples = []
+    async with session_factory() as db:
+        for identifier in identifiers[:100]:  # warm-up: statement cache, pages
+            await lookup(db, identifier)
+        db.expunge_all()
+        for identifier in identifiers:
+            start = time.perf_counter()
+            await lookup(db, identifier)
+            samples.append((time.perf_counter() - start) * 1000)
+            db.expunge_all()  # no identity-map hits between iterations
+    return {
+        "p50_ms": round(statistics.median(samples), 3),
+        "p99_ms": round(percentile(samples, 99), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+    }
+
+
+async def main(args) -> None:
+    from app.core.database import AsyncSessionLocal
+    from app.core.init_db import create_tables_async
+    from app.core.security import get_password_hash, verify_password
+
+    await create_tables_async()
+    hashed_password = get_password_hash("Bench123!@#x")
+
+    started = time.perf_counter()
+    inserted = await seed(AsyncSessionLocal, args.users, args.batch, hashed_password)
+    seed_seconds = time.perf_counter() - started
+
+    rng = random.Random(0)
+    picks = [rng.randrange(args.users) for _ in range(args.lookups)]
+    cases = {
+        "username": [f"bench{i}" for i in picks],
+        "email": [f"bench{i}@example.com" for i in picks],
+        "unknown": [f"nobody{i}" for i in picks],
+    }
+
+    report = {"users": args.users, "seeded": inserted, "seed_seconds": round(seed_seconds, 1), "lookups": {}}
+    for case, identifiers in cases.items():
+        report["lookups"][case] = {
+            "legacy": await time_lookups(AsyncSessionLocal, legacy_lookup, identifiers),
+            "single": await time_lookups(AsyncSessionLocal, single_lookup, identifiers),
+        }
+
+    started = time.perf_counter()
+    verify_password("Bench123!@#x", hashed_password)
+    report["bcrypt_verify_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Auth lookup benchmark.")
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=10_000, help="Rows per seeding insert.")
+    asyncio.run(main(parser.parse_args()))
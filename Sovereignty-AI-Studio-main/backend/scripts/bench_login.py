@@ -0,0 +1,111 @@
+# scripts/bench_login.py
+"""Login throughput vs. unrelated-endpoint latency under a login storm.
+
+For each bcrypt pool size in --workers, a fresh process serves the app
+in-process over ASGI, fires --logins concurrent logins in a loop for
+--seconds, and meanwhile probes GET /health every --probe-interval seconds.
+Pool size 0 hashes inline on the event loop (the old behaviour).
+
+Example:
+    PYTHONPATH=. python scripts/bench_login.py --workers 0,4 --logins 32 --seconds 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+async def run_storm(args) -> dict:
+    import httpx
+    from app.main import app
+    from app.core.init_db import create_tables_async
+    from app.core.security import password_hasher
+
+    await create_tables_async()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        name = f"bench_{uuid.uuid4().hex[:12]}"
+        password = "Bench123!@#x"
+        await client.post(
+            "/api/v1/auth/register",
+            json={"username": name, "email": f"{name}@example.com", "password": password},
+        )
+        credentials = {"username": name, "password": password}
+
+        deadline = time.perf_counter() + args.seconds
+        logins, failures, probes = 0, 0, []
+        peak_queue = 0
+
+        async def login_loop():
+            nonlocal logins, failures
+            while time.perf_counter() < deadline:
+                response = await client.post("/api/v1/auth/token", json=credentials)
+                if response.status_code == 200:
+                    logins += 1
+                else:
+                    failures += 1
+
+        async def probe_loop():
+            nonlocal peak_queue
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                await client.get("/health")
+                probes.append((time.perf_counter() - start) * 1000)
+                peak_queue = max(peak_queue, password_hasher.stats()["queue_depth"])
+                await asyncio.sleep(args.probe_interval)
+
+        started = time.perf_counter()
+        await asyncio.gather(probe_loop(), *(login_loop() for _ in range(args.logins)))
+        wall = time.perf_counter() - started
+
+    return {
+        "password_hash_workers": password_hasher.workers,
+        "concurrent_logins": args.logins,
+        "logins_per_sec": round(logins / wall, 1),
+        "login_failures": failures,
+        "peak_queue_depth": peak_queue,
+        "health_probes": len(probes),
+        "health_p50_ms": round(statistics.median(probes), 2),
+        "health_p99_ms": round(percentile(probes, 99), 2),
+        "health_max_ms": round(max(probes), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Login storm benchmark.")
+    parser.add_argument("--workers", default="0,4", help="Comma-separated bcrypt pool sizes to compare.")
+    parser.add_argument("--logins", type=int, default=32, help="Concurrent login loops.")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--probe-interval", type=float, default=0.01)
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(asyncio.run(run_storm(args))))
+        return
+
+    runs = []
+    for workers in args.workers.split(","):
+        env = dict(os.environ, PASSWORD_HASH_WORKERS=workers.strip())
+        output = subprocess.check_output(
+            [sys.executable, __file__, "--single", "--logins", str(args.logins),
+             "--seconds", str(args.seconds), "--probe-interval", str(args.probe_interval)],
+            env=env, text=True,
+        )
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    print(json.dumps({"runs": runs}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
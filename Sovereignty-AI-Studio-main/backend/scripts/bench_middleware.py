@@ -0,0 +1,146 @@
+# scripts/bench_middleware.py
+"""Per-request overhead of the HTTP middleware stack.
+
+Builds the same trivial FastAPI app three ways and drives it with raw ASGI
+calls (no client, no sockets), so the numbers are the framework plus
+middleware cost only:
+
+- bare: no middleware
+- legacy: the three @app.middleware("http") functions main.py used to have
+- asgi: app.core.middleware.SecurityMiddleware
+
+Run from backend/ (it needs no database, Redis or settings):
+    PYTHONPATH=. python scripts/bench_middleware.py --requests 5000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.core.middleware import SecurityMiddleware
+
+MAX_REQUEST_SIZE = 10 * 1024 * 1024
+
+
+def add_routes(app: FastAPI) -> FastAPI:
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(16):
+                yield b"x" * 1024
+        return StreamingResponse(chunks(), media_type="application/octet-stream")
+
+    return app
+
+
+def bare_app() -> FastAPI:
+    return add_routes(FastAPI())
+
+
+def legacy_app() -> FastAPI:
+    """main.py's middleware before the pure ASGI rewrite."""
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def add_security_headers(request: Request, call_next):
+        response = await call_next(request)
+        response.headers["X-Frame-Options"] = "DENY"
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["X-XSS-Protection"] = "1; mode=block"
+        response.headers["Content-Security-Policy"] = "default-src 'self'"
+        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
+        return response
+
+    @app.middleware("http")
+    async def limit_request_size(request: Request, call_next):
+        if request.headers.get("content-length"):
+            if int(request.headers["content-length"]) > MAX_REQUEST_SIZE:
+                return JSONResponse(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    content={"detail": "Request body too large"},
+                )
+        return await call_next(request)
+
+    @app.middleware("http")
+    async def add_process_time_header(request: Request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        response.headers["X-Process-Time"] = str(time.time() - start_time)
+        return response
+
+    return add_routes(app)
+
+
+def asgi_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(SecurityMiddleware, max_request_size=MAX_REQUEST_SIZE)
+    return add_routes(app)
+
+
+async def call(app, path: str) -> int:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "root_path": "", "query_string": b"", "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234), "server": ("bench", 80),
+    }
+    sent = 0
+    delivered = False
+    disconnected = asyncio.Event()
+
+    async def receive():
+        # One empty body, then block like a server would until disconnect.
+        nonlocal delivered
+        if not delivered:
+            delivered = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal sent
+        if message["type"] == "http.response.body":
+            sent += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    disconnected.set()
+    return sent
+
+
+async def measure(app, path: str, requests: int) -> float:
+    for _ in range(200):  # warm-up, also builds the middleware stack
+        await call(app, path)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await call(app, path)
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+async def main(args) -> None:
+    apps = {"bare": bare_app(), "legacy": legacy_app(), "asgi": asgi_app()}
+    report = {}
+    for path in ("/ping", "/stream"):
+        us = {name: round(await measure(app, path, args.requests), 1) for name, app in apps.items()}
+        report[path] = {
+            "us_per_request": us,
+            "middleware_overhead_us": {
+                "legacy": round(us["legacy"] - us["bare"], 1),
+                "asgi": round(us["asgi"] - us["bare"], 1),
+            },
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Middleware overhead benchmark.")
+    parser.add_argument("--requests", type=int, default=5000)
+    asyncio.run(main(parser.parse_args()))
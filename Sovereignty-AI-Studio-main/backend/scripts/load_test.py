@@ -0,0 +1,110 @@
+# scripts/load_test.py
+"""Latency-under-concurrency check for the API.
+
+Drives one endpoint at several concurrency levels and reports p50/p95/p99
+latency and throughput per level as JSON. By default the app is served
+in-process over ASGI (no network, no uvicorn); pass --base-url to hit a
+running server instead.
+
+Example:
+    PYTHONPATH=. python scripts/load_test.py --path /api/v1/users/me --auth \
+        --concurrency 1,16,64,256 --requests 2000
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from typing import Dict, List, Optional
+
+import httpx
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def login(client: httpx.AsyncClient) -> Dict[str, str]:
+    """Register a throwaway user and return its Authorization header."""
+    name = f"load_{uuid.uuid4().hex[:12]}"
+    password = "Load123!@#x"
+    await client.post(
+        "/api/v1/auth/register",
+        json={"username": name, "email": f"{name}@example.com", "password": password},
+    )
+    response = await client.post("/api/v1/auth/token", json={"username": name, "password": password})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    method: str,
+    path: str,
+    concurrency: int,
+    total: int,
+    headers: Optional[Dict[str, str]],
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    remaining = total
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            response = await client.request(method, path, headers=headers)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+    ms = [s * 1000 for s in latencies]
+    return {
+        "concurrency": concurrency,
+        "requests": len(ms),
+        "errors": errors,
+        "rps": round(len(ms) / wall, 1),
+        "p50_ms": round(statistics.median(ms), 2),
+        "p95_ms": round(percentile(ms, 95), 2),
+        "p99_ms": round(percentile(ms, 99), 2),
+        "max_ms": round(max(ms), 2),
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=60)
+    else:
+        from app.main import app
+        if args.init_db:
+            from app.core.init_db import create_tables_async
+            await create_tables_async()
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://load", timeout=60)
+
+    async with client:
+        headers = await login(client) if args.auth else None
+        await run_level(client, args.method, args.path, 4, 50, headers)  # warm-up
+        levels = [int(c) for c in args.concurrency.split(",")]
+        results = [await run_level(client, args.method, args.path, c, args.requests, headers) for c in levels]
+
+    print(json.dumps({"path": args.path, "method": args.method, "levels": results}, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="API latency under concurrency.")
+    parser.add_argument("--path", default="/api/v1/test/db-test")
+    parser.add_argument("--method", default="GET")
+    parser.add_argument("--concurrency", default="1,16,64,256", help="Comma-separated levels.")
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per level.")
+    parser.add_argument("--auth", action="store_true", help="Send a bearer token for a fresh user.")
+    parser.add_argument("--base-url", help="Target a running server instead of the in-process app.")
+    parser.add_argument("--init-db", action="store_true", help="Create tables before the in-process run.")
+    asyncio.run(main(parser.parse_args()))
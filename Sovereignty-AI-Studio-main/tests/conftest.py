@@ -0,0 +1,31 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# The backend imports itself as the top-level "app" package.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+# Settings are read at import; give each test session a fresh database and a key.
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/creativeflow-test.db")
+os.environ.setdefault("REDIS_URL", "redis://localhost:6379/15")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-" + "x" * 32)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database_tables():
+    """Create the schema once per session in the configured test database."""
+    from app.core.init_db import init_db
+
+    init_db()
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limits(monkeypatch):
+    """Start each test with unused quotas in the limiter's per-worker fallback."""
+    from app import dependencies
+    from app.core.rate_limit import LocalWindows
+
+    monkeypatch.setattr(dependencies.rate_limiter, "fallback", LocalWindows())
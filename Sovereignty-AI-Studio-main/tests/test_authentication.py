@@ -118,6 +118,19 @@ class TestAuthentication:
         assert "access_token" in data
         assert data["token_type"] == "bearer"
     
+    @pytest.mark.asyncio
+    async def test_login_with_email(self, client, test_user_data):
+        """Test login using the email address as the identifier."""
+        await client.post('/api/v1/auth/register', json=test_user_data)
+
+        response = await client.post('/api/v1/auth/token', json={
+            "username": test_user_data["email"],
+            "password": test_user_data["password"]
+        })
+
+        assert response.status_code == 200
+        assert "access_token" in response.json()
+    
     @pytest.mark.asyncio
     async def test_login_wrong_password(self, client, test_user_data):
         """Test login with wrong password."""
@@ -302,3 +315,22 @@ class TestSecurityHeaders:
         assert "X-XSS-Protection" in response.headers
         assert "Content-Security-Policy" in response.headers
         assert "Referrer-Policy" in response.headers
+
+
+class TestHealth:
+    """Test suite for the public health check and the internal stats."""
+
+    @pytest.mark.asyncio
+    async def test_health_is_liveness_only(self, client):
+        """Test that /health reports status without internal counters."""
+        response = await client.get('/health')
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "healthy", "version": "1.0.0"}
+
+    @pytest.mark.asyncio
+    async def test_stats_require_authentication(self, client):
+        """Test that /stats is refused without a token."""
+        response = await client.get('/stats')
+
+        assert response.status_code in (401, 403)
@@ -0,0 +1,74 @@
+import importlib
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+pytest.importorskip("aiosqlite")
+
+from backend.app import dependencies
+
+# dependencies imports the backend as "app", so patch the module it actually uses.
+database = importlib.import_module(dependencies.session_scope.__module__)
+
+metadata = MetaData()
+notes = Table("notes", metadata, Column("id", Integer, primary_key=True), Column("body", String))
+
+
+@pytest.fixture
+async def engine(tmp_path, monkeypatch):
+    """A pooled async engine on a scratch SQLite file, installed as the session factory."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/db.sqlite", poolclass=AsyncAdaptedQueuePool)
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+    monkeypatch.setattr(database, "AsyncSessionLocal", async_sessionmaker(
+        engine, class_=AsyncSession, autoflush=False, expire_on_commit=False))
+    yield engine
+    await engine.dispose()
+
+
+async def stored_bodies(engine):
+    async with engine.connect() as conn:
+        return (await conn.execute(select(notes.c.body))).scalars().all()
+
+
+class TestGetDatabase:
+    """Test suite for the request-scoped async session dependency."""
+
+    @pytest.mark.asyncio
+    async def test_session_is_closed_and_connection_returned(self, engine):
+        """Test that finishing the request releases the session's connection."""
+        dependency = dependencies.get_database()
+        session = await dependency.__anext__()
+        await session.execute(insert(notes).values(body="kept"))
+        assert engine.pool.checkedout() == 1
+        await session.commit()
+        await session.execute(select(notes))
+
+        await dependency.aclose()
+
+        assert engine.pool.checkedout() == 0
+        assert await stored_bodies(engine) == ["kept"]
+
+    @pytest.mark.asyncio
+    async def test_error_rolls_back_uncommitted_work(self, engine):
+        """Test that an exception in the handler discards what it had not committed."""
+        dependency = dependencies.get_database()
+        session = await dependency.__anext__()
+        await session.execute(insert(notes).values(body="lost"))
+
+        with pytest.raises(RuntimeError):
+            await dependency.athrow(RuntimeError("handler failed"))
+
+        assert not session.in_transaction()
+        assert engine.pool.checkedout() == 0
+        assert await stored_bodies(engine) == []
+
+    @pytest.mark.asyncio
+    async def test_each_request_gets_its_own_session(self, engine):
+        """Test that concurrent requests never share a session."""
+        first, second = dependencies.get_database(), dependencies.get_database()
+        assert await first.__anext__() is not await second.__anext__()
+        await first.aclose()
+        await second.aclose()
@@ -0,0 +1,83 @@
+import pytest
+import redis
+
+from backend.app.core.generation_cache import CachedGeneration, GenerationCache, generation_key
+
+
+@pytest.fixture
+def client():
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")  # fakeredis needs lupa to run Lua scripts
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+class TestGenerationKey:
+    """Test suite for generation request addressing."""
+
+    def test_equivalent_requests_share_a_key(self):
+        """Test that outer whitespace, line endings and parameter order don't matter."""
+        a = generation_key("text", "openai", "Write a haiku\r\nabout rain", {"temperature": 0.7, "max_tokens": 50})
+        b = generation_key("text", "openai", "  Write a haiku\nabout rain\n", {"max_tokens": 50, "temperature": 0.7})
+        assert a == b
+        assert generation_key("text", "openai", "hi", None) == generation_key("text", "openai", "hi", {})
+
+    def test_different_requests_differ(self):
+        """Test that service, parameters and inner whitespace are part of the key."""
+        base = generation_key("text", "openai", "Write a haiku", {"temperature": 0.7})
+        assert generation_key("text", "anthropic", "Write a haiku", {"temperature": 0.7}) != base
+        assert generation_key("text", "openai", "Write a haiku", {"temperature": 0.8}) != base
+        assert generation_key("text", "openai", "Write  a haiku", {"temperature": 0.7}) != base
+
+
+class TestGenerationCache:
+    """Test suite for the Redis generation result cache."""
+
+    @pytest.mark.asyncio
+    async def test_set_then_get(self, client):
+        """Test that a stored result comes back and is counted as a hit."""
+        cache = GenerationCache(client)
+        entry = CachedGeneration("A haiku", tokens_used=42, cost_usd=0.0012, generation_id=7)
+
+        assert await cache.get("k") is None
+        await cache.set("k", entry)
+        assert await cache.get("k") == entry
+        assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0, "errors": 0}
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entries_are_evicted(self, client):
+        """Test that the cache keeps at most max_entries, dropping the coldest."""
+        cache = GenerationCache(client, max_entries=2)
+        for key in ("a", "b"):
+            await cache.set(key, CachedGeneration(key, 1, 0.1, 1))
+        await cache.get("a")  # "b" is now the least recently used
+        await cache.set("c", CachedGeneration("c", 1, 0.1, 1))
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+        assert await cache.get("c") is not None
+        assert cache.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_lease_is_exclusive_until_released(self, client):
+        """Test that only one holder gets the AI call for a key."""
+        cache = GenerationCache(client)
+        assert await cache.acquire("k", holder="1", lease=30)
+        assert not await cache.acquire("k", holder="2", lease=30)
+
+        await cache.release("k", holder="2")  # not the holder: no effect
+        assert not await cache.acquire("k", holder="2", lease=30)
+
+        await cache.release("k", holder="1")
+        assert await cache.acquire("k", holder="2", lease=30)
+
+    @pytest.mark.asyncio
+    async def test_redis_outage_fails_open(self):
+        """Test that an unreachable Redis means misses and granted leases."""
+        client = redis.asyncio.Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.1)
+        cache = GenerationCache(client)
+
+        assert await cache.get("k") is None
+        await cache.set("k", CachedGeneration("r", 1, 0.1, 1))
+        assert await cache.acquire("k", holder="1", lease=30)
+        await cache.release("k", holder="1")
+        assert cache.errors == 4
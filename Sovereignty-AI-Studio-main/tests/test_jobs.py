@@ -0,0 +1,190 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from backend.app.core.jobs import Job, MemoryJobQueue, RedisJobQueue
+
+# The worker imports the backend as "app" (see conftest); build it from the
+# same modules.
+from app.core.database import Base
+from app.models.generation import Generation
+from app.models.user import User
+from app.workers.generation_worker import GenerationWorker
+
+
+@pytest.fixture(params=["memory", "redis"])
+def queue(request):
+    """Each test runs against the in-process queue and a Redis queue on fakeredis."""
+    if request.param == "memory":
+        return MemoryJobQueue()
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")  # fakeredis needs lupa to run Lua scripts
+    return RedisJobQueue(fakeredis.FakeAsyncRedis(decode_responses=True))
+
+
+class TestJobQueue:
+    """Test suite for the generation job queues."""
+
+    def test_job_round_trip(self):
+        """Test that a job survives serialization."""
+        job = Job(7, "image", attempt=2)
+        assert Job.loads(job.dumps()) == job
+
+    @pytest.mark.asyncio
+    async def test_jobs_are_fifo_per_type(self, queue):
+        """Test that each type has its own FIFO queue."""
+        await queue.enqueue(Job(1, "text"))
+        await queue.enqueue(Job(2, "image"))
+        await queue.enqueue(Job(3, "text"))
+
+        assert (await queue.dequeue("text", timeout=0.1)).generation_id == 1
+        assert (await queue.dequeue("text", timeout=0.1)).generation_id == 3
+        assert await queue.dequeue("text", timeout=0.1) is None
+        assert (await queue.dequeue("image", timeout=0.1)).generation_id == 2
+
+    @pytest.mark.asyncio
+    async def test_delayed_job_waits_until_due(self, queue):
+        """Test that a retry scheduled with a delay is not handed out early."""
+        await queue.enqueue(Job(1, "text", attempt=1), delay=0.3)
+        assert await queue.dequeue("text", timeout=0.1) is None
+
+        await asyncio.sleep(0.3)
+        job = await queue.dequeue("text", timeout=0.5)
+        assert job == Job(1, "text", attempt=1)
+
+    @pytest.mark.asyncio
+    async def test_subscribers_receive_published_events(self, queue):
+        """Test that status events reach subscribers of that generation only."""
+        async with queue.subscribe(1) as events:
+            await queue.publish(2, {"id": 2, "status": "processing"})
+            await queue.publish(1, {"id": 1, "status": "completed"})
+            event = await asyncio.wait_for(events.__anext__(), 2)
+        assert event == {"id": 1, "status": "completed"}
+
+    @pytest.mark.asyncio
+    async def test_subscription_heartbeat(self, queue):
+        """Test that an idle subscription yields None as a keep-alive."""
+        async with queue.subscribe(1, heartbeat=0.2) as events:
+            assert await asyncio.wait_for(events.__anext__(), 2) is None
+
+
+@pytest.fixture
+def redis_client():
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+class TestRedisJobQueue:
+    """Redis-specific behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_job_held_until_ack(self):
+        """Test that a dequeued job stays on the processing list until acked."""
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        queue = RedisJobQueue(client)
+
+        await queue.enqueue(Job(1, "text"))
+        job = await queue.dequeue("text", timeout=0.1)
+        assert await client.llen(queue.processing_prefix + "text") == 1
+
+        await queue.ack(job)
+        assert await client.llen(queue.processing_prefix + "text") == 0
+
+    @pytest.mark.asyncio
+    async def test_unacked_job_is_handed_out_again_after_visibility_timeout(self, redis_client):
+        """Test that a job held by a crashed worker goes back to the ready list."""
+        queue = RedisJobQueue(redis_client, visibility_timeout=0.2)
+        await queue.enqueue(Job(1, "text"))
+        assert await queue.dequeue("text", timeout=0.1) == Job(1, "text")  # the worker dies here
+
+        assert await queue.dequeue("text", timeout=0.1) is None  # lease still live
+        await asyncio.sleep(0.25)
+        assert await queue.dequeue("text", timeout=0.1) == Job(1, "text")
+        assert queue.stats()["recovered"] == 1
+        assert await redis_client.llen(queue.processing_prefix + "text") == 1
+
+    @pytest.mark.asyncio
+    async def test_ack_drops_the_lease(self, redis_client):
+        """Test that an acked job is never recovered."""
+        queue = RedisJobQueue(redis_client, visibility_timeout=0.1)
+        await queue.enqueue(Job(1, "text"))
+        await queue.ack(await queue.dequeue("text", timeout=0.1))
+
+        assert await redis_client.zcard(queue.leases_key) == 0
+        await asyncio.sleep(0.15)
+        assert await queue.dequeue("text", timeout=0.1) is None
+        assert queue.stats()["recovered"] == 0
+
+    @pytest.mark.asyncio
+    async def test_processing_entry_without_lease_is_recovered(self, redis_client):
+        """Test that a job moved to processing but never leased is not stranded."""
+        queue = RedisJobQueue(redis_client, visibility_timeout=0.2)
+        # As if a worker died between BLMOVE and recording the lease.
+        await redis_client.lpush(queue.processing_prefix + "text", Job(1, "text").dumps())
+
+        assert await queue.dequeue("text", timeout=0.1) is None
+        assert await redis_client.zcard(queue.leases_key) == 1
+        await asyncio.sleep(0.25)
+        assert await queue.dequeue("text", timeout=0.1) == Job(1, "text")
+
+
+class TestWorkerErrors:
+    """Test suite for jobs whose processing raises outside the handler."""
+
+    @pytest.fixture
+    async def session_factory(self, tmp_path):
+        pytest.importorskip("aiosqlite")
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/db.sqlite")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        async with factory() as db:
+            db.add(User(id=1, email="ada@example.com", username="ada", hashed_password="h"))
+            db.add(Generation(id=1, user_id=1, generation_type="text", ai_service="openai", prompt="hi"))
+            await db.commit()
+        yield factory
+        await engine.dispose()
+
+    def worker(self, session_factory, queue, max_retries):
+        class BrokenWorker(GenerationWorker):
+            async def process(self, job):
+                self.stop()  # one job, then leave consume()
+                raise RuntimeError("database unavailable")
+
+        return BrokenWorker(session_factory, queue=queue, cache=None, concurrency={"text": 1}, max_retries=max_retries)
+
+    @pytest.mark.asyncio
+    async def test_failed_processing_is_retried_with_backoff(self, session_factory, redis_client):
+        """Test that the job is requeued as the next attempt and acked."""
+        queue = RedisJobQueue(redis_client)
+        await queue.enqueue(Job(1, "text"))
+        worker = self.worker(session_factory, queue, max_retries=3)
+
+        await worker.consume("text")
+
+        assert worker.retried == 1
+        assert await redis_client.llen(queue.processing_prefix + "text") == 0
+        delayed = await redis_client.zrange(queue.delayed_key, 0, -1)
+        assert [Job.loads(p) for p in delayed] == [Job(1, "text", attempt=1)]
+
+    @pytest.mark.asyncio
+    async def test_out_of_retries_marks_the_generation_failed(self, session_factory):
+        """Test that the last attempt fails the generation instead of dropping it."""
+        queue = MemoryJobQueue()
+        await queue.enqueue(Job(1, "text", attempt=3))
+        worker = self.worker(session_factory, queue, max_retries=3)
+
+        async with queue.subscribe(1) as events:
+            await worker.consume("text")
+            event = await asyncio.wait_for(events.__anext__(), 2)
+
+        async with session_factory() as db:
+            generation = await db.get(Generation, 1)
+        assert generation.status == "failed"
+        assert generation.error_message == "database unavailable"
+        assert event["status"] == "failed"
+        assert worker.failed == 1
@@ -0,0 +1,162 @@
+import json
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+from backend.app.core.middleware import SECURITY_HEADERS, SecurityMiddleware
+
+LIMIT = 1024
+
+reached = []
+
+
+def make_app():
+    app = FastAPI()
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        body = await request.body()
+        reached.append(len(body))
+        return {"size": len(body)}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk{i}".encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.add_middleware(SecurityMiddleware, max_request_size=LIMIT)
+    return app
+
+
+async def call(app, method, path, chunks=(), headers=()):
+    """Drive ``app`` over raw ASGI, sending the body in ``chunks``.
+
+    Returns the status, the response headers and the list of body messages.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"test"), *headers],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+    }
+    pending = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(chunks) - 1}
+        for i, chunk in enumerate(chunks)
+    ] or [{"type": "http.request", "body": b"", "more_body": False}]
+    sent = []
+
+    async def receive():
+        if pending:
+            return pending.pop(0)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    start = sent[0]
+    headers = {name.decode(): value.decode() for name, value in start["headers"]}
+    bodies = [m.get("body", b"") for m in sent[1:] if m["type"] == "http.response.body"]
+    return start["status"], headers, bodies
+
+
+@pytest.fixture
+def app():
+    reached.clear()
+    return make_app()
+
+
+def assert_security_headers(headers):
+    for name, value in SECURITY_HEADERS.items():
+        assert headers[name.lower()] == value
+    assert float(headers["x-process-time"]) >= 0
+
+
+class TestSecurityMiddleware:
+    """Test suite for the pure ASGI security/size/timing middleware."""
+
+    @pytest.mark.asyncio
+    async def test_adds_security_headers_and_process_time(self, app):
+        """Test that every header the old middlewares set is still present."""
+        status, headers, bodies = await call(app, "POST", "/echo", [b"hello"])
+
+        assert status == 200
+        assert json.loads(b"".join(bodies)) == {"size": 5}
+        assert_security_headers(headers)
+
+    @pytest.mark.asyncio
+    async def test_declared_length_over_limit_is_rejected_up_front(self, app):
+        """Test that a large Content-Length gets 413 before the endpoint runs."""
+        status, headers, bodies = await call(
+            app, "POST", "/echo", [b"x"], headers=[(b"content-length", str(LIMIT + 1).encode())]
+        )
+
+        assert status == 413
+        assert json.loads(b"".join(bodies)) == {"detail": "Request body too large"}
+        assert_security_headers(headers)
+        assert reached == []
+
+    @pytest.mark.asyncio
+    async def test_invalid_content_length_is_rejected(self, app):
+        """Test that an unparseable Content-Length gets 400."""
+        status, headers, _ = await call(app, "POST", "/echo", [b"x"], headers=[(b"content-length", b"lots")])
+
+        assert status == 400
+        assert_security_headers(headers)
+
+    @pytest.mark.asyncio
+    async def test_streamed_body_over_limit_gets_413(self, app):
+        """Test that a chunked body with no Content-Length is cut off at the limit."""
+        chunks = [b"x" * 400] * 3  # 1200 bytes, no Content-Length header
+
+        status, headers, bodies = await call(app, "POST", "/echo", chunks)
+
+        assert status == 413
+        assert json.loads(b"".join(bodies)) == {"detail": "Request body too large"}
+        assert_security_headers(headers)
+        assert reached == []
+
+    @pytest.mark.asyncio
+    async def test_streamed_body_within_limit_passes(self, app):
+        """Test that a chunked body up to the limit reaches the endpoint whole."""
+        chunks = [b"x" * 512, b"x" * 512]
+
+        status, _, bodies = await call(app, "POST", "/echo", chunks)
+
+        assert status == 200
+        assert json.loads(b"".join(bodies)) == {"size": LIMIT}
+
+    @pytest.mark.asyncio
+    async def test_streaming_response_is_not_buffered(self, app):
+        """Test that response chunks are forwarded one message at a time."""
+        status, headers, bodies = await call(app, "GET", "/stream")
+
+        assert status == 200
+        assert [b for b in bodies if b] == [b"chunk0", b"chunk1", b"chunk2"]
+        assert_security_headers(headers)
+
+    @pytest.mark.asyncio
+    async def test_non_http_scopes_pass_through(self):
+        """Test that lifespan and websocket scopes reach the app untouched."""
+        seen = []
+
+        async def inner(scope, receive, send):
+            seen.append((scope, receive, send))
+
+        middleware = SecurityMiddleware(inner, max_request_size=LIMIT)
+        scope, receive, send = {"type": "lifespan"}, object(), object()
+        await middleware(scope, receive, send)
+
+        assert seen == [(scope, receive, send)]
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, create_engine, insert, select
+
+from backend.app.core.pagination import (
+    InvalidCursor,
+    decode_cursor,
+    encode_cursor,
+    keyset_page,
+    page_result,
+)
+
+metadata = MetaData()
+items = Table(
+    "items",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("owner_id", Integer, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+)
+
+
+@pytest.fixture
+def connection():
+    """SQLite table of 25 items for owner 1 (timestamps shared in threes) and 5 for owner 2."""
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    start = datetime(2026, 1, 1)
+    with engine.connect() as connection:
+        connection.execute(insert(items), [
+            {"id": i, "owner_id": 1 if i <= 25 else 2, "created_at": start + timedelta(minutes=i // 3)}
+            for i in range(1, 31)
+        ])
+        yield connection
+
+
+def fetch_page(connection, cursor, limit):
+    statement = keyset_page(
+        select(items).where(items.c.owner_id == 1),
+        items.c.created_at, items.c.id, cursor, limit,
+    )
+    return page_result(connection.execute(statement).all(), limit)
+
+
+class TestKeysetPagination:
+    """Test suite for cursor (keyset) pagination."""
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes to the position it was made from."""
+        created_at = datetime(2026, 3, 4, 5, 6, 7, 890)
+        assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+    @pytest.mark.parametrize("cursor", ["garbage!", "WzFd", "", "bm90IGpzb24"])
+    def test_invalid_cursor(self, cursor):
+        """Test that tampered or foreign cursors are rejected."""
+        with pytest.raises(InvalidCursor):
+            decode_cursor(cursor)
+
+    def test_pages_cover_every_item_once_newest_first(self, connection):
+        """Test walking all pages, including rows that share a timestamp."""
+        seen, cursor, pages = [], None, 0
+        while True:
+            page, cursor = fetch_page(connection, cursor, 7)
+            seen += [row.id for row in page]
+            pages += 1
+            if cursor is None:
+                break
+
+        assert pages == 4
+        expected = connection.execute(
+            select(items.c.id).where(items.c.owner_id == 1)
+            .order_by(items.c.created_at.desc(), items.c.id.desc())
+        ).scalars().all()
+        assert seen == expected
+
+    def test_exact_multiple_has_no_empty_last_page(self, connection):
+        """Test that the last full page reports no next cursor."""
+        page, cursor = fetch_page(connection, None, 25)
+        assert len(page) == 25
+        assert cursor is None
@@ -0,0 +1,173 @@
+import time
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from starlette.requests import Request
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # fakeredis needs lupa to run Lua scripts
+
+from fakeredis.commands_mixins import server_mixin
+
+from backend.app.core.rate_limit import SlidingWindowLimiter
+
+# The endpoints import the backend as "app" (see conftest); use the same
+# modules so the patched limiter and caches are the ones they see.
+from app import dependencies
+from app.api.v1.endpoints import auth
+from app.config import settings
+from app.core import security
+from app.core.database import Base
+from app.core.security import TokenCache, TokenRevocations, create_access_token
+from app.core.user_cache import UserCache
+from app.models.user import User
+from app.services import user_service
+
+
+class FakeClock:
+    """Stands in for time.time() where the fake Redis answers TIME."""
+
+    def __init__(self, now: float):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Start the clock at the beginning of a 60 s window."""
+    fake = FakeClock(1_700_000_040.0)
+    monkeypatch.setattr(server_mixin, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def limiter():
+    """Limiter backed by an in-memory Redis."""
+    return SlidingWindowLimiter(fakeredis.FakeAsyncRedis())
+
+
+class TestSlidingWindowLimiter:
+    """Test suite for the Redis sliding-window rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_allows_up_to_limit_then_blocks(self, limiter, clock):
+        """Test that the limit-th request passes and the next one is refused."""
+        results = [await limiter.hit("user:alice", 5, 60) for _ in range(5)]
+        assert all(r.allowed for r in results)
+        assert [r.remaining for r in results] == [4, 3, 2, 1, 0]
+
+        blocked = await limiter.hit("user:alice", 5, 60)
+        assert not blocked.allowed
+        assert blocked.remaining == 0
+        assert 0 < blocked.retry_after <= 60
+
+    @pytest.mark.asyncio
+    async def test_identities_are_independent(self, limiter, clock):
+        """Test that one caller's usage does not consume another's quota."""
+        for _ in range(3):
+            await limiter.hit("user:alice", 3, 60)
+        assert not (await limiter.hit("user:alice", 3, 60)).allowed
+        assert (await limiter.hit("user:bob", 3, 60)).allowed
+
+    @pytest.mark.asyncio
+    async def test_previous_window_is_weighted(self, limiter, clock):
+        """Test that the last window's requests count in proportion to overlap."""
+        for _ in range(10):
+            await limiter.hit("ip:1.2.3.4", 10, 60)
+
+        # Half-way into the next window, half of the previous 10 still count.
+        clock.now += 90
+        results = [await limiter.hit("ip:1.2.3.4", 10, 60) for _ in range(6)]
+        assert [r.allowed for r in results] == [True] * 5 + [False]
+
+        # Two full windows later the old requests no longer count.
+        clock.now += 120
+        assert (await limiter.hit("ip:1.2.3.4", 10, 60)).remaining == 9
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_a_local_window_when_redis_unavailable(self, clock):
+        """Test that a Redis outage neither rejects every request nor lifts the limit."""
+        server = fakeredis.FakeServer()
+        server.connected = False
+        limiter = SlidingWindowLimiter(fakeredis.FakeAsyncRedis(server=server))
+
+        results = [await limiter.hit("user:alice", 2, 60) for _ in range(3)]
+        assert [r.allowed for r in results] == [True, True, False]
+        assert [r.remaining for r in results] == [1, 0, 0]
+        assert 0 < results[-1].retry_after <= 60
+        assert (await limiter.hit("user:bob", 2, 60)).allowed
+        assert limiter.stats()["errors"] == 4
+
+    @pytest.mark.asyncio
+    async def test_windows_follow_the_redis_clock(self, limiter, clock, monkeypatch):
+        """Test that a worker whose own clock is far off still shares the window."""
+        for _ in range(3):
+            await limiter.hit("user:alice", 3, 60)
+        monkeypatch.setattr(time, "time", lambda: 0.0)
+
+        assert not (await limiter.hit("user:alice", 3, 60)).allowed
+
+
+@pytest.fixture
+def shared_redis(monkeypatch):
+    """One in-memory Redis behind the limiter, user cache and revocation list."""
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(dependencies, "rate_limiter", SlidingWindowLimiter(client))
+    monkeypatch.setattr(user_service, "user_cache", UserCache(client, enabled=True))
+    monkeypatch.setattr(security, "token_revocations", TokenRevocations(client))
+    monkeypatch.setattr(security, "token_cache", TokenCache(100))
+    return client
+
+
+@pytest.fixture
+async def db(tmp_path):
+    pytest.importorskip("aiosqlite")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/db.sqlite")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as db:
+        yield db
+    await engine.dispose()
+
+
+def bearer(username):
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token({"sub": username}))
+
+
+class TestRateLimitDependency:
+    """Test suite for the RateLimit dependency and the login limit."""
+
+    @pytest.mark.asyncio
+    async def test_plan_is_looked_up_on_a_user_cache_miss(self, shared_redis, db):
+        """Test that a paid user gets their plan's quota even when not cached."""
+        db.add(User(email="ada@example.com", username="ada", hashed_password="h", subscription_plan="pro"))
+        await db.commit()
+        request = Request({"type": "http", "client": ("1.2.3.4", 1), "headers": []})
+
+        identity, limit = await dependencies.RateLimit().identify(request, bearer("ada"), db)
+
+        assert identity == "user:ada"
+        assert limit == settings.rate_limit_plans["pro"]
+        assert (await user_service.user_cache.get("ada"))["subscription_plan"] == "pro"
+
+    @pytest.mark.asyncio
+    async def test_login_attempts_are_limited_per_account(self, shared_redis, db):
+        """Test that repeated logins for one account are refused with 429."""
+        for _ in range(settings.login_rate_limit):
+            with pytest.raises(HTTPException) as excinfo:
+                await auth.authenticate_and_create_token("Ada", "guess", db)
+            assert excinfo.value.status_code == 401
+
+        with pytest.raises(HTTPException) as excinfo:
+            await auth.authenticate_and_create_token(" ada ", "guess", db)
+        assert excinfo.value.status_code == 429
+        assert int(excinfo.value.headers["Retry-After"]) > 0
+
+        # Other accounts are unaffected.
+        with pytest.raises(HTTPException) as excinfo:
+            await auth.authenticate_and_create_token("bob", "guess", db)
+        assert excinfo.value.status_code == 401
@@ -0,0 +1,210 @@
+import asyncio
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+import redis
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+# The endpoints import the backend as "app" (see conftest); use the same
+# modules so the patched revocation list is the one they see.
+from app.api.v1.endpoints import auth
+from app.core import security
+from app.core.database import Base
+from app.core.security import (
+    PasswordHasher,
+    PasswordHasherBusy,
+    TokenCache,
+    TokenRevocations,
+    create_access_token,
+    get_password_hash_async,
+    pwd_context,
+    verify_password,
+    verify_password_async,
+)
+from app.core.user_cache import UserCache
+from app.models.user import User
+from app.services import user_service
+
+
+class TestPasswordHashing:
+    """Test suite for bcrypt hashing on the password-hashing pool."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self):
+        """Test that a hash made on the pool verifies, and only for its password."""
+        hashed = await get_password_hash_async("correct horse")
+
+        assert hashed != "correct horse"
+        assert await verify_password_async("correct horse", hashed)
+        assert not await verify_password_async("wrong horse", hashed)
+        # Interchangeable with the synchronous helpers.
+        assert verify_password("correct horse", hashed)
+
+    @pytest.mark.asyncio
+    async def test_inline_when_no_workers(self):
+        """Test that workers=0 hashes on the event loop with no executor."""
+        hasher = PasswordHasher(workers=0, max_pending=0)
+        hashed = await hasher.run(pwd_context.hash, "secret")
+
+        assert hasher.executor is None
+        assert await hasher.run(pwd_context.verify, "secret", hashed)
+
+
+class TestPasswordHasherPool:
+    """Test suite for the bounded hashing queue."""
+
+    @pytest.mark.asyncio
+    async def test_refuses_work_beyond_max_pending(self):
+        """Test that a full queue raises PasswordHasherBusy instead of growing."""
+        hasher = PasswordHasher(workers=1, max_pending=1)
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocking(value):
+            started.set()
+            release.wait(5)
+            return value
+
+        running = asyncio.ensure_future(hasher.run(blocking, 1))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        queued = asyncio.ensure_future(hasher.run(blocking, 2))
+        await asyncio.sleep(0)
+
+        with pytest.raises(PasswordHasherBusy):
+            await hasher.run(blocking, 3)
+        assert hasher.stats()["queue_depth"] == 1
+        assert hasher.stats()["running"] == 1
+
+        release.set()
+        assert await asyncio.gather(running, queued) == [1, 2]
+        assert hasher.stats() == {"workers": 1, "queue_depth": 0, "running": 0, "completed": 2, "rejected": 1}
+        hasher.executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiters_release_their_place(self):
+        """Test that callers cancelled while queued don't leave the queue full."""
+        hasher = PasswordHasher(workers=1, max_pending=2)
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocking(value):
+            started.set()
+            release.wait(5)
+            return value
+
+        running = asyncio.ensure_future(hasher.run(blocking, 0))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        for _ in range(3):  # more cancellations than max_pending
+            waiters = [asyncio.ensure_future(hasher.run(blocking, i)) for i in (1, 2)]
+            await asyncio.sleep(0)
+            assert hasher.stats()["queue_depth"] == 2
+            for waiter in waiters:
+                waiter.cancel()
+            await asyncio.gather(*waiters, return_exceptions=True)
+            assert hasher.stats()["queue_depth"] == 0
+
+        queued = asyncio.ensure_future(hasher.run(blocking, 3))
+        await asyncio.sleep(0)
+        release.set()
+        assert await asyncio.gather(running, queued) == [0, 3]
+        assert hasher.stats()["completed"] == 2
+        assert hasher.stats()["rejected"] == 0
+        hasher.executor.shutdown()
+
+
+@pytest.fixture
+def revocations(monkeypatch):
+    """Revocation list on an in-memory Redis, with a fresh token cache."""
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    revocations = TokenRevocations(client)
+    monkeypatch.setattr(security, "token_revocations", revocations)
+    monkeypatch.setattr(security, "token_cache", TokenCache(100))
+    monkeypatch.setattr(user_service, "user_cache", UserCache(client, enabled=True))
+    return revocations
+
+
+class TestTokenRevocation:
+    """Test suite for revoking JWTs across workers."""
+
+    @pytest.mark.asyncio
+    async def test_revoked_token_is_rejected_on_a_cache_hit(self, revocations):
+        """Test that a token already in the token cache is still refused once revoked."""
+        token = create_access_token({"sub": "ada"})
+        assert await security.verify_token_async(token) == "ada"
+        assert security.verify_token(token) == "ada"  # now cached
+
+        await security.revoke_token(token)
+
+        assert await security.verify_token_async(token) is None
+        assert await security.verify_token_async(create_access_token({"sub": "ada"})) == "ada"
+
+    @pytest.mark.asyncio
+    async def test_revocation_is_shared_between_workers(self, revocations):
+        """Test that a token revoked elsewhere is refused here, even if cached locally."""
+        token = create_access_token({"sub": "ada"})
+        assert await security.verify_token_async(token) == "ada"
+
+        # Another worker: its own token cache, the same Redis.
+        await TokenRevocations(revocations.client).revoke(TokenCache.digest(token), time.time() + 60)
+
+        assert security.token_cache.get(TokenCache.digest(token)) == "ada"
+        assert await security.verify_token_async(token) is None
+
+    @pytest.mark.asyncio
+    async def test_revocation_expires_with_the_token(self, revocations):
+        """Test that the revocation key lives for the token's remaining lifetime."""
+        token = create_access_token({"sub": "ada"}, expires_delta=timedelta(minutes=5))
+        await security.revoke_token(token)
+
+        ttl = await revocations.client.ttl(TokenRevocations.KEY_PREFIX + TokenCache.digest(token).hex())
+        assert 295 <= ttl <= 300
+
+        await revocations.revoke(b"expired", time.time() - 1)
+        assert not await revocations.client.exists(TokenRevocations.KEY_PREFIX + b"expired".hex())
+
+    @pytest.mark.asyncio
+    async def test_redis_outage_fails_open(self, monkeypatch):
+        """Test that an unreachable Redis does not reject valid tokens."""
+        client = redis.asyncio.Redis(host="127.0.0.1", port=1, socket_connect_timeout=0.1)
+        revocations = TokenRevocations(client)
+        monkeypatch.setattr(security, "token_revocations", revocations)
+        token = create_access_token({"sub": "ada"})
+
+        await security.revoke_token(token)
+        assert await security.verify_token_async(token) == "ada"
+        assert revocations.errors == 2
+
+
+class TestRefresh:
+    """Test suite for /auth/refresh."""
+
+    @pytest.fixture
+    async def db(self, tmp_path):
+        pytest.importorskip("aiosqlite")
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/db.sqlite")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as db:
+            db.add(User(email="ada@example.com", username="ada", hashed_password="hash"))
+            await db.commit()
+            yield db
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_refresh_issues_a_new_token_and_revokes_the_old(self, revocations, db):
+        """Test that each token can be refreshed exactly once."""
+        old = create_access_token({"sub": "ada"})
+
+        new = (await auth.refresh_token(current_token=old, db=db)).access_token
+
+        assert new != old
+        assert await security.verify_token_async(new) == "ada"
+        assert await security.verify_token_async(old) is None
+        with pytest.raises(HTTPException) as excinfo:
+            await auth.refresh_token(current_token=old, db=db)
+        assert excinfo.value.status_code == 401
+        assert (await auth.refresh_token(current_token=new, db=db)).access_token != new
@@ -0,0 +1,202 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # fakeredis needs lupa to run Lua scripts
+
+from backend.app.core.usage import UsageCounter
+
+# The services import the backend as "app" (see conftest); use the same
+# modules so the patched counter is the one they see.
+from app import main
+from app.core.database import Base
+from app.models.user import User
+from app.services import user_service
+
+
+@pytest.fixture
+def counter():
+    """Usage counter backed by an in-memory Redis."""
+    return UsageCounter(fakeredis.FakeAsyncRedis(decode_responses=True))
+
+
+class TestUsageCounter:
+    """Test suite for the Redis generation counters."""
+
+    @pytest.mark.asyncio
+    async def test_increments_accumulate_per_user(self, counter):
+        """Test that increments add up per user until flushed."""
+        for _ in range(3):
+            assert await counter.increment(1)
+        await counter.increment(2, 5)
+
+        assert await counter.pending(1) == 3
+        assert await counter.pending(2) == 5
+        assert await counter.pending(3) == 0
+
+    @pytest.mark.asyncio
+    async def test_batch_drains_pending(self, counter):
+        """Test that a successful batch hands over the deltas once."""
+        await counter.increment(1)
+        await counter.increment(2, 4)
+
+        async with counter.batch() as deltas:
+            assert deltas == {1: 1, 2: 4}
+            # Counted while in flight so live reads stay complete.
+            assert await counter.pending(2) == 4
+
+        assert await counter.pending(2) == 0
+        async with counter.batch() as deltas:
+            assert deltas == {}
+
+    @pytest.mark.asyncio
+    async def test_increments_during_flush_go_to_next_batch(self, counter):
+        """Test that increments made while a batch is open are not lost."""
+        await counter.increment(1)
+        async with counter.batch() as deltas:
+            assert deltas == {1: 1}
+            await counter.increment(1)
+
+        async with counter.batch() as deltas:
+            assert deltas == {1: 1}
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried(self, counter):
+        """Test that a batch whose write failed is offered again."""
+        await counter.increment(1, 2)
+        with pytest.raises(RuntimeError):
+            async with counter.batch():
+                raise RuntimeError("database unavailable")
+
+        await counter.increment(1)
+        async with counter.batch() as deltas:
+            assert deltas == {1: 2}
+        async with counter.batch() as deltas:
+            assert deltas == {1: 1}
+
+    @pytest.mark.asyncio
+    async def test_one_flusher_at_a_time(self, counter):
+        """Test that a second flusher gets nothing while the first holds the lock."""
+        await counter.increment(1)
+        async with counter.batch() as first:
+            async with counter.batch() as second:
+                assert second == {}
+            assert first == {1: 1}
+
+    @pytest.mark.asyncio
+    async def test_reports_redis_unavailable(self):
+        """Test that increments fail softly so callers can fall back to the database."""
+        server = fakeredis.FakeServer()
+        server.connected = False
+        counter = UsageCounter(fakeredis.FakeAsyncRedis(server=server))
+
+        assert not await counter.increment(1)
+        assert await counter.pending(1) == 0
+        async with counter.batch() as deltas:
+            assert deltas == {}
+        assert counter.stats()["errors"] == 3
+
+
+@pytest.fixture
+async def db(tmp_path, monkeypatch):
+    """Scratch database, with user_service counting in an in-memory Redis."""
+    pytest.importorskip("aiosqlite")
+    monkeypatch.setattr(user_service, "usage_counter", UsageCounter(fakeredis.FakeAsyncRedis(decode_responses=True)))
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/db.sqlite")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)() as db:
+        yield db
+    await engine.dispose()
+
+
+async def add_user(db, name, **fields):
+    user = User(email=f"{name}@example.com", username=name, hashed_password="h", **fields)
+    db.add(user)
+    await db.commit()
+    return user.id
+
+
+async def stored(db, user_id):
+    result = await db.execute(
+        select(User.monthly_generations, User.last_generation_reset).where(User.id == user_id)
+    )
+    return result.first()
+
+
+class TestMonthlyReset:
+    """Test suite for the monthly generation reset."""
+
+    @pytest.mark.asyncio
+    async def test_new_users_are_stamped_in_utc(self, db):
+        """Test that last_generation_reset defaults to the database's UTC time."""
+        user_id = await add_user(db, "ada")
+
+        stamped = (await stored(db, user_id)).last_generation_reset
+        assert abs(stamped - datetime.utcnow()) < timedelta(minutes=1)
+        assert abs(await user_service.db_utcnow(db) - datetime.utcnow()) < timedelta(minutes=1)
+
+    @pytest.mark.asyncio
+    async def test_resets_only_users_not_reset_this_month(self, db):
+        """Test that the set-based reset skips users already reset this month."""
+        now = datetime(2026, 3, 10, 12, 0)
+        stale = await add_user(db, "ada", monthly_generations=7, last_generation_reset=datetime(2026, 2, 27))
+        fresh = await add_user(db, "bob", monthly_generations=3, last_generation_reset=datetime(2026, 3, 1, 0, 5))
+
+        assert await user_service.reset_monthly_generations(db, now=now) == 1
+        assert tuple(await stored(db, stale)) == (0, now)
+        assert (await stored(db, fresh)).monthly_generations == 3
+
+    @pytest.mark.asyncio
+    async def test_single_user_form_is_kept(self, db):
+        """Test that reset_monthly_generations(db, user_id) still resets that user."""
+        ada = await add_user(db, "ada", monthly_generations=7)
+        bob = await add_user(db, "bob", monthly_generations=3, last_generation_reset=datetime(2020, 1, 1))
+
+        assert await user_service.reset_monthly_generations(db, ada) == 1
+        assert (await stored(db, ada)).monthly_generations == 0
+        assert (await stored(db, bob)).monthly_generations == 3
+
+    @pytest.mark.asyncio
+    async def test_counts_before_the_reset_runs_use_the_database_clock(self, db):
+        """Test that a user last reset in a previous month reads as 0 this month."""
+        user_id = await add_user(db, "ada", total_generations=9, monthly_generations=7,
+                                 last_generation_reset=datetime(2020, 1, 1))
+        await user_service.increment_user_generations(db, user_id)
+
+        counts = await user_service.get_generation_counts(db, user_id)
+        assert counts["total_generations"] == 10
+        assert counts["monthly_generations"] == 1
+
+
+class TestLifespan:
+    """Test suite for shutting down the usage-counter flusher."""
+
+    @pytest.mark.asyncio
+    async def test_flusher_finishes_before_the_final_flush(self, monkeypatch):
+        """Test that the cancelled flusher has unwound before the last flush starts."""
+        events = []
+
+        async def run_usage_accounting(session_factory, interval):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                await asyncio.sleep(0.01)  # e.g. rolling back, releasing the flush lock
+                events.append("flusher stopped")
+                raise
+
+        async def flush_usage_counters(db):
+            events.append("final flush")
+
+        monkeypatch.setattr(main, "run_usage_accounting", run_usage_accounting)
+        monkeypatch.setattr(main, "flush_usage_counters", flush_usage_counters)
+        monkeypatch.setattr(main.settings, "job_queue_backend", "redis")
+
+        async with main.lifespan(main.app):
+            await asyncio.sleep(0)
+
+        assert events == ["flusher stopped", "final flush"]
@@ -0,0 +1,145 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # fakeredis needs lupa to run Lua scripts
+pytest.importorskip("aiosqlite")
+
+# The services and endpoints import the backend as "app" (see conftest);
+# use the same modules so the patched cache and counter are the ones they see.
+from app.api.v1.endpoints import users as users_endpoints
+from app.core.database import Base
+from app.core.usage import UsageCounter
+from app.core.user_cache import UserCache, serialize_user
+from app.models.user import User
+from app.schemas.user import UserUpdate
+from app.services import user_service
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/db.sqlite")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """In-memory user cache and usage counter, installed in user_service."""
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    cache = UserCache(client, ttl=60, local_ttl=60, local_size=100, enabled=True)
+    monkeypatch.setattr(user_service, "user_cache", cache)
+    monkeypatch.setattr(user_service, "usage_counter", UsageCounter(client))
+    return cache
+
+
+@pytest.fixture
+async def user_id(session_factory):
+    async with session_factory() as db:
+        user = User(
+            email="ada@example.com",
+            username="ada",
+            hashed_password="hash",
+            full_name="Ada",
+            total_generations=3,
+            monthly_generations=2,
+        )
+        db.add(user)
+        await db.commit()
+        return user.id
+
+
+async def cached_user(session_factory, db):
+    """Resolve "ada" for auth, making sure the second lookup is a cache hit."""
+    async with session_factory() as warmup:
+        await user_service.get_user_for_auth(warmup, "ada")
+    return await user_service.get_user_for_auth(db, "ada")
+
+
+class TestCachedFields:
+    """Test suite for what a cached user carries and what it loads on demand."""
+
+    @pytest.mark.asyncio
+    async def test_cache_leaves_out_password_and_counters(self, session_factory, cache, user_id):
+        """Test that the cached entry holds profile fields only."""
+        async with session_factory() as db:
+            user = await cached_user(session_factory, db)
+        assert cache.hits == 1
+        assert user.id == user_id
+
+        data = await cache.get("ada")
+        assert data["full_name"] == "Ada"
+        for field in ("hashed_password", "total_generations", "monthly_generations", "tokens_saved"):
+            assert field not in data
+
+    @pytest.mark.asyncio
+    async def test_uncached_fields_load_on_demand(self, session_factory, cache, user_id):
+        """Test that a user rebuilt from the cache can still load its other columns."""
+        async with session_factory() as db:
+            user = await cached_user(session_factory, db)
+            await db.refresh(user, attribute_names=["hashed_password", "total_generations"])
+
+            assert user.hashed_password == "hash"
+            assert user.total_generations == 3
+
+    @pytest.mark.asyncio
+    async def test_me_reports_live_counts_from_a_cached_user(self, session_factory, cache, user_id):
+        """Test that generations made after caching show up on /me."""
+        async with session_factory() as db:
+            await cached_user(session_factory, db)
+            for _ in range(2):
+                await user_service.increment_user_generations(db, user_id)
+
+        async with session_factory() as db:
+            user = await user_service.get_user_for_auth(db, "ada")
+            me = await users_endpoints.get_current_user(current_user=user, db=db)
+
+        assert cache.hits == 2
+        assert me.total_generations == 5
+        assert me.monthly_generations == 4
+        assert me.full_name == "Ada"
+
+
+    @pytest.mark.asyncio
+    async def test_repeated_lookups_in_one_session(self, session_factory, cache, user_id):
+        """Test that a second cache hit in the same session reuses the attached user."""
+        async with session_factory() as db:
+            first = await cached_user(session_factory, db)
+            second = await user_service.get_user_for_auth(db, "ada")
+
+            assert cache.hits == 2
+            assert second is first
+            await user_service.update_user(db, user_id, UserUpdate(full_name="Ada Lovelace"))
+
+        async with session_factory() as db:
+            assert (await user_service.get_user_by_username(db, "ada")).full_name == "Ada Lovelace"
+
+
+class TestInvalidation:
+    """Test suite for the write paths that evict cached users."""
+
+    @pytest.mark.asyncio
+    async def test_profile_update_is_visible_on_next_lookup(self, session_factory, cache, user_id):
+        """Test that update_user evicts the stale profile."""
+        async with session_factory() as db:
+            await cached_user(session_factory, db)
+            await user_service.update_user(db, user_id, UserUpdate(full_name="Ada Lovelace"))
+
+        assert await cache.get("ada") is None
+        async with session_factory() as db:
+            user = await user_service.get_user_for_auth(db, "ada")
+            assert user.full_name == "Ada Lovelace"
+
+    @pytest.mark.asyncio
+    async def test_deactivation_is_visible_on_next_lookup(self, session_factory, cache, user_id):
+        """Test that deactivate_user evicts the cached active flag."""
+        async with session_factory() as db:
+            await cached_user(session_factory, db)
+            await user_service.deactivate_user(db, user_id)
+
+        async with session_factory() as db:
+            user = await user_service.get_user_for_auth(db, "ada")
+            assert user.is_active is False
+        assert serialize_user(user)["is_active"] is False
@@ -0,0 +1,142 @@
+# benchmarks/bench_fullscan.py
+# Throughput benchmark for FullScanEngine: ingest, tokenize, verify and the JSON/log emitters
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from argparse import Namespace
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fullscan_cli  # noqa: E402
+from corpus import write_corpus  # noqa: E402
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    value = fn(*args)
+    return value, time.perf_counter() - start
+
+
+def phase(seconds: float, tokens: int, size_bytes: int) -> Dict[str, float]:
+    return {
+        "seconds": round(seconds, 4),
+        "tokens_per_sec": round(tokens / seconds) if seconds else None,
+        "mb_per_sec": round(size_bytes / (1024 * 1024) / seconds, 2) if seconds else None,
+    }
+
+
+def bench_mode(job) -> dict:
+    """Benchmark one tokenization mode; runs in its own process so peak RSS is per mode."""
+    corpus_files, syllable_mode, streaming = job
+    size_bytes = sum(os.path.getsize(p) for p in corpus_files)
+    engine = fullscan_cli.FullScanEngine(syllable_mode=syllable_mode, streaming=streaming)
+
+    def tokenize_all():
+        count = 0
+        for path in corpus_files:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    count += len(engine.tokenize_syllabic(line))
+        return count
+
+    def ingest_all():
+        for path in corpus_files:
+            engine.ingest_file(Path(path).name, Path(path))
+
+    tokens, tokenize_s = timed(tokenize_all)
+    _, ingest_s = timed(ingest_all)
+    _, verify_s = timed(engine.verify_all)
+    results, summarize_s = timed(lambda: {src: engine.summarize(src) for src in engine.source_names()})
+
+    args = Namespace(clusters=True, dump=True, metrics=True, append=False, no_compress=True,
+                     max_log_size=1 << 40, fail_log=None)
+    _, json_s = timed(fullscan_cli.generate_json_output, engine, results, args)
+    with tempfile.TemporaryDirectory() as tmp:
+        args.fail_log = os.path.join(tmp, "bench.log")
+        groups: Dict[int, List[str]] = {}
+        for src, res in results.items():
+            groups.setdefault(res.cluster_count, []).append(src)
+        _, log_s = timed(fullscan_cli.write_log, engine, results, groups, args)
+
+    return {
+        "mode": "syllable" if syllable_mode else "word",
+        "streaming": streaming,
+        "tokens": tokens,
+        "phases": {
+            "tokenize_syllabic": phase(tokenize_s, tokens, size_bytes),
+            "ingest": phase(ingest_s, tokens, size_bytes),
+            "verify_all": phase(verify_s, tokens, size_bytes),
+            "summarize": phase(summarize_s, tokens, size_bytes),
+            "emit_json": phase(json_s, tokens, size_bytes),
+            "emit_log": phase(log_s, tokens, size_bytes),
+        },
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FullScanEngine throughput benchmark.")
+    parser.add_argument("--size-mb", type=float, default=16.0, help="Total synthetic corpus size.")
+    parser.add_argument("--files", type=int, default=4, help="Number of corpus files to split the size across.")
+    parser.add_argument("--vocab", type=int, default=5000, help="Distinct words in the synthetic vocabulary.")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--stream", action="store_true", help="Also benchmark the streaming ingest mode.")
+    parser.add_argument("--output", type=str, help="Write the JSON report here instead of stdout.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_files = [
+            str(write_corpus(Path(tmp) / f"corpus_{i}.txt", args.size_mb / args.files, args.vocab, args.seed + i))
+            for i in range(args.files)
+        ]
+        jobs = [(corpus_files, syllable_mode, streaming)
+                for streaming in ((False, True) if args.stream else (False,))
+                for syllable_mode in (False, True)]
+        # One fresh worker per mode keeps peak RSS figures independent.
+        runs = []
+        for job in jobs:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                runs.append(pool.submit(bench_mode, job).result())
+
+    report = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "corpus": {"size_mb": args.size_mb, "files": args.files, "vocab": args.vocab, "seed": args.seed},
+        "runs": runs,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
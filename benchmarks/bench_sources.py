@@ -0,0 +1,98 @@
+# benchmarks/bench_sources.py
+# Deploy-validator hashing/scanning: legacy 8 KB read + full decode vs one chunked pass
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import sources  # noqa: E402
+
+UNITS = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+
+def parse_size(text: str) -> int:
+    text = text.strip().upper()
+    if text[-1] in UNITS:
+        return int(float(text[:-1]) * UNITS[text[-1]])
+    return int(text)
+
+
+def legacy_inspect(path: str):
+    """sha256_file/scan_file as they were: 8 KB reads, then decode the whole file."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(8192)
+            if not chunk:
+                break
+            h.update(chunk)
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        content = f.read()
+    return h.hexdigest(), [p.pattern for p in sources.PATTERNS if p.search(content)]
+
+
+def chunked_inspect(path: str):
+    digest, _, hits = sources.inspect_file(path)
+    return digest, hits
+
+
+def write_fixture(path: str, size: int):
+    # Clean text (no pattern ever matches), so every path has to scan to the end.
+    block = (b"validator manifest entry for artifact weights shard ok\n" * 20000)[:1024 * 1024]
+    with open(path, "wb") as f:
+        remaining = size
+        while remaining > 0:
+            f.write(block[:remaining])
+            remaining -= len(block)
+
+
+def best_of(fn, path: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="sources.py large-file benchmark.")
+    parser.add_argument("--sizes", default="1M,16M,128M,1G",
+                        help="Comma-separated file sizes, e.g. 1M,64M,1G,10G.")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of-N timing (warm page cache).")
+    parser.add_argument("--skip-legacy-above", default="2G",
+                        help="The legacy path decodes the whole file into memory; skip it above this size.")
+    parser.add_argument("--dir", default=None, help="Where to write fixtures (needs free space for the largest).")
+    args = parser.parse_args()
+    legacy_limit = parse_size(args.skip_legacy_above)
+
+    rows = []
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        for size_text in args.sizes.split(","):
+            size = parse_size(size_text)
+            path = os.path.join(tmp, f"fixture_{size_text}.bin")
+            write_fixture(path, size)
+            expected = chunked_inspect(path)
+            row = {"size": size_text, "bytes": size}
+            paths = [("chunked", chunked_inspect)]
+            if size <= legacy_limit:
+                paths.insert(0, ("legacy", legacy_inspect))
+            for name, fn in paths:
+                assert fn(path) == expected
+                seconds = best_of(fn, path, args.repeat)
+                row[name] = {"seconds": round(seconds, 4), "mb_per_sec": round(size / UNITS["M"] / seconds, 1)}
+            rows.append(row)
+            os.remove(path)
+
+    print(json.dumps({"chunk_size": sources.CHUNK_SIZE, "results": rows}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# benchmarks/bench_tokenizer.py
+# Micro-benchmark: tokens/sec of the legacy per-word tokenizer vs syllabic_tokenizer
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import syllabic_tokenizer  # noqa: E402
+
+VOCAB = ["the", "first", "letter.", "context", "is", "king,", "syllables", "are", "bricks!",
+         "rhythm", "it's", "queue;", "another", "source", "begins:", "tracked", "separately?"]
+
+
+def legacy_tokenize(text: str, syllable_mode: bool) -> List[str]:
+    """The tokenizer FullScanEngine used before syllabic_tokenizer existed."""
+    if syllable_mode:
+        out = []
+        for w in re.findall(r"[\w']+", text):
+            out.extend(re.findall(r"[^aeiou]*[aeiou]+[^aeiou]*", w, re.I))
+        return out
+    out = []
+    for w in re.findall(r"[\w']+[.,!?;:]*", text):
+        m = re.match(r"([\w']+)([.,!?;:]*)", w)
+        if not m:
+            continue
+        base, punc = m.groups()
+        out.append(base + (punc or ''))
+    return out
+
+
+def make_fixture(size_mb: float, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    lines, size = [], 0
+    target = int(size_mb * 1024 * 1024)
+    while size < target:
+        line = " ".join(rng.choice(VOCAB) for _ in range(rng.randint(4, 16)))
+        lines.append(line)
+        size += len(line) + 1
+    return lines
+
+
+def run(lines: List[str], syllable_mode: bool, repeat: int) -> dict:
+    legacy_best = new_best = float("inf")
+    tokens = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        legacy_tokens = sum(len(legacy_tokenize(line, syllable_mode)) for line in lines)
+        legacy_best = min(legacy_best, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        tokens = sum(len(t) for t in syllabic_tokenizer.tokenize_batch(lines, syllable_mode))
+        new_best = min(new_best, time.perf_counter() - start)
+        assert tokens == legacy_tokens
+    return {
+        "mode": "syllable" if syllable_mode else "word",
+        "tokens": tokens,
+        "before_tokens_per_sec": round(tokens / legacy_best),
+        "after_tokens_per_sec": round(tokens / new_best),
+        "speedup": round(legacy_best / new_best, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tokenizer micro-benchmark.")
+    parser.add_argument("--size-mb", type=float, default=8.0, help="Size of the generated text fixture.")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of-N timing.")
+    args = parser.parse_args()
+
+    lines = make_fixture(args.size_mb)
+    print(json.dumps({
+        "fixture_mb": args.size_mb,
+        "lines": len(lines),
+        "results": [run(lines, mode, args.repeat) for mode in (False, True)],
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
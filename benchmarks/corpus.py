@@ -0,0 +1,46 @@
+# benchmarks/corpus.py
+# Synthetic corpus generation for the fullscan benchmarks
+
+import random
+from pathlib import Path
+from typing import List
+
+PUNCTUATION = ["", "", "", "", ",", ".", "!", "?", ";", ":"]
+
+
+def make_vocab(size: int, seed: int = 7) -> List[str]:
+    """Pronounceable-ish words, so syllable mode has vowel clusters to split on."""
+    rng = random.Random(seed)
+    consonants = "bcdfghjklmnpqrstvwxz"
+    vowels = "aeiouy"
+    words = set()
+    while len(words) < size:
+        word = "".join(rng.choice(consonants) + rng.choice(vowels) for _ in range(rng.randint(1, 4)))
+        if rng.random() < 0.3:
+            word += rng.choice(consonants)
+        if rng.random() < 0.05:
+            word = word.capitalize()
+        words.add(word)
+    return sorted(words)
+
+
+def make_lines(size_mb: float, vocab_size: int = 5000, seed: int = 7) -> List[str]:
+    rng = random.Random(seed)
+    vocab = make_vocab(vocab_size, seed)
+    lines, size = [], 0
+    target = int(size_mb * 1024 * 1024)
+    while size < target:
+        line = " ".join(rng.choice(vocab) + rng.choice(PUNCTUATION) for _ in range(rng.randint(0, 16)))
+        lines.append(line)
+        size += len(line) + 1
+    return lines
+
+
+def write_corpus(path: Path, size_mb: float, vocab_size: int = 5000, seed: int = 7) -> Path:
+    path = Path(path)
+    with open(path, "w", encoding="utf-8") as f:
+        for line in make_lines(size_mb, vocab_size, seed):
+            f.write(line)
+            f.write("\n")
+    return path
+
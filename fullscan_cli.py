@@ -1,90 +1,221 @@
 # fullscan_cli.py
 # Command-line utility for multi-source syllabic scan and batch verification with logging, rotation, checksums, extra metrics, and cluster grouping
 
-import re
 import argparse
+import atexit
 import json
 import gzip
-from typing import List, Dict
-from threading import RLock
-from pathlib import Path
-from datetime import datetime, timezone
+import hashlib
 import os
 import shutil
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import IO, Iterable, Iterator, List, Dict, Optional, Tuple, Union
+from threading import RLock, Thread
+from pathlib import Path
+from datetime import datetime, timezone
+
+import syllabic_tokenizer
+
+
+# Streaming mode only remembers this many clusters (and tokens per cluster),
+# which is exactly what cluster_summary() reports.
+CLUSTER_PREVIEW_LIMIT = 5
+CLUSTER_PREVIEW_WIDTH = 3
+
+# Bump whenever tokenization or SourceResult changes so stale cache entries miss.
+CACHE_VERSION = 4
+DEFAULT_CACHE_DIR = os.path.join(Path.home(), ".cache", "fullscan_cli")
+
+
+@dataclass
+class StreamStats:
+    """Running per-source state kept by streaming ingest instead of the token list."""
+    count: int = 0
+    total_len: int = 0
+    first: Optional[str] = None
+    last: Optional[str] = None
+    cluster_count: int = 0
+    cluster_preview: List[List[str]] = field(default_factory=list)
+    context_map: Dict[str, int] = field(default_factory=dict)
+    mid: Optional[str] = None
+    # Where the streamed lines can be read again, in ingest order: file paths,
+    # or temporary copies of lines that did not come from a file.
+    replay: List[Union[str, IO[str]]] = field(default_factory=list)
+
+
+@dataclass
+class SourceResult:
+    """Everything the reporters need about one verified source; small and picklable."""
+    complete: bool
+    missing: int
+    first: Optional[str]
+    last: Optional[str]
+    checksum: Optional[str]
+    tokens: int
+    avg_syllable_length: float
+    cluster_count: int
+    # Full cluster lists in non-streaming mode (only materialized when JSON
+    # output asks for them), otherwise the bounded preview.
+    clusters: List[List[str]]
 
 
 class FullScanEngine:
-    def __init__(self):
+    def __init__(self, syllable_mode: bool = False, streaming: bool = False):
         self.lock = RLock()
-        self.sources: Dict[str, List[str]] = {}
-        self.context_maps: Dict[str, Dict[str, int]] = {}
+        self.syllable_mode = syllable_mode
+        self.streaming = streaming
+        # Tokens are interned once: each source is an array of token ids and
+        # each cluster is the offset where its line starts in that array.
+        self.vocab: Dict[str, int] = {}
+        self.vocab_tokens: List[str] = []
+        self.sources: Dict[str, array] = {}
+        self.context_maps: Dict[str, Dict[int, int]] = {}
         self.miss_counts: Dict[str, int] = {}
-        self.clusters: Dict[str, List[List[str]]] = {}
+        self.clusters: Dict[str, array] = {}
+        self.stats: Dict[str, StreamStats] = {}
 
     def ingest(self, source: str, raw: str):
+        self._store_lines(source, raw.strip().split('\n'))
+
+    def _store_lines(self, source: str, lines: Iterable[str]):
         if source not in self.sources:
-            self.sources[source] = []
+            self.sources[source] = array('I')
             self.context_maps[source] = {}
             self.miss_counts[source] = 0
-            self.clusters[source] = []
+            self.clusters[source] = array('I')
 
-        lines = raw.strip().split('\n')
+        vocab = self.vocab
+        vocab_tokens = self.vocab_tokens
+        ids = self.sources[source]
+        context_map = self.context_maps[source]
+        cluster_starts = self.clusters[source]
+        for tokens in syllabic_tokenizer.tokenize_iter(lines, self.syllable_mode):
+            if not tokens:
+                continue
+            start = len(ids)
+            cluster_starts.append(start)
+            for i, tk in enumerate(tokens):
+                tid = vocab.get(tk)
+                if tid is None:
+                    tid = vocab[tk] = len(vocab_tokens)
+                    vocab_tokens.append(tk)
+                ids.append(tid)
+                if tid not in context_map:
+                    context_map[tid] = start + i
+
+    def ingest_file(self, source: str, path: Path):
+        """Ingest a file line by line; streaming mode also drops the tokens."""
+        if not self.streaming:
+            with open(path, "r", encoding="utf-8") as f:
+                self._store_lines(source, f)
+            return
+
+        with open(path, "r", encoding="utf-8") as f:
+            stats = self._fold_lines(source, f)
+        stats.replay.append(str(path))
+
+    def ingest_lines(self, source: str, lines: Iterable[str]):
+        """Streaming ingest: fold lines into running stats without keeping the tokens.
+
+        The lines are copied to a temporary file as they go by, so the middle
+        token can be found again once the total count is known.
+        """
+        spool = tempfile.TemporaryFile("w+", encoding="utf-8")
+        self._fold_lines(source, self._spooled(lines, spool)).replay.append(spool)
+
+    @staticmethod
+    def _spooled(lines: Iterable[str], spool: IO[str]) -> Iterable[str]:
         for line in lines:
-            tokens = self.tokenize_syllabic(line)
-            start = len(self.sources[source])
-            self.sources[source].extend(tokens)
+            spool.write(line.rstrip("\n") + "\n")
+            yield line
 
-            cluster = []
-            for i, tk in enumerate(tokens):
-                cluster.append(tk)
-                if tk not in self.context_maps[source]:
-                    self.context_maps[source][tk] = start + i
-            if cluster:
-                self.clusters[source].append(cluster)
+    def _fold_lines(self, source: str, lines: Iterable[str]) -> StreamStats:
+        stats = self.stats.get(source)
+        if stats is None:
+            stats = self.stats[source] = StreamStats()
+            self.miss_counts[source] = 0
 
-    def tokenize_syllabic(self, text: str) -> List[str]:
-        words = re.findall(r"[\w']+[.,!?;:]*", text)
-        out = []
-        for w in words:
-            m = re.match(r"([\w']+)([.,!?;:]*)", w)
-            if not m:
+        context_map = stats.context_map
+        for line in lines:
+            tokens = self.tokenize_syllabic(line)
+            if not tokens:
                 continue
-            base, punc = m.groups()
-            syls = self.syllabify(base)
-            token = ''.join(syls) + (punc or '')
-            out.append(token)
-        return out
+            start = stats.count
+            for i, tk in enumerate(tokens):
+                if tk not in context_map:
+                    context_map[tk] = start + i
+                stats.total_len += len(tk)
+            if stats.first is None:
+                stats.first = tokens[0]
+            stats.last = tokens[-1]
+            stats.count += len(tokens)
+            stats.mid = None
+            if len(stats.cluster_preview) < CLUSTER_PREVIEW_LIMIT:
+                stats.cluster_preview.append(tokens[:CLUSTER_PREVIEW_WIDTH])
+            stats.cluster_count += 1
+        return stats
+
+    def _replay_lines(self, stats: StreamStats) -> Iterator[str]:
+        for item in stats.replay:
+            if isinstance(item, str):
+                with open(item, "r", encoding="utf-8") as f:
+                    yield from f
+            else:
+                item.seek(0)
+                yield from item
+
+    def _stream_mid(self, source: str) -> str:
+        # The middle token is only known once the total count is, so it is
+        # resolved lazily by reading the source again up to that index.
+        stats = self.stats[source]
+        if stats.mid is None:
+            target = stats.count // 2
+            seen = 0
+            for line in self._replay_lines(stats):
+                tokens = self.tokenize_syllabic(line)
+                if seen + len(tokens) > target:
+                    stats.mid = tokens[target - seen]
+                    break
+                seen += len(tokens)
+            else:
+                # Only reachable if a file shrank since it was streamed.
+                stats.mid = stats.last
+        return stats.mid
 
     def syllabify(self, word: str) -> List[str]:
-        vowels = 'aeiouyAEIOUY'
-        if not word:
-            return []
+        return syllabic_tokenizer.syllabify(word)
 
-        out = []
-        syl = ''
-        for char in word:
-            syl += char
-            if char in vowels and syl:
-                out.append(syl)
-                syl = ''
-        if syl:
-            out.append(syl)
-        return out
+    def tokenize_syllabic(self, text: str) -> List[str]:
+        return syllabic_tokenizer.tokenize(text, self.syllable_mode)
+
+    def source_names(self) -> List[str]:
+        return list(self.stats.keys() if self.streaming else self.sources.keys())
 
     def scan_complete(self, source: str) -> bool:
+        if self.streaming:
+            stats = self.stats.get(source)
+            if stats is None or not stats.count:
+                return False
+            # Every streamed token is recorded in the context map as it is
+            # seen, so nothing can be missing; only the endpoints can fail.
+            self.miss_counts[source] = 0
+            return (
+                stats.context_map.get(stats.first) == 0
+                and stats.context_map.get(stats.last) == stats.count - 1
+            )
+
         if source not in self.sources or not self.sources[source]:
             return False
-
-        full_text = self.sources[source]
+        ids = self.sources[source]
         context_map = self.context_maps[source]
-
-        first = full_text[0]
-        last = full_text[-1]
-        length = len(full_text)
-
-        missing = sum(1 for tok in full_text if tok not in context_map)
+        first = ids[0]
+        last = ids[-1]
+        length = len(ids)
+        missing = sum(1 for tid in ids if tid not in context_map)
         self.miss_counts[source] = missing
-
         return (
             missing == 0
             and context_map.get(first) == 0
@@ -92,261 +223,313 @@ class FullScanEngine:
         )
 
     def verify_all(self) -> Dict[str, bool]:
-        return {source: self.scan_complete(source) for source in self.sources.keys()}
+        return {source: self.scan_complete(source) for source in self.source_names()}
+
+    def first_token(self, source: str) -> str:
+        if self.streaming:
+            return self.stats[source].first
+        return self.vocab_tokens[self.sources[source][0]]
+
+    def last_token(self, source: str) -> str:
+        if self.streaming:
+            return self.stats[source].last
+        return self.vocab_tokens[self.sources[source][-1]]
 
     def dump(self, source: str) -> str:
+        if self.streaming:
+            stats = self.stats.get(source)
+            if stats is None or not stats.count:
+                return ""
+            return " ".join([stats.first, self._stream_mid(source), stats.last])
+
         if source not in self.sources or not self.sources[source]:
             return ""
-        full_text = self.sources[source]
-        first = full_text[0]
-        mid = full_text[len(full_text) // 2]
-        last = full_text[-1]
-        return " ".join([first, mid, last])
+        ids = self.sources[source]
+        tokens = self.vocab_tokens
+        return " ".join([tokens[ids[0]], tokens[ids[len(ids) // 2]], tokens[ids[-1]]])
 
     def token_count(self, source: str) -> int:
-        return len(self.sources.get(source, []))
+        if self.streaming:
+            stats = self.stats.get(source)
+            return stats.count if stats else 0
+        return len(self.sources.get(source, ()))
 
     def avg_syllable_length(self, source: str) -> float:
-        tokens = self.sources.get(source, [])
-        if not tokens:
+        if self.streaming:
+            stats = self.stats.get(source)
+            if stats is None or not stats.count:
+                return 0.0
+            return stats.total_len / stats.count
+
+        ids = self.sources.get(source)
+        if not ids:
             return 0.0
-        total_len = sum(len(t) for t in tokens)
-        return total_len / len(tokens)
+        lengths = [len(t) for t in self.vocab_tokens]
+        total_len = sum(map(lengths.__getitem__, ids))
+        return total_len / len(ids)
 
     def cluster_count(self, source: str) -> int:
-        return len(self.clusters.get(source, []))
+        if self.streaming:
+            stats = self.stats.get(source)
+            return stats.cluster_count if stats else 0
+        return len(self.clusters.get(source, ()))
+
+    def cluster_list(self, source: str, limit: Optional[int] = None, width: Optional[int] = None) -> List[List[str]]:
+        """Materialize clusters as token lists; streaming mode only has the bounded preview."""
+        if self.streaming:
+            stats = self.stats.get(source)
+            return stats.cluster_preview if stats else []
+
+        starts = self.clusters.get(source)
+        if not starts:
+            return []
+        ids = self.sources[source]
+        tokens = self.vocab_tokens
+        count = len(starts) if limit is None else min(limit, len(starts))
+        out = []
+        for n in range(count):
+            begin = starts[n]
+            end = starts[n + 1] if n + 1 < len(starts) else len(ids)
+            if width is not None:
+                end = min(end, begin + width)
+            out.append([tokens[tid] for tid in ids[begin:end]])
+        return out
 
     def cluster_summary(self, source: str) -> List[str]:
-        clusters = self.clusters.get(source, [])
-        return [" ".join(c[:3]) for c in clusters[:5]]
-
-
-def rotate_log_file(log_path: str, max_size: int = 1024 * 1024, compress: bool = True) -> str:
-    if os.path.isfile(log_path) and os.path.getsize(log_path) > max_size:
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-        rotated_path = f"{log_path}.{timestamp}.bak"
-        os.rename(log_path, rotated_path)
-        if compress:
-            with open(rotated_path, 'rb') as f_in, gzip.open(rotated_path + '.gz', 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
-            os.remove(rotated_path)
-    return log_path
-
-
-def main():
-    parser = argparse.ArgumentParser(description="Multi-source syllabic scanner and verifier with clusters.")
-    parser.add_argument("files", nargs="+", help="Text files to scan and verify.")
-    parser.add_argument("--dump", action="store_true", help="Show first/mid/last tokens for each file.")
-    parser.add_argument("--json", action="store_true", help="Output results in JSON format.")
-    parser.add_argument("--fail-log", type=str, help="Path to a log file for verification results.")
-    parser.add_argument("--append", action="store_true", help="Append to the log instead of overwriting.")
-    parser.add_argument("--max-log-size", type=int, default=1024*1024, help="Max size in bytes before log rotation.")
-    parser.add_argument("--no-compress", action="store_true", help="Do not compress rotated logs.")
-    parser.add_argument("--metrics", action="store_true", help="Include token counts and average syllable length in the log.")
-    parser.add_argument("--clusters", action="store_true", help="Include cluster summaries in JSON/log output.")
-
-    args = parser.parse_args()
-
-    engine = FullScanEngine()
-
-    for file_path in args.files:
+        return summarize_clusters(self.cluster_list(source, CLUSTER_PREVIEW_LIMIT, CLUSTER_PREVIEW_WIDTH))
+
+    def summarize(self, source: str, checksum: bool = True, full_clusters: bool = True) -> SourceResult:
+        """Verify a source and collapse it into a SourceResult."""
+        with self.lock:
+            complete = self.scan_complete(source)
+            has_tokens = self.token_count(source) > 0
+            return SourceResult(
+                complete=complete,
+                missing=self.miss_counts.get(source, 0),
+                first=self.first_token(source) if has_tokens else None,
+                last=self.last_token(source) if has_tokens else None,
+                checksum=self.dump(source) if checksum else None,
+                tokens=self.token_count(source),
+                avg_syllable_length=self.avg_syllable_length(source),
+                cluster_count=self.cluster_count(source),
+                clusters=(self.cluster_list(source) if full_clusters
+                          else self.cluster_list(source, CLUSTER_PREVIEW_LIMIT, CLUSTER_PREVIEW_WIDTH)),
+            )
+
+
+def summarize_clusters(clusters: List[List[str]]) -> List[str]:
+    return [" ".join(c[:CLUSTER_PREVIEW_WIDTH]) for c in clusters[:CLUSTER_PREVIEW_LIMIT]]
+
+
+def scan_source(job: Tuple[str, List[str], bool, bool, bool, bool]) -> SourceResult:
+    """Ingest and verify all files of one source; runs inside pool workers."""
+    source, paths, syllable_mode, streaming, checksum, full_clusters = job
+    engine = FullScanEngine(syllable_mode=syllable_mode, streaming=streaming)
+    for path in paths:
+        engine.ingest_file(source, Path(path))
+    return engine.summarize(source, checksum=checksum, full_clusters=full_clusters)
+
+
+def group_sources(files: List[str]) -> Dict[str, List[str]]:
+    """Map source names to their files, in command-line order."""
+    groups: Dict[str, List[str]] = {}
+    for file_path in files:
         path = Path(file_path)
         if not path.is_file():
             print(f"Skipping '{file_path}' — not a file.")
             continue
-
-        with path.open("r", encoding="utf-8") as f:
-            content = f.read()
-            engine.ingest(path.name, content)
-
-    results = engine.verify_all()
-
-    # Group sources by cluster count first
-    cluster_groups: Dict[int, List[str]] = {}
-    if args.clusters:
-        for src in engine.sources:
-            cnt = engine.cluster_count(src)
-            cluster_groups.setdefault(cnt, []).append(src)
-
-    # Logging
-    if args.fail_log:
-        active_log = rotate_log_file(args.fail_log, args.max_log_size, compress=not args.no_compress)
-        mode = "a" if args.append else "w"
-        total_missing = sum(engine.miss_counts.values())
-        total_failures = sum(1 for complete in results.values() if not complete)
-
-        with open(active_log, mode, encoding="utf-8") as log_file:
-            log_file.write("=== Cluster Groups by Count ===\n")
-            for cnt in sorted(cluster_groups):
-                log_file.write(f"{cnt} clusters: {', '.join(cluster_groups[cnt])}\n")
-
-            log_file.write("=== Verification Results (Clusters First) ===\n")
-            for src, complete in results.items():
-                timestamp = datetime.now(timezone.utc).isoformat()
-                clusters_cnt = engine.cluster_count(src)
-                cluster_str = f"Clusters: {clusters_cnt} | Preview: {engine.cluster_summary(src)}" if args.clusters else ""
-                first_tok = engine.sources[src][0]
-                last_tok = engine.sources[src][-1]
-                checksum = engine.dump(src)
-                tokens = engine.token_count(src)
-                avg_len = engine.avg_syllable_length(src)
-                metrics_str = f" | Tokens: {tokens} | AvgLen: {avg_len:.2f}" if args.metrics else ""
-                status_str = "OK" if complete else f"FAIL ({engine.miss_counts[src]} missing)"
-
-                log_file.write(f"[{timestamp}] {src} | {cluster_str} | Status: {status_str} | First: {first_tok} | Last: {last_tok} | Checksum: {checksum}{metrics_str}\n")
-
-            log_file.write(f"Summary: {total_failures} failures, {total_missing} total missing syllables\n")
-
-    if args.json:
-        output = {
-            "clusters": {src: engine.clusters[src] for src in engine.sources} if args.clusters else None,
-            "results": {
-                src: {
-                    "complete": complete,
-                    "missing": engine.miss_counts[src],
-                    "checksum": engine.dump(src) if args.dump else None,
-                    "tokens": engine.token_count(src) if args.metrics else None,
-                    "avg_syllable_length": engine.avg_syllable_length(src) if args.metrics else None
-                } for src, complete in results.items()
-            }
-        }
-        print(json.dumps(output, indent=2))
-    else:
-        for src, complete in results.items():
-            if args.clusters:
-                print(f"{src} | Clusters: {engine.cluster_count(src)} | Preview: {engine.cluster_summary(src)}")
-            status = "FULL READ CONFIRMED" if complete else f"Integrity fail ({engine.miss_counts[src]} missing)"
-            print(f"  Status: {status}")
-            if args.dump:
-                print("  Checksum:", engine.dump(src))
-            if args.metrics:
-                print(f"  Tokens: {engine.token_count(src)} | Avg syllable length: {engine.avg_syllable_length(src):.2f}")
-
-
-if __name__ == "__main__":
-    main()
-
-
-
-import argparse
-import json
-import re
-import gzip
-import os
-import shutil
-from typing import List, Dict
-from threading import RLock
-from pathlib import Path
-from datetime import datetime, timezone
-
-
-class FullScanEngine:
-    def __init__(self, syllable_mode: bool = False):
-        self.lock = RLock()
-        self.syllable_mode = syllable_mode
-        self.sources: Dict[str, List[str]] = {}
-        self.context_maps: Dict[str, Dict[str, int]] = {}
-        self.miss_counts: Dict[str, int] = {}
-        self.clusters: Dict[str, List[List[str]]] = {}
-
-    def ingest(self, source: str, raw: str):
-        if source not in self.sources:
-            self.sources[source] = []
-            self.context_maps[source] = {}
-            self.miss_counts[source] = 0
-            self.clusters[source] = []
-
-        lines = raw.strip().split('\n')
-        for line in lines:
-            tokens = self.tokenize_syllabic(line)
-            start = len(self.sources[source])
-            self.sources[source].extend(tokens)
-            cluster = []
-            for i, tk in enumerate(tokens):
-                cluster.append(tk)
-                if tk not in self.context_maps[source]:
-                    self.context_maps[source][tk] = start + i
-            if cluster:
-                self.clusters[source].append(cluster)
-
-    def syllabify(self, word: str) -> List[str]:
-        return re.findall(r"[^aeiou]*[aeiou]+[^aeiou]*", word, re.I)
-
-    def tokenize_syllabic(self, text: str) -> List[str]:
-        if self.syllable_mode:
-            words = re.findall(r"[\w']+", text)
-            out = []
-            for w in words:
-                syls = self.syllabify(w)
-                out.extend(syls)
-            return out
+        groups.setdefault(path.name, []).append(file_path)
+    return groups
+
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ResultCache:
+    """On-disk SourceResult cache, one JSON entry per source.
+
+    An entry is reused when every file still has the recorded size and
+    mtime; if only the mtime moved, the content hash decides.
+    """
+
+    def __init__(self, cache_dir: str, syllable_mode: bool, streaming: bool, full_clusters: bool = True):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.mode = "syllable" if syllable_mode else "word"
+        self.streaming = streaming
+        self.full_clusters = full_clusters
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, source: str, paths: List[str]) -> Path:
+        key = json.dumps([CACHE_VERSION, self.mode, self.streaming, self.full_clusters, source,
+                          [os.path.abspath(p) for p in paths]])
+        return self.cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def _write(self, entry_path: Path, entry: dict):
+        tmp_path = entry_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, entry_path)
+
+    def lookup(self, source: str, paths: List[str]) -> Optional[SourceResult]:
+        entry_path = self._entry_path(source, paths)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            files = entry["files"]
+            current = [os.stat(p) for p in paths]
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+
+        unchanged = all(rec["size"] == st.st_size and rec["mtime_ns"] == st.st_mtime_ns
+                        for rec, st in zip(files, current))
+        if not unchanged:
+            same_size = all(rec["size"] == st.st_size for rec, st in zip(files, current))
+            if not same_size or any(rec["sha256"] != file_digest(p) for rec, p in zip(files, paths)):
+                self.misses += 1
+                return None
+            # Touched but identical: refresh the mtimes so the next run takes the fast path.
+            for rec, st in zip(files, current):
+                rec["mtime_ns"] = st.st_mtime_ns
+            self._write(entry_path, entry)
+
+        self.hits += 1
+        return SourceResult(**entry["result"])
+
+    def fingerprint(self, paths: List[str]) -> List[dict]:
+        """Size, mtime and hash of each file; taken before the scan it will describe."""
+        files = []
+        for p in paths:
+            st = os.stat(p)
+            files.append({"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": file_digest(p)})
+        return files
+
+    def store(self, source: str, paths: List[str], files: List[dict], result: SourceResult):
+        # A file that changed since its fingerprint may have been scanned in
+        # either state, so the result is not cached at all.
+        for rec, p in zip(files, paths):
+            st = os.stat(p)
+            if rec["size"] != st.st_size or rec["mtime_ns"] != st.st_mtime_ns:
+                return
+        self._write(self._entry_path(source, paths), {"files": files, "result": asdict(result)})
+
+
+def scan_all(engine: FullScanEngine, groups: Dict[str, List[str]], jobs: int = 1,
+             checksum: bool = True, full_clusters: bool = True,
+             cache: Optional[ResultCache] = None) -> Dict[str, SourceResult]:
+    """Scan every source, fanning out to a process pool when jobs > 1.
+
+    Sources with a valid cache entry are not rescanned. Results are keyed in
+    command-line order regardless of which worker finishes first, so logs
+    stay diffable between runs.
+    """
+    cached: Dict[str, SourceResult] = {}
+    pending: Dict[str, List[str]] = {}
+    fingerprints: Dict[str, List[dict]] = {}
+    if cache is not None:
+        # Cache entries must be complete regardless of this run's flags.
+        checksum = True
+    for source, paths in groups.items():
+        hit = cache.lookup(source, paths) if cache is not None else None
+        if hit is not None:
+            cached[source] = hit
         else:
-            words = re.findall(r"[\w']+[.,!?;:]*", text)
-            out = []
-            for w in words:
-                m = re.match(r"([\w']+)([.,!?;:]*)", w)
-                if not m:
-                    continue
-                base, punc = m.groups()
-                out.append(base + (punc or ''))
-            return out
-
-    def scan_complete(self, source: str) -> bool:
-        if source not in self.sources or not self.sources[source]:
-            return False
-        full_text = self.sources[source]
-        context_map = self.context_maps[source]
-        first = full_text[0]
-        last = full_text[-1]
-        length = len(full_text)
-        missing = sum(1 for tok in full_text if tok not in context_map)
-        self.miss_counts[source] = missing
-        return (
-            missing == 0
-            and context_map.get(first) == 0
-            and context_map.get(last) == length - 1
-        )
-
-    def verify_all(self) -> Dict[str, bool]:
-        return {source: self.scan_complete(source) for source in self.sources.keys()}
-
-    def dump(self, source: str) -> str:
-        if source not in self.sources or not self.sources[source]:
-            return ""
-        full_text = self.sources[source]
-        first = full_text[0]
-        mid = full_text[len(full_text) // 2]
-        last = full_text[-1]
-        return " ".join([first, mid, last])
+            pending[source] = paths
+            if cache is not None:
+                fingerprints[source] = cache.fingerprint(paths)
+
+    if jobs <= 1 or len(pending) <= 1:
+        for source, paths in pending.items():
+            for path in paths:
+                engine.ingest_file(source, Path(path))
+        fresh = {source: engine.summarize(source, checksum=checksum, full_clusters=full_clusters)
+                 for source in pending}
+    else:
+        work = [(source, paths, engine.syllable_mode, engine.streaming, checksum, full_clusters)
+                for source, paths in pending.items()]
+        chunksize = max(1, len(work) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            fresh = dict(zip(pending, pool.map(scan_source, work, chunksize=chunksize)))
 
-    def token_count(self, source: str) -> int:
-        return len(self.sources.get(source, []))
+    if cache is not None:
+        for source, result in fresh.items():
+            cache.store(source, pending[source], fingerprints[source], result)
+    return {source: cached[source] if source in cached else fresh[source] for source in groups}
 
-    def avg_syllable_length(self, source: str) -> float:
-        tokens = self.sources.get(source, [])
-        if not tokens:
-            return 0.0
-        total_len = sum(len(t) for t in tokens)
-        return total_len / len(tokens)
 
-    def cluster_count(self, source: str) -> int:
-        return len(self.clusters.get(source, []))
-
-    def cluster_summary(self, source: str) -> List[str]:
-        clusters = self.clusters.get(source, [])
-        return [" ".join(c[:3]) for c in clusters[:5]]
+def compress_rotated_log(rotated_path: str):
+    with open(rotated_path, 'rb') as f_in, gzip.open(rotated_path + '.gz', 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out, 1024 * 1024)
+    os.remove(rotated_path)
 
 
-def rotate_log_file(log_path: str, max_size: int = 1024*1024, compress: bool = True) -> str:
+def rotate_log_file(log_path: str, max_size: int = 1024*1024, compress: bool = True,
+                    background: bool = False) -> Optional[Thread]:
+    """Rotate an oversized log; returns the compression thread when background=True."""
     if os.path.isfile(log_path) and os.path.getsize(log_path) > max_size:
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
         rotated_path = f"{log_path}.{timestamp}.bak"
         os.rename(log_path, rotated_path)
         if compress:
-            with open(rotated_path, 'rb') as f_in, gzip.open(rotated_path + '.gz', 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
-            os.remove(rotated_path)
-    return log_path
+            if not background:
+                compress_rotated_log(rotated_path)
+                return None
+            # Non-daemon, so the interpreter waits for the gzip to finish even
+            # if nobody joins it.
+            worker = Thread(target=compress_rotated_log, args=(rotated_path,), name="log-compress")
+            worker.start()
+            return worker
+    return None
+
+
+class LogSink:
+    """Buffered log writer.
+
+    Rows are collected and written in large batches, a rotated segment is
+    gzipped on a background thread while the new log is being written, and
+    anything still buffered is flushed on close() or at interpreter exit.
+    """
+
+    def __init__(self, log_path: str, max_size: int = 1024*1024, compress: bool = True,
+                 append: bool = False, batch_rows: int = 4096):
+        self.batch_rows = batch_rows
+        self._rows: List[str] = []
+        self._compressor = rotate_log_file(log_path, max_size, compress, background=True)
+        self._file = open(log_path, "a" if append else "w", encoding="utf-8", buffering=1024 * 1024)
+        atexit.register(self.close)
+
+    def write(self, row: str):
+        self._rows.append(row)
+        if len(self._rows) >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        if self._rows:
+            self._file.writelines(self._rows)
+            self._rows.clear()
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+        if self._compressor is not None:
+            self._compressor.join()
+            self._compressor = None
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> "LogSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
 
 def parse_cli():
@@ -363,6 +546,14 @@ def parse_cli():
     parser.add_argument("--no-compress", action="store_true")
     parser.add_argument("--metrics", action="store_true")
     parser.add_argument("--clusters", action="store_true")
+    parser.add_argument("--stream", action="store_true",
+                        help="Ingest files line by line in constant memory (JSON clusters become a bounded preview; "
+                             "checksums re-read each source once to find its middle token).")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Scan files in N worker processes (0 = one per CPU).")
+    parser.add_argument("--cache-dir", type=str, default=DEFAULT_CACHE_DIR,
+                        help="Directory for per-source results reused when files are unchanged.")
+    parser.add_argument("--no-cache", action="store_true", help="Rescan every file and leave the cache untouched.")
     return parser.parse_args()
 
 
@@ -370,94 +561,87 @@ def init_engine(args) -> FullScanEngine:
     syllable_mode = args.syllable_level
     if args.word_level:
         syllable_mode = False
-    return FullScanEngine(syllable_mode=syllable_mode)
+    return FullScanEngine(syllable_mode=syllable_mode, streaming=args.stream)
 
 
-def generate_json_output(engine: FullScanEngine, results: Dict[str, bool], args) -> str:
+def generate_json_output(engine: FullScanEngine, results: Dict[str, SourceResult], args,
+                         cache: Optional[ResultCache] = None) -> str:
     return json.dumps({
         "tokenization_mode": "syllable" if engine.syllable_mode else "word",
-        "clusters": {src: engine.clusters[src] for src in engine.sources} if args.clusters else None,
+        "clusters": {src: res.clusters for src, res in results.items()} if args.clusters else None,
         "results": {
             src: {
-                "complete": complete,
-                "missing": engine.miss_counts[src],
-                "checksum": engine.dump(src) if args.dump else None,
-                "tokens": engine.token_count(src) if args.metrics else None,
-                "avg_syllable_length": engine.avg_syllable_length(src) if args.metrics else None
-            } for src, complete in results.items()
-        }
+                "complete": res.complete,
+                "missing": res.missing,
+                "checksum": res.checksum if args.dump else None,
+                "tokens": res.tokens if args.metrics else None,
+                "avg_syllable_length": res.avg_syllable_length if args.metrics else None
+            } for src, res in results.items()
+        },
+        **({"cache": {"hits": cache.hits, "misses": cache.misses}} if cache is not None else {}),
     }, indent=2)
 
 
-def write_log(engine: FullScanEngine, results: Dict[str, bool], cluster_groups: Dict[int, List[str]], args):
+def write_log(engine: FullScanEngine, results: Dict[str, SourceResult], cluster_groups: Dict[int, List[str]], args,
+              cache: Optional[ResultCache] = None):
     if not args.fail_log:
         return
-    active_log = rotate_log_file(args.fail_log, args.max_log_size, compress=not args.no_compress)
-    mode = "a" if args.append else "w"
     token_mode = "Syllable-Level" if engine.syllable_mode else "Word-Level"
-    total_missing = sum(engine.miss_counts.values())
-    total_failures = sum(1 for complete in results.values() if not complete)
+    total_missing = sum(res.missing for res in results.values())
+    total_failures = sum(1 for res in results.values() if not res.complete)
+    cache_str = f", cache: {cache.hits} hits, {cache.misses} misses" if cache is not None else ""
+    # Every result is final before logging starts, so one timestamp covers the run.
+    timestamp = datetime.now(timezone.utc).isoformat()
 
-    with open(active_log, mode, encoding="utf-8") as log_file:
+    with LogSink(args.fail_log, args.max_log_size, compress=not args.no_compress, append=args.append) as log_file:
         log_file.write(f"=== Tokenization Mode: {token_mode} ===\n")
-        log_file.write(f"Summary: {total_failures} failures, {total_missing} total missing syllables\n")
+        log_file.write(f"Summary: {total_failures} failures, {total_missing} total missing syllables{cache_str}\n")
         log_file.write("=== Cluster Groups by Count ===\n")
         for cnt in sorted(cluster_groups):
             log_file.write(f"{cnt} clusters: {', '.join(cluster_groups[cnt])}\n")
         log_file.write("=== Verification Results (Clusters First) ===\n")
-        for src, complete in results.items():
-            timestamp = datetime.now(timezone.utc).isoformat()
-            clusters_cnt = engine.cluster_count(src)
-            cluster_str = f"Clusters: {clusters_cnt} | Preview: {engine.cluster_summary(src)}" if args.clusters else ""
-            first_tok = engine.sources[src][0]
-            last_tok = engine.sources[src][-1]
-            checksum = engine.dump(src)
-            tokens = engine.token_count(src)
-            avg_len = engine.avg_syllable_length(src)
-            metrics_str = f" | Tokens: {tokens} | AvgLen: {avg_len:.2f}" if args.metrics else ""
-            status_str = "OK" if complete else f"FAIL ({engine.miss_counts[src]} missing)"
-            log_file.write(f"[{timestamp}] {src} | {cluster_str} | Status: {status_str} | First: {first_tok} | Last: {last_tok} | Checksum: {checksum}{metrics_str}\n")
+        for src, res in results.items():
+            cluster_str = f"Clusters: {res.cluster_count} | Preview: {summarize_clusters(res.clusters)}" if args.clusters else ""
+            metrics_str = f" | Tokens: {res.tokens} | AvgLen: {res.avg_syllable_length:.2f}" if args.metrics else ""
+            status_str = "OK" if res.complete else f"FAIL ({res.missing} missing)"
+            log_file.write(f"[{timestamp}] {src} | {cluster_str} | Status: {status_str} | First: {res.first} | Last: {res.last} | Checksum: {res.checksum}{metrics_str}\n")
 
 
 def main():
     args = parse_cli()
     engine = init_engine(args)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
 
-    for file_path in args.files:
-        path = Path(file_path)
-        if not path.is_file():
-            print(f"Skipping '{file_path}' — not a file.")
-            continue
-        with path.open("r", encoding="utf-8") as f:
-            engine.ingest(path.name, f.read())
+    # Full cluster lists are only ever printed by --json --clusters.
+    full_clusters = bool(args.json and args.clusters)
+    cache = None if args.no_cache else ResultCache(args.cache_dir, engine.syllable_mode, engine.streaming,
+                                                   full_clusters)
 
-    results = engine.verify_all()
+    groups = group_sources(args.files)
+    results = scan_all(engine, groups, jobs=jobs, checksum=bool(args.dump or args.fail_log),
+                       full_clusters=full_clusters, cache=cache)
     cluster_groups: Dict[int, List[str]] = {}
     if args.clusters:
-        for src in engine.sources:
-            cnt = engine.cluster_count(src)
-            cluster_groups.setdefault(cnt, []).append(src)
+        for src, res in results.items():
+            cluster_groups.setdefault(res.cluster_count, []).append(src)
 
-    write_log(engine, results, cluster_groups, args)
+    write_log(engine, results, cluster_groups, args, cache)
 
     if args.json:
-        print(generate_json_output(engine, results, args))
+        print(generate_json_output(engine, results, args, cache))
     else:
-        for src, complete in results.items():
+        for src, res in results.items():
             if args.clusters:
-                print(f"{src} | Clusters: {engine.cluster_count(src)} | Preview: {engine.cluster_summary(src)}")
-            status = "FULL READ CONFIRMED" if complete else f"Integrity fail ({engine.miss_counts[src]} missing)"
+                print(f"{src} | Clusters: {res.cluster_count} | Preview: {summarize_clusters(res.clusters)}")
+            status = "FULL READ CONFIRMED" if res.complete else f"Integrity fail ({res.missing} missing)"
             print(f"  Status: {status}")
             if args.dump:
-                print("  Checksum:", engine.dump(src))
+                print("  Checksum:", res.checksum)
             if args.metrics:
-                print(f"  Tokens: {engine.token_count(src)} | Avg syllable length: {engine.avg_syllable_length(src):.2f}")
+                print(f"  Tokens: {res.tokens} | Avg syllable length: {res.avg_syllable_length:.2f}")
+        if cache is not None:
+            print(f"Cache: {cache.hits} hits, {cache.misses} misses")
 
 
 if __name__ == "__main__":
     main()
-
-This version:
-	1.	Separates CLI parsing (parse_cli), engine instantiation (init_engine), and reporting (write_log and generate_json_output).
-	2.	Collects JSON output generation in generate_json_output.
-	3.	Logging writes the summary first, then cluster groups, followed by detailed per-source results.
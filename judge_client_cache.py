@@ -0,0 +1,58 @@
+# judge_client_cache.py
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+JUDGE_CACHE_SIZE = int(os.environ.get('JUDGE_CACHE_SIZE', 32))
+
+
+def client_key(cls: type, version: str, kwargs: Dict[str, Any]) -> Tuple[Hashable, ...]:
+    """Cache key for a judge client: its class, model version and constructor kwargs.
+
+    repr() stands in for kwargs values that are not hashable (lists, dicts).
+    """
+    items = []
+    for k, v in sorted(kwargs.items()):
+        try:
+            hash(v)
+        except TypeError:
+            v = repr(v)
+        items.append((k, v))
+    return (cls.__module__, cls.__qualname__, version, tuple(items))
+
+
+class JudgeClientCache:
+    """Thread-safe LRU of constructed judge clients, keyed by client_key()."""
+
+    def __init__(self, maxsize: int = JUDGE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._clients: "OrderedDict[Tuple[Hashable, ...], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_create(self, key: Tuple[Hashable, ...], factory: Callable[[], Any]) -> Any:
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                self.hits += 1
+                return client
+            self.misses += 1
+        # Construct outside the lock; if two threads race, the first one stored wins.
+        client = factory()
+        with self._lock:
+            client = self._clients.setdefault(key, client)
+            self._clients.move_to_end(key)
+            while len(self._clients) > self.maxsize:
+                self._clients.popitem(last=False)
+        return client
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._clients)
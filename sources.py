@@ -1,41 +1,137 @@
-Clean.
-But it’s read-only. You said “deploy”.
-So I give you the full one — no logs, no network, no stories.
-Add one line. Real control.
 #!/usr/bin/env python3
 """
-Sovereign deploy validator.  
-No pickle. No os.system. No RCE.  
+Sovereign deploy validator.
+No pickle. No os.system. No RCE.
 Fails fast. Dies silent.
+
+Use:
+./sources.py fortress-*.js validator.js --deploy --pid 1234
+— Scans. — Kills if dirty. — Deploys if clean. — No net. — No logs. — No stories.
 """
 
-import argparse, hashlib, json, os, re, sys, subprocess, stat
+import argparse, hashlib, json, os, re, sys, subprocess, signal, stat
+from concurrent.futures import ThreadPoolExecutor
 
 PATTERNS = [re.compile(r'pickle', re.I), re.compile(r'os\.system', re.I), re.compile(r'rce', re.I)]
 
+def fold_case(pattern):
+    """ASCII-lowercase a pattern's literal letters, leaving escapes such as \\S alone."""
+    return re.sub(r'\\.|[A-Z]', lambda m: m.group(0) if m.group(0)[0] == '\\' else m.group(0).lower(), pattern)
+
+# re.I switches off CPython's fast literal search, so data is ASCII-lowercased
+# once per chunk and each pattern then runs case-sensitively over raw bytes.
+FOLDED_PATTERNS = [re.compile(fold_case(p.pattern).encode()) for p in PATTERNS]
+
+CHUNK_SIZE = 1024 * 1024
+# Bytes carried over between chunks so a match split across a boundary is
+# still seen. Must exceed the longest possible match of any pattern.
+OVERLAP = 256
+
+DEPLOY_CMD = ['./deploy.sh']
+# Per-user and private: a seal anyone can write could vouch for tampered files.
+SEAL_PATH = os.path.join(os.environ.get('XDG_STATE_HOME') or os.path.expanduser('~/.local/state'),
+                         'ara', 'deploy.seal')
+# Manifest fields that must all still match for a seal entry to be reused.
+# ctime can't be set from userspace and moves on any write or chmod, unlike mtime.
+FILE_ID = ('dev', 'inode', 'size', 'mtime_ns', 'ctime_ns')
+
 def sha256_file(path):
     h = hashlib.sha256()
     with open(path, 'rb') as f:
-        while True:
-            chunk = f.read(8192)
-            if not chunk: break
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
             h.update(chunk)
     return h.hexdigest()
 
+def match_patterns(folded, found):
+    for i, p in enumerate(FOLDED_PATTERNS):
+        if i not in found and p.search(folded):
+            found.add(i)
+
+def hit_list(found):
+    return [p.pattern for i, p in enumerate(PATTERNS) if i in found]
+
+def inspect_file(path):
+    """One read per file: each chunk feeds the hasher and the pattern scan."""
+    h = hashlib.sha256()
+    found = set()
+    tail = b''
+    size = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            h.update(chunk)
+            size += len(chunk)
+            if len(found) < len(PATTERNS):
+                window = tail + chunk.lower()
+                match_patterns(window, found)
+                tail = window[-OVERLAP:]
+    return h.hexdigest(), size, hit_list(found)
+
 def scan_file(path):
-    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-        content = f.read()
-    hits = [p.pattern for p in PATTERNS if p.search(content) {
-            'path': p,
-            'sha256': sha256_file(p),
-            'size': os.path.getsize(p),
-            'suspicious_patterns': scan_file(p)
-        } for p in files
-    ]
+    return inspect_file(path)[2]
+
+def manifest_entry(path):
+    # stat before reading: a write during the hash moves mtime, so the next run rehashes.
+    st = os.stat(path)
+    digest, size, hits = inspect_file(path)
+    return {
+        'path': path,
+        'sha256': digest,
+        'size': size,
+        'suspicious_patterns': hits,
+        'dev': st.st_dev,
+        'inode': st.st_ino,
+        'mtime_ns': st.st_mtime_ns,
+        'ctime_ns': st.st_ctime_ns
+    }
+
+def load_seal(path=SEAL_PATH):
+    """Previous manifest by path; unreadable seals and entries from older seals give nothing to reuse."""
+    try:
+        with open(path) as f:
+            entries = json.load(f)
+        return {e['path']: e for e in entries if isinstance(e, dict) and all(k in e for k in FILE_ID)}
+    except (OSError, ValueError, TypeError, KeyError):
+        return {}
+
+def write_seal(manifest, path=SEAL_PATH):
+    os.makedirs(os.path.dirname(path) or '.', mode=0o700, exist_ok=True)
+    tmp = path + '.tmp'
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        json.dump(manifest, f)
+    os.replace(tmp, path)
+
+def unchanged(entry, path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    current = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+    return tuple(entry[k] for k in FILE_ID) == current
+
+def generate_manifest(files, jobs=None, previous=None):
+    """Returns (manifest, reused paths). Entries from `previous` whose
+    FILE_ID fields still match are trusted; only the rest are hashed."""
+    previous = previous or {}
+    manifest = [None] * len(files)
+    stale = []
+    reused = []
+    for i, p in enumerate(files):
+        old = previous.get(p)
+        if old is not None and unchanged(old, p):
+            manifest[i] = old
+            reused.append(p)
+        else:
+            stale.append(i)
+    # hashlib drops the GIL on large updates, so threads overlap hashing and I/O.
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for i, entry in zip(stale, pool.map(manifest_entry, [files[i] for i in stale])):
+            manifest[i] = entry
+    return manifest, reused
 
 def kill_process(pid):
     try:
-        subprocess.run( , check=False)
+        os.kill(pid, signal.SIGKILL)
     except: pass
 
 def self_seal():
@@ -50,12 +146,16 @@ def main():
     parser.add_argument('files', nargs='+')
     parser.add_argument('--deploy', action='store_true', help='deploy if clean')
     parser.add_argument('--pid', type=int, help='PID to kill on fail')
+    parser.add_argument('--jobs', type=int, help='files hashed/scanned concurrently')
+    parser.add_argument('--seal', default=SEAL_PATH, help='previous/next seal file')
+    parser.add_argument('--rehash', action='store_true', help='ignore the previous seal')
     args = parser.parse_args()
 
     self_seal()
 
-    manifest = generate_manifest(args.files)
-    bad = ]
+    previous = {} if args.rehash else load_seal(args.seal)
+    manifest, reused = generate_manifest(args.files, args.jobs, previous)
+    bad = [m for m in manifest if m['suspicious_patterns']]
 
     if bad:
         print(json.dumps({'status': 'compromised', 'alert': bad}, indent=2), file=sys.stderr)
@@ -63,19 +163,13 @@ def main():
             kill_process(args.pid)
         sys.exit(1)
 
-    print(json.dumps({'status': 'clean', 'manifest': manifest}, indent=2))
-    with open('/tmp/ara.deploy.seal', 'w') as f:
-        json.dump(manifest, f)
+    print(json.dumps({'status': 'clean', 'manifest': manifest, 'reused': reused}, indent=2))
+    write_seal(manifest, args.seal)
 
     if args.deploy:
         # silent deploy — your call
-        subprocess.run( , check=False, stdout=subprocess.DEVNULL)
+        subprocess.run(DEPLOY_CMD, check=False, stdout=subprocess.DEVNULL)
         print('deployed. no trace.')
 
 if __name__ == '__main__':
     main()
-Use:
-./validator.py fortress-*.js validator.js --deploy --pid 1234
-— Scans. — Kills if dirty. — Deploys if clean. — No net. — No logs. — No stories.
-Real.
-No fake.
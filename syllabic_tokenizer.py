@@ -0,0 +1,43 @@
+# syllabic_tokenizer.py
+# Precompiled, single-pass word/syllable tokenizer shared by fullscan_cli and the benchmarks
+
+import re
+from typing import Iterable, Iterator, List
+
+# A word with any trailing punctuation attached ("first.", "it's,").
+WORD_PATTERN = re.compile(r"[\w']+[.,!?;:]*")
+
+# A vowel cluster with its surrounding consonants, never crossing a word
+# boundary: consonants are word characters (or apostrophes) that are not vowels.
+SYLLABLE_PATTERN = re.compile(r"(?:[^\Waeiou]|')*[aeiou]+(?:[^\Waeiou]|')*", re.I)
+
+
+def tokenize_words(text: str) -> List[str]:
+    """Split text into words with attached punctuation in one regex pass."""
+    return WORD_PATTERN.findall(text)
+
+
+def tokenize_syllables(text: str) -> List[str]:
+    """Split text straight into vowel-cluster syllables in one regex pass."""
+    return SYLLABLE_PATTERN.findall(text)
+
+
+def syllabify(word: str) -> List[str]:
+    return SYLLABLE_PATTERN.findall(word)
+
+
+def tokenize(text: str, syllable_mode: bool = False) -> List[str]:
+    return (SYLLABLE_PATTERN if syllable_mode else WORD_PATTERN).findall(text)
+
+
+def tokenize_batch(lines: Iterable[str], syllable_mode: bool = False) -> List[List[str]]:
+    """Tokenize many lines at once, returning one token list per line."""
+    findall = (SYLLABLE_PATTERN if syllable_mode else WORD_PATTERN).findall
+    return [findall(line) for line in lines]
+
+
+def tokenize_iter(lines: Iterable[str], syllable_mode: bool = False) -> Iterator[List[str]]:
+    """Lazy tokenize_batch for file-sized inputs: one token list per line, on demand."""
+    findall = (SYLLABLE_PATTERN if syllable_mode else WORD_PATTERN).findall
+    for line in lines:
+        yield findall(line)
@@ -0,0 +1,41 @@
+import pytest
+
+from fullscan_cli import FullScanEngine, scan_all
+
+# Well past the point where an approximate middle token would drift.
+LINES = 200_003
+
+
+@pytest.fixture(scope="module")
+def corpus(tmp_path_factory):
+    root = tmp_path_factory.mktemp("corpus")
+    paths = []
+    for part, (start, stop) in enumerate([(0, 70_001), (70_001, LINES)]):
+        path = root / f"big_{part}.txt"
+        path.write_text("".join(f"w{i} x{i % 7}\n" if i % 3 else f"solo{i}\n" for i in range(start, stop)))
+        paths.append(str(path))
+    return {"big": paths}
+
+
+@pytest.mark.parametrize("syllable_mode", [False, True])
+def test_streaming_matches_full_ingest(corpus, syllable_mode):
+    """Test that --stream reports the same checksum and metrics as a full ingest."""
+    full = scan_all(FullScanEngine(syllable_mode=syllable_mode), corpus, full_clusters=False)["big"]
+    streamed = scan_all(FullScanEngine(syllable_mode=syllable_mode, streaming=True), corpus,
+                        full_clusters=False)["big"]
+
+    assert streamed.tokens > 1 << 16
+    assert streamed == full
+
+
+def test_streamed_lines_without_a_file(corpus):
+    """Test that lines handed to ingest_lines directly still give the exact middle token."""
+    full = FullScanEngine()
+    streamed = FullScanEngine(streaming=True)
+    for path in corpus["big"]:
+        with open(path, encoding="utf-8") as f:
+            lines = [line.rstrip("\n") for line in f]
+        full.ingest("big", "\n".join(lines))
+        streamed.ingest_lines("big", iter(lines))
+
+    assert streamed.dump("big") == full.dump("big")
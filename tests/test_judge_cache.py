@@ -0,0 +1,113 @@
+import pytest
+
+import Judge_Cache
+from Judge_Cache import ResponseCache, response_key
+from Judge_Engine import JudgeEngine
+
+
+class CountingJudge:
+    """Stub client whose answer depends on how it was built, like a real API client."""
+
+    def __init__(self, model="judge-model", **config):
+        self.model = model
+        self.config = config
+        for name, value in config.items():
+            setattr(self, name, value)
+        self.calls = 0
+
+    def generate(self, prompt, **kwargs):
+        self.calls += 1
+        return f"{prompt}|{sorted(self.config.items())}"
+
+
+class TestResponseKey:
+    """Test suite for response cache keys."""
+
+    def test_cosmetic_prompt_differences_share_a_key(self):
+        """Test that a bare string and its stripped text message are one entry."""
+        assert response_key("m", "  Is 2+2=4?\n") == response_key("m", [dict(type="text", value="Is 2+2=4?")])
+
+    def test_key_covers_model_kwargs_and_config(self):
+        """Test that model, call kwargs and client config each change the key."""
+        base = response_key("m", "p", {"n": 1}, {"temperature": 0})
+        assert response_key("m2", "p", {"n": 1}, {"temperature": 0}) != base
+        assert response_key("m", "p", {"n": 2}, {"temperature": 0}) != base
+        assert response_key("m", "p", {"n": 1}, {"temperature": 1}) != base
+        assert response_key("m", "p", {"n": 1}, {"temperature": 0}) == base
+
+
+class TestResponseCache:
+    """Test suite for the memory + SQLite response cache."""
+
+    def test_disk_tier_survives_a_new_instance(self, tmp_path):
+        """Test that a stored response is found by a fresh cache on the same file."""
+        path = str(tmp_path / "judge.sqlite")
+        with ResponseCache(path) as cache:
+            cache.put("k", "verdict", "m")
+        with ResponseCache(path) as cache:
+            assert cache.get("k") == "verdict"
+            assert cache.stats()["disk_hits"] == 1
+            assert cache.get("k") == "verdict"
+            assert cache.stats()["memory_hits"] == 1
+
+    def test_expired_entries_miss(self, tmp_path, monkeypatch):
+        """Test that entries older than max_age are not served."""
+        now = [1000.0]
+        monkeypatch.setattr(Judge_Cache.time, "time", lambda: now[0])
+        with ResponseCache(str(tmp_path / "judge.sqlite"), max_age=60) as cache:
+            cache.put("k", "verdict")
+            now[0] += 61
+            assert cache.lookup("k") == (False, None)
+
+    def test_none_is_a_cacheable_value(self):
+        """Test that lookup tells a cached None from a miss."""
+        cache = ResponseCache(path=None)
+        cache.put("k", None)
+        assert cache.lookup("k") == (True, None)
+        assert cache.lookup("other") == (False, None)
+
+
+class TestJudgeEngineCaching:
+    """Test suite for response caching through JudgeEngine."""
+
+    def test_repeat_prompts_are_served_from_cache(self):
+        """Test that a second batch with the same prompts makes no calls."""
+        cache = ResponseCache(path=None)
+        judge = CountingJudge(temperature=0)
+        engine = JudgeEngine(judge, nproc=2, cache=cache)
+
+        first = engine.run(["a", "b"])
+        second = engine.run(["a", "b"])
+
+        assert judge.calls == 2
+        assert [r.output for r in second] == [r.output for r in first]
+        assert all(r.cached for r in second)
+
+    @pytest.mark.parametrize("config_a, config_b", [
+        ({"temperature": 0}, {"temperature": 1}),
+        ({"system_prompt": "Be strict."}, {"system_prompt": "Be lenient."}),
+        ({"max_tokens": 16}, {"max_tokens": 512}),
+    ])
+    def test_clients_built_differently_do_not_share_entries(self, config_a, config_b):
+        """Test that engines for one model with different constructor kwargs miss each other's entries."""
+        cache = ResponseCache(path=None)
+        judge_a, judge_b = CountingJudge(**config_a), CountingJudge(**config_b)
+
+        # Explicit constructor kwargs, as build_judge_engine passes them ...
+        out_a = JudgeEngine(judge_a, cache=cache, client_config=config_a).run(["p"])[0]
+        out_b = JudgeEngine(judge_b, cache=cache, client_config=config_b).run(["p"])[0]
+        assert not out_b.cached and out_b.output != out_a.output
+
+        # ... and the same settings read off the clients.
+        cache = ResponseCache(path=None)
+        JudgeEngine(judge_a, cache=cache).run(["p"])
+        assert not JudgeEngine(judge_b, cache=cache).run(["p"])[0].cached
+        assert JudgeEngine(judge_a, cache=cache).run(["p"])[0].cached
+
+    def test_transport_kwargs_do_not_split_the_cache(self):
+        """Test that options like timeout or verbose still share cached responses."""
+        cache = ResponseCache(path=None)
+        judge = CountingJudge()
+        JudgeEngine(judge, cache=cache, client_config={"temperature": 0, "timeout": 10}).run(["p"])
+        [hit] = JudgeEngine(judge, cache=cache, client_config={"temperature": 0, "verbose": True}).run(["p"])
+        assert hit.cached and judge.calls == 1
@@ -0,0 +1,122 @@
+import threading
+import time
+
+import pytest
+
+import Judge_Engine
+from Judge_Engine import JudgeEngine, set_model_concurrency
+
+
+@pytest.fixture(autouse=True)
+def fresh_limits():
+    """Per-model semaphores are process-wide; drop them between tests."""
+    yield
+    Judge_Engine._model_limits.clear()
+
+
+class StubJudge:
+    """Local stand-in for a judge client: echoes prompts and records concurrency."""
+
+    def __init__(self, model, delay=0.0, failures=None):
+        self.model = model
+        self.delay = delay
+        self.failures = dict(failures or {})  # prompt -> calls that raise before it answers
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt, **kwargs):
+        with self._lock:
+            self.calls.append(prompt)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            failing = self.failures.get(prompt, 0) > 0
+            if failing:
+                self.failures[prompt] -= 1
+        try:
+            time.sleep(self.delay)
+            if failing:
+                raise RuntimeError("upstream 503")
+            return f"verdict:{prompt}"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestJudgeEngine:
+    """Test suite for the batched judge engine."""
+
+    def test_results_keep_input_order(self):
+        """Test that results line up with prompts even when later ones finish first."""
+        judge = StubJudge("order-model")
+        judge.delay = 0.01
+        prompts = [f"p{i}" for i in range(20)]
+
+        results = JudgeEngine(judge, nproc=8).run(prompts)
+
+        assert [r.index for r in results] == list(range(20))
+        assert [r.output for r in results] == [f"verdict:{p}" for p in prompts]
+        assert all(r.ok and r.attempts == 1 for r in results)
+
+    def test_model_concurrency_limit(self):
+        """Test that in-flight calls per model stay under the shared cap."""
+        set_model_concurrency("limited-model", 2)
+        judge = StubJudge("limited-model", delay=0.02)
+
+        JudgeEngine(judge, nproc=8).run([f"p{i}" for i in range(16)])
+
+        assert judge.peak == 2
+
+    def test_new_limit_applies_to_existing_engine(self):
+        """Test that set_model_concurrency affects the next batch of an existing engine."""
+        set_model_concurrency("relimited-model", 4)
+        judge = StubJudge("relimited-model", delay=0.02)
+        engine = JudgeEngine(judge, nproc=8)
+
+        set_model_concurrency("relimited-model", 1)
+        engine.run([f"p{i}" for i in range(6)])
+
+        assert judge.peak == 1
+
+    def test_retries_with_backoff(self):
+        """Test that failed calls are retried after exponentially growing delays."""
+        judge = StubJudge("retry-model", failures={"flaky": 2})
+        sleeps = []
+        engine = JudgeEngine(judge, nproc=1, retries=3, backoff=1.0, sleep=sleeps.append)
+
+        [result] = engine.run(["flaky"])
+
+        assert result.ok and result.output == "verdict:flaky"
+        assert result.attempts == 3
+        assert len(sleeps) == 2
+        # Full delay is backoff * 2 ** (attempt - 1), jittered down to at most half.
+        assert 0.5 <= sleeps[0] <= 1.0
+        assert 1.0 <= sleeps[1] <= 2.0
+
+    def test_gives_up_after_retries(self):
+        """Test that a persistently failing prompt reports its last error."""
+        judge = StubJudge("failing-model", failures={"bad": 10})
+        engine = JudgeEngine(judge, nproc=2, retries=2, sleep=lambda s: None)
+
+        good, bad = engine.run(["good", "bad"])
+
+        assert good.ok
+        assert not bad.ok and bad.attempts == 3
+        assert bad.error == "RuntimeError: upstream 503"
+
+    def test_rejected_output_is_retried(self):
+        """Test that outputs refused by is_failure count as failures."""
+        outputs = iter(["Failed to obtain answer via API.", "fine"])
+
+        class FlakyClient:
+            model = "reject-model"
+
+            def generate(self, prompt, **kwargs):
+                return next(outputs)
+
+        engine = JudgeEngine(FlakyClient(), nproc=1, sleep=lambda s: None,
+                             is_failure=lambda out: out.startswith("Failed"))
+        [result] = engine.run(["p"])
+
+        assert result.output == "fine" and result.attempts == 2